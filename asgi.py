@@ -0,0 +1,4 @@
+from backend.app.asgi import create_asgi_app
+from backend.config import Config
+
+app = create_asgi_app(Config)
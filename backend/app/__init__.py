@@ -1,6 +1,7 @@
-from flask import Flask
+from flask import Flask, jsonify, request
 from backend.config import Config
 import os
+import time
 
 
 def create_app(config_class=Config):
@@ -12,6 +13,130 @@ def create_app(config_class=Config):
     app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
     app.config.from_object(config_class)
     
+    from backend.app.sessions import LazySessionInterface
+    app.session_interface = LazySessionInterface()
+    
+    # Publish currency rates through shared memory so forked workers read one copy
+    if app.config['SHARED_RATES'] and not app.config['PRELOAD_APP']:
+        # Workers that build their own app would each create and own a table
+        app.logger.warning('SHARED_RATES needs PRELOAD_APP; each process keeps its own currency rates')
+    elif app.config['SHARED_RATES']:
+        from backend.utils.converters import rate_cache
+        from backend.utils.shared_rates import SharedRateTable
+        if not rate_cache.shared:
+            table = SharedRateTable.create()
+            if table is not None:
+                rate_cache.share(table)
+            else:
+                app.logger.warning('Shared memory is unavailable; each process keeps its own currency rates')
+    
+    # Load currency rates from a file when configured and keep them fresh
+    if app.config['CURRENCY_RATES_FILE']:
+        from backend.utils.converters import rate_cache
+        from backend.utils.rates import FileRateProvider
+        rate_cache.start(FileRateProvider(app.config['CURRENCY_RATES_FILE']),
+                         app.config['CURRENCY_RATES_TTL'])
+    
+    # Memory-map historical rates for as-of currency conversions
+    if app.config['CURRENCY_HISTORY_DIR']:
+        from backend.utils.history import HistoricalRateStore
+        app.extensions['rate_history'] = HistoricalRateStore(app.config['CURRENCY_HISTORY_DIR'])
+    
+    # Cache serialized conversion responses; a size of 0 disables it
+    if app.config['RESULT_CACHE_SIZE'] > 0:
+        from backend.utils.cache import LRUCache
+        app.extensions['result_cache'] = LRUCache(app.config['RESULT_CACHE_SIZE'],
+                                                  app.config['RESULT_CACHE_TTL'])
+    
+    # Count requests and time them for /metrics
+    if app.config['METRICS_ENABLED']:
+        from backend.utils.metrics import Metrics
+        metrics = app.extensions['metrics'] = Metrics()
+        
+        @app.before_request
+        def start_timer():
+            request.environ['converter.started'] = time.perf_counter()
+        
+        @app.after_request
+        def record_request(response):
+            started = request.environ.get('converter.started')
+            if started is not None:
+                endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+                metrics.observe_request(endpoint, request.method, response.status_code,
+                                        time.perf_counter() - started)
+            return response
+    
+    # Profile a sampled fraction of requests; the rate can change at runtime
+    if app.config['PROFILE_DIR']:
+        from backend.utils.profiler import RequestProfiler
+        profiler = app.extensions['profiler'] = RequestProfiler(
+            app.config['PROFILE_DIR'], app.config['PROFILE_SAMPLE_RATE'], app.config['PROFILE_MODE'])
+        
+        @app.before_request
+        def start_profile():
+            if profiler.sample_rate:
+                request.environ['converter.profile'] = profiler.start()
+        
+        @app.teardown_request
+        def stop_profile(exc):
+            token = request.environ.pop('converter.profile', None)
+            if token is not None:
+                profiler.stop(token, request.url_rule.rule if request.url_rule else 'unmatched')
+    
+    # Count requests in progress (including any waiting for admission) for /ready
+    from backend.server import worker_threads
+    from backend.utils.admission import EXEMPT_PATHS, RequestGauge
+    in_flight = app.extensions['in_flight'] = RequestGauge(worker_threads(config_class))
+    
+    @app.before_request
+    def enter_request():
+        if request.path not in EXEMPT_PATHS:
+            request.environ['converter.in_flight'] = True
+            in_flight.enter()
+    
+    @app.teardown_request
+    def exit_request(exc):
+        if request.environ.pop('converter.in_flight', False):
+            in_flight.exit()
+    
+    # Shed load with fast 429/503 responses instead of queueing without limit
+    if app.config['RATE_LIMIT'] > 0 or app.config['MAX_CONCURRENT_REQUESTS'] > 0:
+        from backend.utils.admission import AdmissionController, ConcurrencyLimiter, RateLimiter
+        admission = app.extensions['admission'] = AdmissionController(
+            RateLimiter(app.config['RATE_LIMIT'], app.config['RATE_LIMIT_BURST'])
+            if app.config['RATE_LIMIT'] > 0 else None,
+            ConcurrencyLimiter(app.config['MAX_CONCURRENT_REQUESTS'], app.config['ADMISSION_QUEUE_SIZE'],
+                               app.config['ADMISSION_QUEUE_TIMEOUT'])
+            if app.config['MAX_CONCURRENT_REQUESTS'] > 0 else None)
+        
+        @app.before_request
+        def admit_request():
+            if request.path in EXEMPT_PATHS:
+                return None
+            # Requests the ASGI adapter runs on its event loop must not wait for a slot
+            block = not request.environ.get('converter.inline', False)
+            outcome, retry_after = admission.admit(request.remote_addr, block)
+            if outcome == 'admitted':
+                request.environ['converter.admitted'] = True
+                return None
+            response = jsonify({
+                'success': False,
+                'error': 'Rate limit exceeded' if outcome == 'rate_limited' else 'Server is overloaded'
+            })
+            response.status_code = 429 if outcome == 'rate_limited' else 503
+            response.headers['Retry-After'] = str(retry_after)
+            return response
+        
+        @app.teardown_request
+        def release_request(exc):
+            if request.environ.pop('converter.admitted', False):
+                admission.release()
+    
+    # Serve static files under content-hashed names from memory
+    if app.config['ASSETS_PRECOMPRESS']:
+        from backend.utils.assets import AssetBundle
+        app.extensions['assets'] = AssetBundle(static_dir).build()
+    
     # Register blueprints
     from backend.app.routes import bp as main_bp
     app.register_blueprint(main_bp)
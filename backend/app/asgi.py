@@ -0,0 +1,162 @@
+"""
+ASGI adapter that serves the Flask application from an event loop
+"""
+import asyncio
+import contextvars
+import sys
+import tempfile
+
+from backend.app import create_app
+from backend.config import Config
+
+
+# Routes whose work can be CPU-heavy even with a small body (big numbers)
+OFFLOAD_PATHS = ('/api/convert/number-base', '/api/convert/batch')
+
+
+class AsgiApp:
+    """ASGI application wrapping a WSGI app.
+
+    Conversions are CPU-trivial, so small requests run the WSGI app inline
+    on the event loop; the ASGI server keeps thousands of idle keep-alive
+    connections open without a thread each. Requests with large bodies
+    (uploads, streaming conversions) run in the default executor instead
+    so they never stall the loop, as do routes under offload_paths whose
+    work is CPU-heavy whatever the body size. Inline requests are marked with
+    environ['converter.inline'], so admission control refuses them rather
+    than blocking the loop while they wait for a slot.
+
+    Each request runs its WSGI call and every step of its response iterator
+    in one contextvars.Context, so a stream_with_context() generator finds
+    the Flask request context even when its steps run on different executor
+    threads.
+    """
+
+    def __init__(self, wsgi_app, inline_body_bytes=64 * 1024, spool_bytes=1024 * 1024,
+                 offload_paths=OFFLOAD_PATHS, executor=None):
+        self.wsgi_app = wsgi_app
+        self.inline_body_bytes = inline_body_bytes
+        self.spool_bytes = spool_bytes
+        self.offload_paths = tuple(offload_paths)
+        # None is the event loop's default executor
+        self.executor = executor
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        body = tempfile.SpooledTemporaryFile(max_size=self.spool_bytes)
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                body.close()
+                return
+            chunk = message.get('body', b'')
+            body.write(chunk)
+            size += len(chunk)
+            if not message.get('more_body'):
+                break
+        body.seek(0)
+
+        loop = asyncio.get_running_loop()
+        offload = size > self.inline_body_bytes or scope['path'].startswith(self.offload_paths)
+        context = contextvars.copy_context()
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in headers
+            ]
+            return lambda data: None
+
+        environ = self._environ(scope, body, size)
+        environ['converter.inline'] = not offload
+        try:
+            result = await self._run(context, loop, offload, self.wsgi_app, environ, start_response)
+            try:
+                await self._send_body(result, response, send, context, loop, offload)
+            finally:
+                if hasattr(result, 'close'):
+                    await self._run(context, loop, offload, result.close)
+        finally:
+            body.close()
+
+    async def _run(self, context, loop, offload, func, *args):
+        """Call func inside the request's context, on an executor thread if offloaded"""
+        if offload:
+            return await loop.run_in_executor(self.executor, context.run, func, *args)
+        return context.run(func, *args)
+
+    async def _send_body(self, result, response, send, context, loop, offload):
+        iterator = iter(result)
+        started = False
+        while True:
+            chunk = await self._run(context, loop, offload, next, iterator, None)
+            if chunk is None:
+                break
+            if not chunk:
+                continue
+            if not started:
+                await send({'type': 'http.response.start', 'status': response['status'],
+                            'headers': response['headers']})
+                started = True
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+
+        if not started:
+            await send({'type': 'http.response.start', 'status': response['status'],
+                        'headers': response['headers']})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    @staticmethod
+    def _environ(scope, body, size):
+        server = scope.get('server') or ('localhost', 80)
+        client = scope.get('client') or ('', 0)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+            'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server[0],
+            'SERVER_PORT': str(server[1]),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'REMOTE_ADDR': client[0],
+            'REMOTE_PORT': str(client[1]),
+            'CONTENT_LENGTH': str(size),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': body,
+            'wsgi.input_terminated': True,
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in scope.get('headers', []):
+            name = name.decode('latin-1').upper().replace('-', '_')
+            value = value.decode('latin-1')
+            if name == 'CONTENT_TYPE':
+                environ['CONTENT_TYPE'] = value
+            elif name != 'CONTENT_LENGTH':
+                key = f"HTTP_{name}"
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+
+def create_asgi_app(config_class=Config):
+    """Create the Flask app and wrap it for ASGI servers"""
+    return AsgiApp(create_app(config_class))
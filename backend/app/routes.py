@@ -1,16 +1,120 @@
-from flask import Blueprint, render_template, jsonify, request
+import csv
+import hashlib
+import hmac
+import io
+import json
+import math
+import os
+import tempfile
+import time
+from array import array
+from functools import lru_cache, wraps
+
+from flask import (
+    Blueprint, Response, render_template, jsonify, request, current_app,
+    stream_with_context, url_for, abort
+)
+from backend.utils import wire
+from backend.utils.admission import EXEMPT_PATHS
 from backend.utils.converters import (
     LengthConverter, WeightConverter, TemperatureConverter,
-    VolumeConverter, CurrencyConverter, NumberBaseConverter
+    VolumeConverter, CurrencyConverter, NumberBaseConverter, CompoundConverter, rate_cache, registry
 )
 
 bp = Blueprint('main', __name__)
 
+# Larger request bodies (e.g. big number-base inputs) are never cached
+CACHEABLE_BODY_BYTES = 4096
+
+
+def admin_required(view):
+    """Allow the request only with the configured X-Admin-Token header"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = current_app.config.get('ADMIN_TOKEN')
+        if not token:
+            return jsonify({
+                'success': False,
+                'error': 'Admin endpoints are disabled'
+            }), 403
+        if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), token):
+            return jsonify({
+                'success': False,
+                'error': 'Invalid admin token'
+            }), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def _count_conversion(category, count=1):
+    metrics = current_app.extensions.get('metrics')
+    if metrics is not None:
+        metrics.count_conversion(category, count)
+
+
+# Converter and request keys for each category, as used by the bulk endpoints
+CONVERTERS = {
+    'length': (LengthConverter, 'from_unit', 'to_unit'),
+    'weight': (WeightConverter, 'from_unit', 'to_unit'),
+    'temperature': (TemperatureConverter, 'from_unit', 'to_unit'),
+    'volume': (VolumeConverter, 'from_unit', 'to_unit'),
+    'currency': (CurrencyConverter, 'from_currency', 'to_currency'),
+    'number-base': (NumberBaseConverter, 'from_base', 'to_base'),
+    'compound': (CompoundConverter, 'from_unit', 'to_unit'),
+}
+
+
+# Hashed asset names change with their content, so they can be cached forever
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@bp.app_template_global()
+def asset_url(filename):
+    """URL of a static file, fingerprinted when the asset bundle is enabled"""
+    assets = current_app.extensions.get('assets')
+    hashed_name = assets.url_name(filename) if assets is not None else None
+    if hashed_name is None:
+        return url_for('static', filename=filename)
+    return url_for('main.asset', filename=hashed_name)
+
+
+@bp.route('/assets/<path:filename>')
+def asset(filename):
+    """Serve a fingerprinted static file, precompressed when the client accepts it"""
+    assets = current_app.extensions.get('assets')
+    item = assets.get(filename) if assets is not None else None
+    if item is None:
+        abort(404)
+
+    encoding, data, etag = item.negotiate(request.headers.get('Accept-Encoding', ''))
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(data, mimetype=item.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = ASSET_CACHE_CONTROL
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
 
 @bp.route('/')
 def index():
-    """Home page with converter interface"""
-    return render_template('index.html')
+    """Home page with converter interface, rendered once per app and revalidated with an ETag"""
+    page = current_app.extensions.get('index_page')
+    if page is None:
+        body = render_template('index.html').encode()
+        page = (body, hashlib.sha256(body).hexdigest()[:16])
+        # Keep re-rendering while templates are being edited
+        if not current_app.jinja_env.auto_reload:
+            current_app.extensions['index_page'] = page
+    
+    body, etag = page
+    response = current_app.response_class(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 
 @bp.route('/health')
@@ -22,6 +126,65 @@ def health():
     }), 200
 
 
+@bp.route('/ready')
+def ready():
+    """Readiness check: 503 while the instance is saturated, so traffic moves elsewhere.
+
+    utilization is requests in progress per worker thread of this process.
+    queue_depth comes from the admission controller's concurrency limiter
+    and p99_seconds from the metrics latency histogram. A check whose source
+    is turned off, or whose threshold is 0 or less, is listed under skipped
+    with the reason rather than passing silently.
+    """
+    config = current_app.config
+    admission = current_app.extensions.get('admission')
+    metrics = current_app.extensions.get('metrics')
+    gauge = current_app.extensions['in_flight']
+    in_flight = gauge.value
+    utilization = round(in_flight / gauge.threads, 3)
+
+    queue_depth = p99 = None
+    skipped = {}
+    if admission is not None and admission.concurrency is not None:
+        stats = admission.stats()
+        queue_depth = stats['waiting'] + stats['backlog']
+    else:
+        skipped['queue_depth'] = 'MAX_CONCURRENT_REQUESTS is 0, so there is no admission queue'
+    if metrics is not None:
+        p99 = metrics.recent_latency_quantile(0.99, config['READY_LATENCY_WINDOW'], EXEMPT_PATHS)
+    else:
+        skipped['p99_seconds'] = 'METRICS_ENABLED is off'
+
+    checks = (
+        ('queue_depth', queue_depth, config['READY_MAX_QUEUE_DEPTH']),
+        ('utilization', utilization, config['READY_MAX_UTILIZATION']),
+        ('p99_seconds', p99, config['READY_MAX_P99_SECONDS']),
+    )
+    reasons = []
+    for name, value, threshold in checks:
+        if name in skipped:
+            continue
+        if threshold <= 0:
+            skipped[name] = 'threshold is 0'
+        elif value is not None and value > threshold:
+            reasons.append(f"{name} {value} > {threshold}")
+
+    response = jsonify({
+        'status': 'not ready' if reasons else 'ready',
+        'reasons': reasons,
+        'skipped': skipped,
+        'in_flight': in_flight,
+        'worker_threads': gauge.threads,
+        'queue_depth': queue_depth,
+        'utilization': utilization,
+        'p99_seconds': p99 if p99 is None or math.isfinite(p99) else '+Inf',
+        'thresholds': {name: threshold for name, _, threshold in checks}
+    })
+    response.status_code = 503 if reasons else 200
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
 @bp.route('/api/info')
 def info():
     """API info endpoint"""
@@ -35,157 +198,634 @@ def info():
             'Temperature Converter',
             'Volume Converter',
             'Currency Converter',
-            'Number Base Converter'
+            'Number Base Converter',
+            'Compound Unit Converter'
         ]
     })
 
 
-@bp.route('/api/convert/length', methods=['POST'])
-def convert_length():
-    """Convert length units"""
+class ConversionRoute:
+    """Precompiled request handling for one category of /api/convert/<category>.
+
+    Reads the category's own request keys, coerces the value and writes the
+    response JSON straight to bytes. The output is byte-for-byte what
+    jsonify() produced for the per-category handlers (sorted keys, ASCII).
+    """
+
+    __slots__ = ('category', 'convert', 'from_key', 'to_key', 'parse_value', 'default_value',
+                 'labels', 'rates_versioned')
+
+    def __init__(self, category, converter, from_key, to_key, parse_value=float,
+                 labels=None, rates_versioned=False):
+        self.category = category
+        self.convert = converter.convert
+        self.from_key = from_key
+        self.to_key = to_key
+        self.parse_value = parse_value
+        self.default_value = 0 if parse_value is float else ''
+        self.labels = labels or _unit_labels
+        self.rates_versioned = rates_versioned
+
+    def respond(self, data, snapshot=None):
+        """Run the conversion for a parsed request body and return the JSON bytes"""
+        value = self.parse_value(data.get('value', self.default_value))
+        from_unit = data.get(self.from_key)
+        to_unit = data.get(self.to_key)
+
+        if not self.rates_versioned:
+            result = self.convert(value, from_unit, to_unit)
+            extra = ''
+        elif data.get('as_of') is not None:
+            as_of = data['as_of']
+            result = _convert_currency_as_of(value, from_unit, to_unit, as_of)
+            extra = None
+        else:
+            result = self.convert(value, from_unit, to_unit, snapshot)
+            extra = f',"rates_age":{_rates_age(snapshot)},"rates_version":{snapshot.version}'
+
+        label_from, label_to = self.labels(value, from_unit, to_unit, result)
+        if extra is None:
+            # Sorted keys put as_of first
+            return (f'{{"as_of":{json.dumps(as_of, separators=(",", ":"), sort_keys=True)},"from":{_json_string(label_from)},'
+                    f'"result":{_json_value(result)},"success":true,"to":{_json_string(label_to)}}}\n'
+                    ).encode()
+        return (f'{{"from":{_json_string(label_from)}{extra},"result":{_json_value(result)},'
+                f'"success":true,"to":{_json_string(label_to)}}}\n').encode()
+
+
+# Same escaping as jsonify(), which keeps the default ensure_ascii=True
+_json_string = json.encoder.encode_basestring_ascii
+
+
+def _json_number(value):
+    return float.__repr__(value) if math.isfinite(value) else json.dumps(value)
+
+
+def _json_value(value):
+    return _json_string(value) if isinstance(value, str) else _json_number(value)
+
+
+def _rates_age(snapshot):
+    return _json_number(round(snapshot.age, 3))
+
+
+def _with_rates_age(payload, snapshot):
+    """Replace the rates_age of a cached currency body with the current age"""
+    # Strings are escaped, so '"rates_age":' can only be the key itself
+    head, key, rest = payload.partition(b'"rates_age":')
+    if not key:
+        return payload
+    return head + key + _rates_age(snapshot).encode() + rest[rest.index(b','):]
+
+
+def _json_error(message, status=400):
+    body = f'{{"error":{_json_string(message)},"success":false}}\n'.encode()
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def _strip(value):
+    if not isinstance(value, str):
+        raise TypeError(f"Invalid value: {value} (number base values must be strings)")
+    return value.strip()
+
+
+def _unit_labels(value, from_unit, to_unit, result):
+    return f"{value} {from_unit}", f"{result} {to_unit}"
+
+
+def _temperature_labels(value, from_unit, to_unit, result):
+    return f"{value}° {from_unit.capitalize()[0]}", f"{result}° {to_unit.capitalize()[0]}"
+
+
+def _number_base_labels(value, from_base, to_base, result):
+    return f"{value} ({from_base})", f"{result} ({to_base})"
+
+
+CONVERSION_ROUTES = {
+    'length': ConversionRoute('length', LengthConverter, 'from_unit', 'to_unit'),
+    'weight': ConversionRoute('weight', WeightConverter, 'from_unit', 'to_unit'),
+    'temperature': ConversionRoute('temperature', TemperatureConverter, 'from_unit', 'to_unit',
+                                   labels=_temperature_labels),
+    'volume': ConversionRoute('volume', VolumeConverter, 'from_unit', 'to_unit'),
+    'currency': ConversionRoute('currency', CurrencyConverter, 'from_currency', 'to_currency',
+                                rates_versioned=True),
+    'number-base': ConversionRoute('number-base', NumberBaseConverter, 'from_base', 'to_base',
+                                   parse_value=_strip, labels=_number_base_labels),
+    'compound': ConversionRoute('compound', CompoundConverter, 'from_unit', 'to_unit'),
+}
+
+
+@bp.route('/api/convert/<category>', methods=['POST'])
+def convert(category):
+    """Convert a single value of any category.
+
+    Repeated requests are served from the app's result cache, keyed on the
+    path and raw body, so a hit skips parsing, validation and serialization.
+    Currency entries also carry the rate snapshot version and miss as soon
+    as new rates are published; their rates_age is brought up to date on
+    every hit.
+    """
+    route = CONVERSION_ROUTES.get(category)
+    if route is None:
+        return _json_error(f"Invalid category: {category}", 404)
+
+    # Same 415 as request.get_json(), checked before the cache so a hit needs JSON too
+    if not request.is_json:
+        request.on_json_loading_failed(None)
+    body = request.get_data()
+    snapshot = rate_cache.snapshot() if route.rates_versioned else None
+    cache = current_app.extensions.get('result_cache')
+    key = None
+    # Historical conversions depend on a store that can grow
+    if cache is not None and len(body) <= CACHEABLE_BODY_BYTES and b'as_of' not in body:
+        key = (request.path, body, snapshot.version if snapshot is not None else None)
+        entry = cache.get(key)
+        if entry is not None:
+            _count_conversion(category)
+            payload = entry[0] if snapshot is None else _with_rates_age(entry[0], snapshot)
+            response = current_app.response_class(payload, mimetype='application/json')
+            response.headers['Age'] = str(int(time.monotonic() - entry[1]))
+            return response
+
+    # Same 400 as request.get_json()
+    try:
+        data = json.loads(body)
+    except ValueError as e:
+        request.on_json_loading_failed(e)
+    if not isinstance(data, dict):
+        return _json_error('Request body must be a JSON object')
+
+    try:
+        payload = route.respond(data, snapshot)
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        return _json_error(str(e))
+
+    _count_conversion(category)
+    if key is not None:
+        cache.set(key, payload)
+    return current_app.response_class(payload, mimetype='application/json')
+
+
+# The original per-category URLs keep their own rules and endpoint names
+for _category in CONVERSION_ROUTES:
+    bp.add_url_rule(f"/api/convert/{_category}", f"convert_{_category.replace('-', '_')}",
+                    convert, methods=['POST'], defaults={'category': _category})
+
+
+@bp.route('/api/convert/number-base/file', methods=['POST'])
+def convert_number_base_file():
+    """Convert an uploaded binary file or digit dump, streaming the result.
+
+    Pairs of power-of-two bases stream in chunks of any size; other pairs
+    hold the whole value as one number, so their input is capped at
+    NUMBER_BASE_FILE_MAX_BYTES.
+    """
+    from_base = request.values.get('from_base', 'bytes')
+    to_base = request.values.get('to_base')
     try:
-        data = request.get_json()
-        value = float(data.get('value', 0))
-        from_unit = data.get('from_unit')
-        to_unit = data.get('to_unit')
-        
-        result = LengthConverter.convert(value, from_unit, to_unit)
+        streams = NumberBaseConverter.streams_file(from_base, to_base)
+    except (ValueError, TypeError) as e:
         return jsonify({
-            'success': True,
-            'result': result,
-            'from': f"{value} {from_unit}",
-            'to': f"{result} {to_unit}"
-        })
-    except (ValueError, TypeError, KeyError) as e:
+            'success': False,
+            'error': str(e)
+        }), 400
+    limit = None if streams else current_app.config['NUMBER_BASE_FILE_MAX_BYTES']
+    upload = request.files.get('file')
+    if limit is not None and upload is None and (request.content_length or 0) > limit:
+        return _too_large(from_base, to_base, limit)
+    
+    # Spool the upload to disk so it can be memory-mapped
+    fd, path = tempfile.mkstemp(prefix='number-base-')
+    pieces = None
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if not _spool(upload.stream if upload else request.stream, f, limit):
+                return _too_large(from_base, to_base, limit)
+        pieces = NumberBaseConverter.convert_file(path, from_base, to_base)
+    except (ValueError, TypeError) as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
+    finally:
+        if pieces is None:
+            os.unlink(path)
+    
+    def generate():
+        try:
+            yield from pieces
+        finally:
+            pieces.close()
+            os.unlink(path)
+    
+    return Response(generate(), mimetype='text/plain')
 
 
-@bp.route('/api/convert/weight', methods=['POST'])
-def convert_weight():
-    """Convert weight units"""
-    try:
-        data = request.get_json()
-        value = float(data.get('value', 0))
-        from_unit = data.get('from_unit')
-        to_unit = data.get('to_unit')
-        
-        result = WeightConverter.convert(value, from_unit, to_unit)
+def _too_large(from_base, to_base, limit):
+    return jsonify({
+        'success': False,
+        'error': f"Input too large to convert from {from_base} to {to_base} (limit {limit} bytes)"
+    }), 413
+
+
+def _spool(source, f, limit, chunk_size=1 << 20):
+    """Copy source into f; False as soon as more than limit bytes arrive"""
+    copied = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return True
+        copied += len(chunk)
+        if limit is not None and copied > limit:
+            return False
+        f.write(chunk)
+
+
+@bp.route('/api/cache', methods=['GET'])
+def cache_stats():
+    """Result cache hit, miss and eviction counters"""
+    cache = current_app.extensions.get('result_cache')
+    return jsonify({
+        'enabled': cache is not None,
+        'stats': cache.stats() if cache is not None else None
+    })
+
+
+@bp.route('/api/admission', methods=['GET'])
+def admission_stats():
+    """Admitted and shed request counts and current concurrency"""
+    admission = current_app.extensions.get('admission')
+    return jsonify({
+        'enabled': admission is not None,
+        'stats': admission.stats() if admission is not None else None
+    })
+
+
+@bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Request, latency and conversion metrics in the Prometheus text format"""
+    metrics = current_app.extensions.get('metrics')
+    if metrics is None:
         return jsonify({
-            'success': True,
-            'result': result,
-            'from': f"{value} {from_unit}",
-            'to': f"{result} {to_unit}"
-        })
-    except (ValueError, TypeError, KeyError) as e:
+            'success': False,
+            'error': 'Metrics are disabled'
+        }), 404
+    body = metrics.render(current_app.extensions.get('result_cache'),
+                          current_app.extensions.get('admission'))
+    return Response(body, mimetype='text/plain; version=0.0.4')
+
+
+def _profiler_status(profiler):
+    return {
+        'success': True,
+        'sample_rate': profiler.sample_rate,
+        'mode': profiler.mode,
+        'profiled': profiler.profiled,
+        'routes': profiler.routes(),
+        'directory': profiler.directory
+    }
+
+
+@bp.route('/admin/profiler', methods=['GET', 'POST'])
+@admin_required
+def profiler_settings():
+    """Show the request profiler, or change its sample rate and mode"""
+    profiler = current_app.extensions.get('profiler')
+    if profiler is None:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 400
+            'error': 'Profiling is not configured'
+        }), 404
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        try:
+            profiler.configure(data.get('sample_rate'), data.get('mode'))
+        except (ValueError, TypeError) as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+    return jsonify(_profiler_status(profiler))
 
 
-@bp.route('/api/convert/temperature', methods=['POST'])
-def convert_temperature():
-    """Convert temperature units"""
-    try:
-        data = request.get_json()
-        value = float(data.get('value', 0))
-        from_unit = data.get('from_unit')
-        to_unit = data.get('to_unit')
-        
-        result = TemperatureConverter.convert(value, from_unit, to_unit)
+@bp.route('/admin/profiler/dump', methods=['POST'])
+@admin_required
+def profiler_dump():
+    """Write the aggregated profiles to disk, optionally resetting them"""
+    profiler = current_app.extensions.get('profiler')
+    if profiler is None:
         return jsonify({
-            'success': True,
-            'result': result,
-            'from': f"{value}° {from_unit.capitalize()[0]}",
-            'to': f"{result}° {to_unit.capitalize()[0]}"
-        })
-    except (ValueError, TypeError, KeyError) as e:
+            'success': False,
+            'error': 'Profiling is not configured'
+        }), 404
+    paths = profiler.dump()
+    if request.args.get('reset') == 'true':
+        profiler.reset()
+    return jsonify({
+        'success': True,
+        'files': paths
+    })
+
+
+@bp.route('/api/units', methods=['GET'])
+def get_units():
+    """Get available units for each converter type"""
+    return jsonify({
+        category: registry.units(category) for category in registry.categories()
+    })
+
+
+@lru_cache(maxsize=8)
+def _conversion_tables(rates_version, rates_ttl):
+    """Serialized factor tables and their ETag for one version of the rates"""
+    snapshot = rate_cache.snapshot()
+    categories = {category: registry.table(category)
+                  for category in ('length', 'weight', 'temperature', 'volume')}
+    # TemperatureConverter returns same-unit values unrounded
+    categories['temperature']['round_identity'] = False
+    categories['currency'] = dict(snapshot.table(), rates_version=snapshot.version, ttl=rates_ttl)
+
+    tables = {'categories': categories, 'server_only': ['number-base', 'compound']}
+    etag = hashlib.sha256(json.dumps(tables, sort_keys=True).encode()).hexdigest()[:16]
+    tables['version'] = etag
+    return json.dumps(tables, sort_keys=True, separators=(',', ':')).encode(), etag
+
+
+@bp.route('/api/conversion-tables', methods=['GET'])
+def conversion_tables():
+    """Factor tables for converting on the client, revalidated with an ETag"""
+    body, etag = _conversion_tables(rate_cache.snapshot().version, rate_cache.ttl)
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+@bp.route('/sw.js')
+def service_worker():
+    """Service worker, served from the root so it controls the whole site"""
+    response = current_app.send_static_file('js/sw.js')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _convert_value(category, value, from_unit, to_unit):
+    """Convert a raw value of the given category and return the result"""
+    if category not in CONVERTERS:
+        raise ValueError(f"Invalid category: {category}")
+
+    converter = CONVERTERS[category][0]
+    if converter is NumberBaseConverter:
+        value = value.strip()
+    else:
+        value = float(value)
+    result = converter.convert(value, from_unit, to_unit)
+    _count_conversion(category)
+    return result
+
+
+def _convert_currency_as_of(value, from_currency, to_currency, as_of):
+    """Convert currency with the historical rates in effect at as_of"""
+    history = current_app.extensions.get('rate_history')
+    if history is None:
+        raise ValueError('Historical rates are not configured')
+    return history.conversion(from_currency, to_currency, as_of).convert(value)
+
+
+def _convert_batch_item(item, default_category=None):
+    """Convert a single batch item and return the result"""
+    if not isinstance(item, dict):
+        raise TypeError('Each conversion must be an object')
+
+    category = item.get('category', default_category)
+    if category not in CONVERTERS:
+        raise ValueError(f"Invalid category: {category}")
+
+    from_key, to_key = CONVERTERS[category][1:]
+    if category == 'currency' and item.get('as_of') is not None:
+        result = _convert_currency_as_of(float(item.get('value', 0)), item.get(from_key),
+                                         item.get(to_key), item['as_of'])
+        _count_conversion(category)
+        return result
+
+    default_value = '' if category == 'number-base' else 0
+    return _convert_value(category, item.get('value', default_value),
+                          item.get(from_key), item.get(to_key))
+
+
+@bp.route('/api/convert/batch', methods=['POST'])
+def convert_batch():
+    """Run many conversions, possibly of mixed categories, in one request"""
+    data = request.get_json(silent=True)
+    conversions = data.get('conversions') if isinstance(data, dict) else None
+    if not isinstance(conversions, list):
         return jsonify({
             'success': False,
-            'error': str(e)
+            'error': "Request body must contain a 'conversions' list"
+        }), 400
+
+    max_size = current_app.config['MAX_BATCH_SIZE']
+    if len(conversions) > max_size:
+        return jsonify({
+            'success': False,
+            'error': f"Batch too large: {len(conversions)} conversions (max {max_size})"
         }), 400
 
+    results = []
+    append = results.append
+    for item in conversions:
+        try:
+            append({'success': True, 'result': _convert_batch_item(item)})
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            append({'success': False, 'error': str(e)})
 
-@bp.route('/api/convert/volume', methods=['POST'])
-def convert_volume():
-    """Convert volume units"""
-    try:
-        data = request.get_json()
-        value = float(data.get('value', 0))
-        from_unit = data.get('from_unit')
-        to_unit = data.get('to_unit')
-        
-        result = VolumeConverter.convert(value, from_unit, to_unit)
+    return jsonify({
+        'success': True,
+        'count': len(results),
+        'results': results
+    })
+
+
+@bp.route('/api/convert/<category>/all', methods=['POST'])
+def convert_all(category):
+    """Convert one value, or a list of values, into every unit of a category.
+
+    A 'value' gives 'results' aligned with 'units'; a 'values' list gives one
+    such row per value. The whole matrix is computed in one pass over the
+    category's factor table.
+    """
+    if category not in CONVERTERS or category in ('number-base', 'compound'):
         return jsonify({
-            'success': True,
-            'result': result,
-            'from': f"{value} {from_unit}",
-            'to': f"{result} {to_unit}"
-        })
-    except (ValueError, TypeError, KeyError) as e:
+            'success': False,
+            'error': f"Invalid category: {category}"
+        }), 404
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
         return jsonify({
             'success': False,
-            'error': str(e)
+            'error': 'Request body must be a JSON object'
         }), 400
 
-
-@bp.route('/api/convert/currency', methods=['POST'])
-def convert_currency():
-    """Convert currency"""
+    converter, from_key, _ = CONVERTERS[category]
+    single = 'values' not in data
+    max_size = current_app.config['MAX_BATCH_SIZE']
     try:
-        data = request.get_json()
-        value = float(data.get('value', 0))
-        from_currency = data.get('from_currency')
-        to_currency = data.get('to_currency')
-        
-        result = CurrencyConverter.convert(value, from_currency, to_currency)
-        return jsonify({
-            'success': True,
-            'result': result,
-            'from': f"{value} {from_currency}",
-            'to': f"{result} {to_currency}"
-        })
+        try:
+            values = array('d', [data.get('value', 0)] if single else data['values'])
+        except TypeError:
+            raise ValueError("'value' must be a number and 'values' a list of numbers") from None
+        if len(values) > max_size:
+            raise ValueError(f"Too many values: {len(values)} (max {max_size})")
+        from_unit = data.get(from_key)
+        extra = {}
+        if category == 'currency':
+            snapshot = rate_cache.snapshot()
+            units, rows = converter.convert_all(values, from_unit, snapshot)
+            extra = {'rates_age': round(snapshot.age, 3), 'rates_version': snapshot.version}
+        else:
+            units, rows = converter.convert_all(values, from_unit)
     except (ValueError, TypeError, KeyError) as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
+    _count_conversion(category, len(values) * len(units))
+    return jsonify({
+        'success': True,
+        from_key: from_unit,
+        'units': units,
+        'results': rows[0] if single else rows,
+        **extra
+    })
+
 
-@bp.route('/api/convert/number-base', methods=['POST'])
-def convert_number_base():
-    """Convert number between different bases"""
-    try:
-        data = request.get_json()
-        value = data.get('value', '').strip()
-        from_base = data.get('from_base')
-        to_base = data.get('to_base')
-        
-        result = NumberBaseConverter.convert(value, from_base, to_base)
+def _stream_ndjson_chunk(lines, category):
+    """Convert a chunk of numbered NDJSON lines into NDJSON result records"""
+    records = []
+    for line_number, line in lines:
+        try:
+            result = _convert_batch_item(json.loads(line), category)
+            record = {'line': line_number, 'success': True, 'result': result}
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            record = {'line': line_number, 'success': False, 'error': str(e)}
+        records.append(json.dumps(record))
+    return '\n'.join(records) + '\n'
+
+
+def _stream_csv_chunk(lines, category):
+    """Convert a chunk of numbered value,from_unit,to_unit lines into CSV result rows"""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    for line_number, line in lines:
+        try:
+            row = next(csv.reader([line]))
+            if len(row) != 3:
+                raise ValueError(f"Expected 3 fields, got {len(row)}")
+            writer.writerow([line_number, _convert_value(category, *row), ''])
+        except (ValueError, TypeError, KeyError, AttributeError, csv.Error) as e:
+            writer.writerow([line_number, '', str(e)])
+    return out.getvalue()
+
+
+@bp.route('/api/convert/stream', methods=['POST'])
+def convert_stream():
+    """Convert a CSV or NDJSON request body row by row, streaming the results"""
+    category = request.args.get('category')
+    is_ndjson = request.mimetype in ('application/x-ndjson', 'application/ndjson')
+    # CSV rows carry no category, so it must come from the query string
+    if category not in CONVERTERS and (category is not None or not is_ndjson):
         return jsonify({
-            'success': True,
-            'result': result,
-            'from': f"{value} ({from_base})",
-            'to': f"{result} ({to_base})"
-        })
+            'success': False,
+            'error': f"Invalid category: {category}"
+        }), 400
+
+    chunk_size = current_app.config['STREAM_CHUNK_SIZE']
+    convert_chunk = _stream_ndjson_chunk if is_ndjson else _stream_csv_chunk
+    stream = request.stream
+
+    def generate():
+        if not is_ndjson:
+            yield 'line,result,error\n'
+        chunk = []
+        for line_number, raw_line in enumerate(stream, 1):
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if not line or line_number == 1 and line.startswith('value,'):
+                continue
+            chunk.append((line_number, line))
+            if len(chunk) >= chunk_size:
+                yield convert_chunk(chunk, category)
+                chunk = []
+        if chunk:
+            yield convert_chunk(chunk, category)
+
+    mimetype = 'application/x-ndjson' if is_ndjson else 'text/csv'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
+@bp.route('/api/convert/binary', methods=['POST'])
+def convert_binary():
+    """Convert packed little-endian float64 values (see backend.utils.wire).
+
+    Bodies up to BINARY_INLINE_BYTES are converted in one pass; larger or
+    chunked bodies are read and answered BINARY_CHUNK_VALUES at a time.
+    """
+    stream = request.stream
+    try:
+        header = stream.readline(wire.HEADER_MAX_BYTES)
+        category, from_unit, to_unit = wire.decode_header(header)
+        if category not in CONVERTERS or category == 'number-base':
+            raise ValueError(f"Invalid category: {category}")
+        converter = CONVERTERS[category][0]
+        if category == 'currency':
+            snapshot = rate_cache.snapshot()
+            # Pin one set of rates for the whole body
+            convert_many = lambda values: converter.convert_many(values, from_unit, to_unit, snapshot)
+        else:
+            convert_many = lambda values: converter.convert_many(values, from_unit, to_unit)
+        # Reject unknown units before any output is sent
+        convert_many(array('d'))
     except (ValueError, TypeError, KeyError) as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
+    length = request.content_length
+    if length is not None and (length - len(header)) % wire.VALUE_SIZE:
+        return jsonify({
+            'success': False,
+            'error': f"Body is not a whole number of {wire.VALUE_SIZE}-byte values"
+        }), 400
 
-@bp.route('/api/units', methods=['GET'])
-def get_units():
-    """Get available units for each converter type"""
-    return jsonify({
-        'length': list(LengthConverter.CONVERSIONS.keys()),
-        'weight': list(WeightConverter.CONVERSIONS.keys()),
-        'temperature': ['celsius', 'fahrenheit', 'kelvin'],
-        'volume': list(VolumeConverter.CONVERSIONS.keys()),
-        'currency': list(CurrencyConverter.EXCHANGE_RATES.keys()),
-        'number_base': ['binary', 'decimal', 'hexadecimal', 'octal']
-    })
+    if length is not None and length <= current_app.config['BINARY_INLINE_BYTES']:
+        data = stream.read()
+        _count_conversion(category, len(data) // wire.VALUE_SIZE)
+        return Response(wire.convert_packed(convert_many, data), mimetype=wire.MIMETYPE)
+
+    chunk_bytes = current_app.config['BINARY_CHUNK_VALUES'] * wire.VALUE_SIZE
+
+    def generate():
+        pending = b''
+        while True:
+            data = stream.read(chunk_bytes - len(pending))
+            if not data:
+                break
+            pending += data
+            if len(pending) < chunk_bytes:
+                continue
+            yield wire.convert_packed(convert_many, pending)
+            _count_conversion(category, len(pending) // wire.VALUE_SIZE)
+            pending = b''
+        # A chunked body may end mid-value, after the response has started;
+        # the partial value is dropped and counted in /metrics
+        usable = len(pending) - len(pending) % wire.VALUE_SIZE
+        if usable:
+            yield wire.convert_packed(convert_many, pending[:usable])
+            _count_conversion(category, usable // wire.VALUE_SIZE)
+        metrics = current_app.extensions.get('metrics')
+        if usable < len(pending) and metrics is not None:
+            metrics.count_truncated(len(pending) - usable)
+
+    return Response(stream_with_context(generate()), mimetype=wire.MIMETYPE)
@@ -0,0 +1,18 @@
+"""
+Session interface that skips cookie signing work for cookieless requests
+"""
+from flask.sessions import SecureCookieSessionInterface
+
+
+class LazySessionInterface(SecureCookieSessionInterface):
+    """Signed cookie sessions, built only when the request sends a cookie.
+
+    The stock interface creates a signing serializer on every request, which
+    costs more than a whole conversion. API clients send no cookies, so they
+    get an empty session directly; it is only saved if a view modifies it.
+    """
+
+    def open_session(self, app, request):
+        if app.secret_key and 'HTTP_COOKIE' not in request.environ:
+            return self.session_class()
+        return super().open_session(app, request)
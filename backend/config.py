@@ -8,3 +8,42 @@ class Config:
     HOST = os.environ.get('FLASK_HOST', '0.0.0.0')
     PORT = int(os.environ.get('FLASK_PORT', 5000))
 
+    MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 100000))
+    STREAM_CHUNK_SIZE = int(os.environ.get('STREAM_CHUNK_SIZE', 1000))
+    CURRENCY_RATES_FILE = os.environ.get('CURRENCY_RATES_FILE')
+    CURRENCY_RATES_TTL = float(os.environ.get('CURRENCY_RATES_TTL', 300))
+    CURRENCY_HISTORY_DIR = os.environ.get('CURRENCY_HISTORY_DIR')
+    RESULT_CACHE_SIZE = int(os.environ.get('RESULT_CACHE_SIZE', 4096))
+    RESULT_CACHE_TTL = float(os.environ.get('RESULT_CACHE_TTL', 60))
+    SERVER_MODE = os.environ.get('SERVER_MODE', 'waitress')
+    WAITRESS_THREADS = int(os.environ.get('WAITRESS_THREADS', 4))
+    ASGI_BACKLOG = int(os.environ.get('ASGI_BACKLOG', 4096))
+    ASGI_KEEP_ALIVE = int(os.environ.get('ASGI_KEEP_ALIVE', 30))
+    WORKERS = int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1))
+    WORKER_THREADS = int(os.environ.get('WORKER_THREADS', 2))
+    PRELOAD_APP = os.environ.get('PRELOAD_APP', 'True').lower() == 'true'
+    REUSE_PORT = os.environ.get('REUSE_PORT', 'False').lower() == 'true'
+    MAX_REQUESTS = int(os.environ.get('MAX_REQUESTS', 10000))
+    MAX_REQUESTS_JITTER = int(os.environ.get('MAX_REQUESTS_JITTER', 1000))
+    GRACEFUL_TIMEOUT = int(os.environ.get('GRACEFUL_TIMEOUT', 30))
+    WORKER_TIMEOUT = int(os.environ.get('WORKER_TIMEOUT', 30))
+    GUNICORN_KEEP_ALIVE = int(os.environ.get('GUNICORN_KEEP_ALIVE', 30))
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
+    PROFILE_DIR = os.environ.get('PROFILE_DIR')
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0.0))
+    PROFILE_MODE = os.environ.get('PROFILE_MODE', 'cprofile')
+    ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+    ASSETS_PRECOMPRESS = os.environ.get('ASSETS_PRECOMPRESS', 'True').lower() == 'true'
+    BINARY_INLINE_BYTES = int(os.environ.get('BINARY_INLINE_BYTES', 1 << 20))
+    BINARY_CHUNK_VALUES = int(os.environ.get('BINARY_CHUNK_VALUES', 65536))
+    NUMBER_BASE_FILE_MAX_BYTES = int(os.environ.get('NUMBER_BASE_FILE_MAX_BYTES', 1 << 20))
+    RATE_LIMIT = float(os.environ.get('RATE_LIMIT', 0))
+    RATE_LIMIT_BURST = int(os.environ.get('RATE_LIMIT_BURST', 20))
+    MAX_CONCURRENT_REQUESTS = int(os.environ.get('MAX_CONCURRENT_REQUESTS', 0))
+    ADMISSION_QUEUE_SIZE = int(os.environ.get('ADMISSION_QUEUE_SIZE', 16))
+    ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 1.0))
+    SHARED_RATES = os.environ.get('SHARED_RATES', 'False').lower() == 'true'
+    READY_MAX_P99_SECONDS = float(os.environ.get('READY_MAX_P99_SECONDS', 1.0))
+    READY_MAX_QUEUE_DEPTH = int(os.environ.get('READY_MAX_QUEUE_DEPTH', 8))
+    READY_MAX_UTILIZATION = float(os.environ.get('READY_MAX_UTILIZATION', 0.9))
+    READY_LATENCY_WINDOW = float(os.environ.get('READY_LATENCY_WINDOW', 30))
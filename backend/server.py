@@ -0,0 +1,121 @@
+"""
+Serving modes for the application
+"""
+import os
+
+# Threads beyond the admission limit and queue, for rejections and health checks
+WAITRESS_SPARE_THREADS = 4
+
+
+def waitress_threads(config):
+    """Thread pool size for waitress.
+
+    waitress queues requests without limit once every thread is busy, so with
+    a concurrency limit it gets enough threads for the admitted and queued
+    requests plus spares that answer rejections and health checks at once.
+    """
+    if config.MAX_CONCURRENT_REQUESTS <= 0:
+        return config.WAITRESS_THREADS
+    return max(config.WAITRESS_THREADS,
+               config.MAX_CONCURRENT_REQUESTS + config.ADMISSION_QUEUE_SIZE + WAITRESS_SPARE_THREADS)
+
+
+def worker_threads(config):
+    """Threads that run requests in one process for config.SERVER_MODE"""
+    if config.SERVER_MODE == 'gunicorn':
+        return config.WORKER_THREADS
+    if config.SERVER_MODE == 'asgi':
+        # The event loop plus the default executor (ThreadPoolExecutor's own default size)
+        return 1 + min(32, (os.cpu_count() or 1) + 4)
+    return waitress_threads(config)
+
+
+def serve_waitress(app, config):
+    """Serve the WSGI app with waitress and a fixed thread pool"""
+    import logging
+    from waitress import create_server
+    logging.basicConfig()
+    threads = waitress_threads(config)
+    if threads != config.WAITRESS_THREADS:
+        logging.getLogger(__name__).warning(
+            'Raising WAITRESS_THREADS from %d to %d to fit MAX_CONCURRENT_REQUESTS + ADMISSION_QUEUE_SIZE '
+            '+ %d spare threads', config.WAITRESS_THREADS, threads, WAITRESS_SPARE_THREADS)
+    server = create_server(app, host=config.HOST, port=config.PORT, threads=threads)
+
+    # Requests waiting for a waitress thread count against the admission queue
+    admission = app.extensions.get('admission')
+    dispatcher = getattr(server, 'task_dispatcher', None)
+    if admission is not None and admission.concurrency is not None and dispatcher is not None:
+        admission.concurrency.backlog = dispatcher.queue.__len__
+
+    server.print_listen('Serving on http://{}:{}')
+    server.run()
+
+
+def serve_asgi(app, config):
+    """Serve the app from a single event loop with uvicorn"""
+    try:
+        import uvicorn
+    except ImportError:
+        raise RuntimeError("SERVER_MODE=asgi requires uvicorn: pip install uvicorn") from None
+
+    from backend.app.asgi import AsgiApp
+    uvicorn.run(AsgiApp(app), host=config.HOST, port=config.PORT,
+                backlog=config.ASGI_BACKLOG, timeout_keep_alive=config.ASGI_KEEP_ALIVE,
+                lifespan='on', access_log=False)
+
+
+def gunicorn_options(config):
+    """Gunicorn settings derived from the application config"""
+    return {
+        'bind': f"{config.HOST}:{config.PORT}",
+        'workers': config.WORKERS,
+        'threads': config.WORKER_THREADS,
+        'worker_class': 'gthread' if config.WORKER_THREADS > 1 else 'sync',
+        'preload_app': config.PRELOAD_APP,
+        'reuse_port': config.REUSE_PORT,
+        # Staggered recycling: each worker exits after max_requests (+ jitter)
+        # and is replaced while its siblings keep serving
+        'max_requests': config.MAX_REQUESTS,
+        'max_requests_jitter': config.MAX_REQUESTS_JITTER,
+        'graceful_timeout': config.GRACEFUL_TIMEOUT,
+        'timeout': config.WORKER_TIMEOUT,
+        'keepalive': config.GUNICORN_KEEP_ALIVE,
+    }
+
+
+def serve_gunicorn(app, config):
+    """Serve the app from preforked gunicorn workers"""
+    from gunicorn.app.base import BaseApplication
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(config).items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            if config.PRELOAD_APP:
+                # Import NumPy once in the master so the workers share it
+                from backend.utils.registry import numpy
+                numpy()
+                return app
+            # Each worker builds its own app after the fork
+            from backend.app import create_app
+            return create_app(config)
+
+    Application().run()
+
+
+SERVERS = {
+    'waitress': serve_waitress,
+    'asgi': serve_asgi,
+    'gunicorn': serve_gunicorn,
+}
+
+
+def serve(app, config):
+    """Serve the app with the server selected by config.SERVER_MODE"""
+    if config.SERVER_MODE not in SERVERS:
+        raise ValueError(f"Invalid server mode: {config.SERVER_MODE} "
+                         f"(expected one of {', '.join(SERVERS)})")
+    SERVERS[config.SERVER_MODE](app, config)
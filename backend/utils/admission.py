@@ -0,0 +1,169 @@
+"""
+Admission control: per-client rate limiting and a global concurrency limit
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+
+# Health checks and scrapes must keep answering while traffic is shed
+EXEMPT_PATHS = frozenset(('/health', '/ready', '/metrics'))
+
+# Outcomes counted by AdmissionController, in exposition order
+OUTCOMES = ('admitted', 'rate_limited', 'queue_full', 'queue_timeout')
+
+
+class RequestGauge:
+    """Requests in progress, whether or not any limit is set, out of the threads that run them"""
+
+    def __init__(self, threads):
+        self.threads = threads
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.value += 1
+
+    def exit(self):
+        with self._lock:
+            self.value -= 1
+
+
+class RateLimiter:
+    """Token bucket per client: rate tokens per second, up to burst.
+
+    Only the max_clients most recently seen clients are tracked; a client
+    that is forgotten starts again with a full bucket.
+    """
+
+    def __init__(self, rate, burst, max_clients=10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client):
+        """Take a token; returns 0 if allowed, else seconds until one is available"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                tokens = self.burst
+                if len(self._buckets) >= self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                self._buckets.move_to_end(client)
+
+            if tokens >= 1:
+                self._buckets[client] = (tokens - 1, now)
+                return 0.0
+            self._buckets[client] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+
+class ConcurrencyLimiter:
+    """At most limit requests at once, with up to queue_size more waiting.
+
+    A request that finds the queue full is refused at once; one that waits
+    longer than timeout seconds gives up. backlog may be set to a callable
+    returning how many requests the server itself has queued in front of the
+    app (waitress's task queue); those count against queue_size too.
+
+    acquire(block=False) never waits: it behaves as if queue_size were 0,
+    for callers on an event loop thread that must not sleep.
+    """
+
+    def __init__(self, limit, queue_size=0, timeout=1.0):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self.backlog = None
+        self._condition = threading.Condition()
+
+    def acquire(self, block=True):
+        """Returns 'admitted', 'queue_full' or 'queue_timeout'"""
+        backlog = self.backlog() if self.backlog is not None else 0
+        with self._condition:
+            queued = self.waiting + backlog
+            # Shed even with a free slot while the server's queue overflows
+            if queued > self.queue_size:
+                return 'queue_full'
+            if self.active < self.limit:
+                self.active += 1
+                return 'admitted'
+            if not block or queued >= self.queue_size:
+                return 'queue_full'
+
+            self.waiting += 1
+            try:
+                admitted = self._condition.wait_for(lambda: self.active < self.limit, self.timeout)
+            finally:
+                self.waiting -= 1
+            if not admitted:
+                return 'queue_timeout'
+            self.active += 1
+            return 'admitted'
+
+    def release(self):
+        """Free a slot and wake one waiting request"""
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+
+class AdmissionController:
+    """Decides whether a request may run and counts every decision.
+
+    Either limiter may be None to turn it off. admit() returns
+    (outcome, retry_after) where retry_after is in seconds; every admitted
+    request must be followed by exactly one release().
+    """
+
+    def __init__(self, rate_limiter=None, concurrency=None, retry_after=1):
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.retry_after = retry_after
+        self._counts = dict.fromkeys(OUTCOMES, 0)
+        self._lock = threading.Lock()
+
+    def admit(self, client, block=True):
+        """Rate-limit the client, then wait for a concurrency slot (unless block is False)"""
+        retry_after = 0
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.acquire(client)
+            if wait:
+                self._count('rate_limited')
+                return 'rate_limited', max(1, math.ceil(wait))
+
+        outcome = 'admitted'
+        if self.concurrency is not None:
+            outcome = self.concurrency.acquire(block)
+            if outcome != 'admitted':
+                retry_after = self.retry_after
+        self._count(outcome)
+        return outcome, retry_after
+
+    def release(self):
+        """Give back the concurrency slot of an admitted request"""
+        if self.concurrency is not None:
+            self.concurrency.release()
+
+    def _count(self, outcome):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def stats(self):
+        """Decision counts, current concurrency and the server's backlog"""
+        with self._lock:
+            stats = dict(self._counts)
+        concurrency = self.concurrency
+        stats['active'] = concurrency.active if concurrency is not None else None
+        stats['waiting'] = concurrency.waiting if concurrency is not None else None
+        stats['limit'] = concurrency.limit if concurrency is not None else None
+        stats['backlog'] = concurrency.backlog() if concurrency is not None and concurrency.backlog else 0
+        return stats
@@ -0,0 +1,118 @@
+"""
+Fingerprinted, precompressed static assets held in memory
+
+Usage: python -m backend.utils.assets STATIC_DIR OUTPUT_DIR
+writes the hashed files and their .gz/.br variants for a CDN or proxy.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Skip compressing files this small or formats that are already compressed
+MIN_COMPRESS_BYTES = 256
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+
+class Asset:
+    """One static file: its hashed name and every encoding of its bytes"""
+
+    __slots__ = ('filename', 'hashed_name', 'mimetype', 'etag', 'encodings')
+
+    def __init__(self, filename, data):
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        root, ext = os.path.splitext(filename)
+        self.filename = filename
+        self.hashed_name = f"{root}.{digest}{ext}"
+        self.mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        self.etag = digest
+        # Content-Encoding -> bytes; identity is always present
+        self.encodings = {'identity': data}
+
+        if len(data) >= MIN_COMPRESS_BYTES and self.mimetype.startswith(COMPRESSIBLE_TYPES):
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                self.encodings['gzip'] = compressed
+            if brotli is not None:
+                compressed = brotli.compress(data, quality=11)
+                if len(compressed) < len(data):
+                    self.encodings['br'] = compressed
+
+    def negotiate(self, accept_encoding):
+        """Return (encoding, bytes, etag) for an Accept-Encoding header value"""
+        accepted = {part.split(';', 1)[0].strip() for part in accept_encoding.lower().split(',')}
+        for encoding in ('br', 'gzip'):
+            if encoding in self.encodings and encoding in accepted:
+                return encoding, self.encodings[encoding], f"{self.etag}-{encoding}"
+        return 'identity', self.encodings['identity'], self.etag
+
+
+class AssetBundle:
+    """All files under a static directory, keyed by their hashed names.
+
+    Hashed names change whenever the content does, so responses can be
+    cached forever; build() can be called again to pick up edited files.
+    """
+
+    def __init__(self, static_dir):
+        self.static_dir = static_dir
+        self._by_name = {}
+        self._by_hashed_name = {}
+
+    def build(self):
+        """Read, hash and compress every file, then swap in the new bundle.
+
+        Hashed names from earlier builds keep resolving, so pages rendered
+        before a rebuild still load their assets.
+        """
+        by_name = {}
+        for root, _, files in os.walk(self.static_dir):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.static_dir).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    by_name[filename] = Asset(filename, f.read())
+
+        by_hashed_name = dict(self._by_hashed_name)
+        by_hashed_name.update((asset.hashed_name, asset) for asset in by_name.values())
+        self._by_hashed_name = by_hashed_name
+        self._by_name = by_name
+        return self
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def url_name(self, filename):
+        """Hashed name for a file, or None if it is not in the bundle"""
+        asset = self._by_name.get(filename)
+        return asset.hashed_name if asset is not None else None
+
+    def get(self, hashed_name):
+        """Asset for a hashed name, or None"""
+        return self._by_hashed_name.get(hashed_name)
+
+    def write(self, output_dir):
+        """Write every hashed file and its compressed variants to output_dir"""
+        suffixes = {'identity': '', 'gzip': '.gz', 'br': '.br'}
+        paths = []
+        for asset in self._by_name.values():
+            for encoding, data in asset.encodings.items():
+                path = os.path.join(output_dir, asset.hashed_name + suffixes[encoding])
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                paths.append(path)
+        return sorted(paths)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit('Usage: python -m backend.utils.assets STATIC_DIR OUTPUT_DIR')
+    for written in AssetBundle(sys.argv[1]).build().write(sys.argv[2]):
+        print(written)
@@ -0,0 +1,374 @@
+"""
+Big-number base conversion for inputs beyond int()/str() practical limits
+
+CPython converts between int and decimal strings in quadratic time and
+refuses decimal strings over sys.get_int_max_str_digits() digits. This
+module converts non-power-of-two bases with divide-and-conquer algorithms
+and converts between power-of-two bases by regrouping bits chunk by chunk,
+so no single big int is ever built.
+"""
+import base64
+import decimal
+import math
+import mmap
+import os
+
+STANDARD_DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+BASE32_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
+BASE64_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+BASE64URL_DIGITS = BASE64_DIGITS[:62] + '-_'
+
+# Digits converted by int() directly at the leaves of the recursion
+_PARSE_LEAF_DIGITS = 1000
+# Bits handled by Decimal() directly at the leaves of the recursion
+_BINARY_LEAF_BITS = 2048
+# Digits produced per leaf when formatting other non-power-of-two bases
+_FORMAT_LEAF_DIGITS = 16
+# Ints smaller than this are formatted as decimal by str() directly
+_STR_MAX_BITS = 9000
+# Bits per chunk when regrouping between power-of-two bases
+_REGROUP_CHUNK_BITS = 1 << 15
+# Bytes read from a mapped file per step
+_READ_CHUNK_BYTES = 1 << 20
+_WHITESPACE = b' \t\r\n\v\f'
+
+_FORMATS = {2: 'b', 8: 'o', 16: 'X'}
+_HEX_TO_BASE2 = str.maketrans({c: format(int(c, 16), '04b') for c in '0123456789abcdef'})
+_HEX_TO_BASE4 = str.maketrans({
+    c: format(int(c, 16) >> 2, 'd') + format(int(c, 16) & 3, 'd') for c in '0123456789abcdef'
+})
+_STANDARD32_TO_BASE32 = str.maketrans(STANDARD_DIGITS[:32], BASE32_DIGITS)
+_BASE32_TO_STANDARD32 = str.maketrans(BASE32_DIGITS, STANDARD_DIGITS[:32])
+
+
+class Radix:
+    """A positional numeral system: its radix and digit alphabet"""
+
+    def __init__(self, radix, digits=None):
+        if not 2 <= radix <= 64:
+            raise ValueError(f"Invalid radix: {radix}")
+        self.radix = radix
+        self.digits = digits or STANDARD_DIGITS[:radix]
+        if len(self.digits) != radix:
+            raise ValueError(f"Radix {radix} needs {radix} digits")
+        # int() parses the standard alphabet, in either case
+        self.standard = self.digits == STANDARD_DIGITS[:radix]
+        self.bits = radix.bit_length() - 1 if radix & (radix - 1) == 0 else None
+        valid = self.digits + self.digits.lower() if self.standard else self.digits
+        self._invalid = str.maketrans('', '', valid)
+        self._valid_bytes = valid.encode('ascii')
+
+    def __eq__(self, other):
+        return (isinstance(other, Radix)
+                and (self.radix, self.digits) == (other.radix, other.digits))
+
+    def __hash__(self):
+        return hash((self.radix, self.digits))
+
+    def normalize(self, value):
+        """Validate a digit string and return it in canonical case"""
+        if not value or value.translate(self._invalid):
+            raise ValueError(f"Invalid digits for base {self.radix}")
+        return value.upper() if self.standard else value
+
+
+def _as_radix(radix):
+    return radix if isinstance(radix, Radix) else Radix(radix)
+
+
+def decimal_to_int(digits):
+    """Parse a string of decimal digits in subquadratic time"""
+    return _parse_non_pow2(digits, 10)
+
+
+def _parse_non_pow2(digits, radix):
+    """Parse standard digits by splitting them in half recursively"""
+    powers = {}
+
+    def power(exponent):
+        if exponent not in powers:
+            # 10**k is cheaper to build as 5**k shifted left
+            powers[exponent] = (5 ** exponent << exponent if radix == 10
+                                else radix ** exponent)
+        return powers[exponent]
+
+    def inner(start, end):
+        if end - start <= _PARSE_LEAF_DIGITS:
+            return int(digits[start:end], radix)
+        mid = (start + end + 1) >> 1
+        return inner(start, mid) * power(end - mid) + inner(mid, end)
+
+    return inner(0, len(digits))
+
+
+def int_to_decimal(number):
+    """Format a non-negative int as decimal digits in subquadratic time.
+
+    The value is rebuilt as a Decimal from binary halves so the expensive
+    multiplications run in libmpdec, which has fast large multiplication.
+    """
+    D = decimal.Decimal
+    powers = {}
+
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.Emin = decimal.MIN_EMIN
+        ctx.traps[decimal.Inexact] = True
+
+        def pow2(exponent):
+            if exponent not in powers:
+                powers[exponent] = D(2) ** exponent
+            return powers[exponent]
+
+        def inner(n, bits):
+            if bits <= _BINARY_LEAF_BITS:
+                return D(n)
+            half = bits >> 1
+            high = n >> half
+            low = n - (high << half)
+            return inner(high, bits - half) * pow2(half) + inner(low, half)
+
+        return str(inner(number, number.bit_length()))
+
+
+def _format_non_pow2(number, radix):
+    """Format a non-negative int in a non-power-of-two standard base"""
+    if radix.radix == 10:
+        return str(number) if number.bit_length() < _STR_MAX_BITS else int_to_decimal(number)
+
+    digits = radix.digits
+    base = radix.radix
+    powers = {}
+
+    def inner(n, width):
+        if width <= _FORMAT_LEAF_DIGITS:
+            out = []
+            for _ in range(width):
+                n, digit = divmod(n, base)
+                out.append(digits[digit])
+            return ''.join(reversed(out))
+        half = width >> 1
+        if half not in powers:
+            powers[half] = base ** half
+        high, low = divmod(n, powers[half])
+        return inner(high, width - half) + inner(low, half)
+
+    width = int(number.bit_length() / math.log2(base)) + 1
+    return inner(number, width).lstrip(digits[0]) or digits[0]
+
+
+def _digits_to_bytes(digits, radix):
+    """Pack power-of-two digits into bytes; len(digits) * bits must be a multiple of 8"""
+    if radix.radix == 16 and radix.standard:
+        return bytes.fromhex(digits)
+    if radix.radix == 64:
+        return base64.b64decode(digits, altchars=radix.digits[62:].encode('ascii'))
+    if radix.radix == 32:
+        if radix.standard:
+            digits = digits.translate(_STANDARD32_TO_BASE32)
+        return base64.b32decode(digits)
+    if not radix.standard:
+        digits = digits.translate(str.maketrans(radix.digits, STANDARD_DIGITS[:radix.radix]))
+    return int(digits, radix.radix).to_bytes(len(digits) * radix.bits // 8, 'big')
+
+
+def _bytes_to_digits(data, radix):
+    """Unpack bytes into power-of-two digits; len(data) * 8 must be a multiple of bits"""
+    if radix.radix == 64:
+        return base64.b64encode(data, altchars=radix.digits[62:].encode('ascii')).decode('ascii')
+    if radix.radix == 32:
+        digits = base64.b32encode(data).decode('ascii')
+        return digits.translate(_BASE32_TO_STANDARD32) if radix.standard else digits
+
+    if radix.radix == 16:
+        digits = data.hex().upper()
+    elif radix.radix == 4:
+        digits = data.hex().translate(_HEX_TO_BASE4)
+    elif radix.radix == 2:
+        digits = data.hex().translate(_HEX_TO_BASE2)
+    else:
+        digits = format(int.from_bytes(data, 'big'), f"0{len(data) * 8 // radix.bits}o")
+    if not radix.standard:
+        digits = digits.translate(str.maketrans(STANDARD_DIGITS[:radix.radix], radix.digits))
+    return digits
+
+
+def _chunk_bits(*radixes):
+    """Bits per chunk that splits evenly into bytes and every digit size"""
+    unit = math.lcm(8, *(radix.bits for radix in radixes))
+    return max(unit, _REGROUP_CHUNK_BITS // unit * unit)
+
+
+def regroup(digits, from_radix, to_radix):
+    """Convert digits between power-of-two bases without building one big int"""
+    from_radix, to_radix = _as_radix(from_radix), _as_radix(to_radix)
+    chunk_digits = _chunk_bits(from_radix, to_radix) // from_radix.bits
+    digits = from_radix.digits[0] * (-len(digits) % chunk_digits) + digits
+    result = ''.join(
+        _bytes_to_digits(_digits_to_bytes(digits[i:i + chunk_digits], from_radix), to_radix)
+        for i in range(0, len(digits), chunk_digits)
+    )
+    return result.lstrip(to_radix.digits[0]) or to_radix.digits[0]
+
+
+def parse_int(digits, radix):
+    """Parse normalized digits of any supported base into a non-negative int"""
+    radix = _as_radix(radix)
+    if radix.bits is None:
+        return _parse_non_pow2(digits, radix.radix)
+    if radix.standard:
+        # Power-of-two bases parse in linear time without a digit limit
+        return int(digits, radix.radix)
+    unit = _chunk_bits(radix) // radix.bits
+    digits = radix.digits[0] * (-len(digits) % unit) + digits
+    return int.from_bytes(_digits_to_bytes(digits, radix), 'big')
+
+
+def format_int(number, radix):
+    """Format an int in any supported base"""
+    radix = _as_radix(radix)
+    if number < 0:
+        return '-' + format_int(-number, radix)
+    if radix.standard and radix.radix in _FORMATS:
+        return format(number, _FORMATS[radix.radix])
+    if radix.bits is None:
+        return _format_non_pow2(number, radix)
+    unit_bytes = _chunk_bits(radix) // 8
+    length = max(1, -(-number.bit_length() // 8))
+    data = number.to_bytes(length + -length % unit_bytes, 'big')
+    return _bytes_to_digits(data, radix).lstrip(radix.digits[0]) or radix.digits[0]
+
+
+def convert(value, from_radix, to_radix):
+    """Convert a digit string of any length between two bases"""
+    from_radix, to_radix = _as_radix(from_radix), _as_radix(to_radix)
+    sign = ''
+    if value[:1] in ('-', '+') and value[0] not in from_radix.digits:
+        sign, value = value[0].replace('+', ''), value[1:]
+    value = from_radix.normalize(value)
+
+    if from_radix.bits and to_radix.bits:
+        result = regroup(value, from_radix, to_radix)
+    else:
+        result = format_int(parse_int(value, from_radix), to_radix)
+
+    if result == to_radix.digits[0]:
+        return result
+    return sign + result
+
+
+def _mapped_chunks(mapped, size, step=_READ_CHUNK_BYTES):
+    for start in range(0, size, step):
+        yield mapped[start:start + step]
+
+
+def _aligned(pieces, pad, chunk):
+    """Re-cut a stream of pieces into fixed-size chunks after a left pad"""
+    buffer = pad
+    for piece in pieces:
+        buffer += piece
+        if len(buffer) >= chunk:
+            cut = len(buffer) // chunk * chunk
+            for start in range(0, cut, chunk):
+                yield buffer[start:start + chunk]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def _strip_leading(pieces, zero):
+    """Drop leading zero digits across a stream of output pieces"""
+    leading = True
+    for piece in pieces:
+        if leading:
+            piece = piece.lstrip(zero)
+            if not piece:
+                continue
+            leading = False
+        yield piece
+    if leading:
+        yield zero
+
+
+def streams(from_radix, to_radix):
+    """Whether convert_file() converts a pair chunk by chunk rather than as one int"""
+    return bool(to_radix.bits and (from_radix is None or from_radix.bits))
+
+
+def convert_file(path, from_radix, to_radix):
+    """Convert a file of raw bytes (from_radix=None) or digit text to another base.
+
+    The file is memory-mapped and validated up front, then a generator of
+    output pieces is returned. Power-of-two base pairs are converted chunk
+    by chunk; other bases need the whole value as one int.
+    """
+    to_radix = _as_radix(to_radix)
+    from_radix = _as_radix(from_radix) if from_radix is not None else None
+    f = open(path, 'rb')
+    try:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            raise ValueError('Empty input')
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except BaseException:
+        f.close()
+        raise
+
+    try:
+        count = size
+        if from_radix is not None:
+            count = 0
+            for piece in _mapped_chunks(mapped, size):
+                piece = piece.translate(None, _WHITESPACE)
+                if piece.translate(None, from_radix._valid_bytes):
+                    raise ValueError(f"Invalid digits for base {from_radix.radix}")
+                count += len(piece)
+            if not count:
+                raise ValueError('Empty input')
+    except BaseException:
+        mapped.close()
+        f.close()
+        raise
+
+    return _generate_file(f, mapped, size, count, from_radix, to_radix)
+
+
+def _generate_file(f, mapped, size, count, from_radix, to_radix):
+    try:
+        if from_radix is None:
+            pieces = _mapped_chunks(mapped, size)
+        else:
+            pieces = (
+                piece.translate(None, _WHITESPACE).decode('ascii')
+                for piece in _mapped_chunks(mapped, size)
+            )
+            if from_radix.standard:
+                pieces = (piece.upper() for piece in pieces)
+
+        if streams(from_radix, to_radix):
+            if from_radix is None:
+                chunk_bits = _chunk_bits(to_radix)
+                chunk = chunk_bits // 8
+                pad = b'\0' * (-size % chunk)
+                convert_chunk = lambda data: _bytes_to_digits(data, to_radix)
+            else:
+                chunk_bits = _chunk_bits(from_radix, to_radix)
+                chunk = chunk_bits // from_radix.bits
+                pad = from_radix.digits[0] * (-count % chunk)
+                convert_chunk = lambda digits: _bytes_to_digits(
+                    _digits_to_bytes(digits, from_radix), to_radix)
+            output = (convert_chunk(piece) for piece in _aligned(pieces, pad, chunk))
+            yield from _strip_leading(output, to_radix.digits[0])
+            return
+
+        if from_radix is None:
+            number = int.from_bytes(mapped, 'big')
+        else:
+            number = parse_int(''.join(pieces), from_radix)
+        result = format_int(number, to_radix)
+        for start in range(0, len(result), _READ_CHUNK_BYTES):
+            yield result[start:start + _READ_CHUNK_BYTES]
+    finally:
+        mapped.close()
+        f.close()
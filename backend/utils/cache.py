@@ -0,0 +1,63 @@
+"""
+Bounded in-process LRU cache with hit, miss and eviction counters
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with an optional TTL in seconds"""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """Return (value, stored_at) for key, or None on a miss"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if self.ttl is None or time.monotonic() - entry[1] < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        """Store value under key, evicting the least recently used entries"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry; counters are kept"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Counters and size as a dict"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -1,6 +1,13 @@
 """
 Converter utilities for various conversion types
 """
+import array
+
+from backend.utils import bignum
+from backend.utils.bignum import Radix
+from backend.utils.expressions import CompoundUnits
+from backend.utils.rates import RateCache, StaticRateProvider
+from backend.utils.registry import UnitRegistry, numpy
 
 
 class LengthConverter:
@@ -20,13 +27,17 @@ class LengthConverter:
     @classmethod
     def convert(cls, value, from_unit, to_unit):
         """Convert length from one unit to another"""
-        if from_unit not in cls.CONVERSIONS or to_unit not in cls.CONVERSIONS:
-            raise ValueError(f"Invalid unit: {from_unit} or {to_unit}")
-        
-        # Convert to base unit (meter), then to target unit
-        base_value = value * cls.CONVERSIONS[from_unit]
-        result = base_value / cls.CONVERSIONS[to_unit]
-        return round(result, 6)
+        return registry.conversion('length', from_unit, to_unit).convert(value)
+    
+    @classmethod
+    def convert_many(cls, values, from_unit, to_unit):
+        """Convert many length values from one unit to another"""
+        return registry.conversion('length', from_unit, to_unit).convert_many(values)
+    
+    @classmethod
+    def convert_all(cls, values, from_unit):
+        """Convert length values into every unit; returns (units, rows)"""
+        return registry.convert_all('length', values, from_unit)
 
 
 class WeightConverter:
@@ -45,44 +56,61 @@ class WeightConverter:
     @classmethod
     def convert(cls, value, from_unit, to_unit):
         """Convert weight from one unit to another"""
-        if from_unit not in cls.CONVERSIONS or to_unit not in cls.CONVERSIONS:
-            raise ValueError(f"Invalid unit: {from_unit} or {to_unit}")
-        
-        base_value = value * cls.CONVERSIONS[from_unit]
-        result = base_value / cls.CONVERSIONS[to_unit]
-        return round(result, 6)
+        return registry.conversion('weight', from_unit, to_unit).convert(value)
+    
+    @classmethod
+    def convert_many(cls, values, from_unit, to_unit):
+        """Convert many weight values from one unit to another"""
+        return registry.conversion('weight', from_unit, to_unit).convert_many(values)
+    
+    @classmethod
+    def convert_all(cls, values, from_unit):
+        """Convert weight values into every unit; returns (units, rows)"""
+        return registry.convert_all('weight', values, from_unit)
 
 
 class TemperatureConverter:
     """Temperature unit converter"""
+    # Base unit: celsius, as (scale, offset) with celsius = value * scale + offset
+    CONVERSIONS = {
+        'celsius': (1.0, 0.0),
+        'fahrenheit': (5 / 9, -32 * 5 / 9),
+        'kelvin': (1.0, -273.15)
+    }
     
     @classmethod
     def convert(cls, value, from_unit, to_unit):
         """Convert temperature from one unit to another"""
-        valid_units = ['celsius', 'fahrenheit', 'kelvin']
-        if from_unit not in valid_units or to_unit not in valid_units:
-            raise ValueError(f"Invalid unit: {from_unit} or {to_unit}")
-        
+        conversion = registry.conversion('temperature', from_unit, to_unit)
         if from_unit == to_unit:
             return value
-        
-        # Convert to Celsius first
-        if from_unit == 'fahrenheit':
-            celsius = (value - 32) * 5 / 9
-        elif from_unit == 'kelvin':
-            celsius = value - 273.15
-        else:
-            celsius = value
-        
-        # Convert from Celsius to target
-        if to_unit == 'fahrenheit':
-            result = (celsius * 9 / 5) + 32
-        elif to_unit == 'kelvin':
-            result = celsius + 273.15
+        return conversion.convert(value)
+    
+    @classmethod
+    def convert_many(cls, values, from_unit, to_unit):
+        """Convert many temperature values from one unit to another"""
+        conversion = registry.conversion('temperature', from_unit, to_unit)
+        if from_unit == to_unit:
+            np = numpy()
+            if np is not None and isinstance(values, np.ndarray):
+                return values.astype(np.float64)
+            if isinstance(values, array.array):
+                return array.array('d', values)
+            return [float(value) for value in values]
+        return conversion.convert_many(values)
+    
+    @classmethod
+    def convert_all(cls, values, from_unit):
+        """Convert temperature values into every unit; returns (units, rows)"""
+        units, rows = registry.convert_all('temperature', values, from_unit)
+        # Same-unit results are the unrounded input, as in convert()
+        column = units.index(from_unit)
+        if isinstance(rows, list):
+            for row, value in zip(rows, values):
+                row[column] = float(value)
         else:
-            result = celsius
-        
-        return round(result, 6)
+            rows[:, column] = values
+        return units, rows
 
 
 class VolumeConverter:
@@ -103,17 +131,22 @@ class VolumeConverter:
     @classmethod
     def convert(cls, value, from_unit, to_unit):
         """Convert volume from one unit to another"""
-        if from_unit not in cls.CONVERSIONS or to_unit not in cls.CONVERSIONS:
-            raise ValueError(f"Invalid unit: {from_unit} or {to_unit}")
-        
-        base_value = value * cls.CONVERSIONS[from_unit]
-        result = base_value / cls.CONVERSIONS[to_unit]
-        return round(result, 6)
+        return registry.conversion('volume', from_unit, to_unit).convert(value)
+    
+    @classmethod
+    def convert_many(cls, values, from_unit, to_unit):
+        """Convert many volume values from one unit to another"""
+        return registry.conversion('volume', from_unit, to_unit).convert_many(values)
+    
+    @classmethod
+    def convert_all(cls, values, from_unit):
+        """Convert volume values into every unit; returns (units, rows)"""
+        return registry.convert_all('volume', values, from_unit)
 
 
 class CurrencyConverter:
-    """Currency converter with mock exchange rates"""
-    # Mock exchange rates (base: USD)
+    """Currency converter backed by the rate cache"""
+    # Mock exchange rates (base: USD), used until a rate provider is configured
     EXCHANGE_RATES = {
         'USD': 1.0,
         'EUR': 0.85,
@@ -128,46 +161,114 @@ class CurrencyConverter:
     }
     
     @classmethod
-    def convert(cls, value, from_currency, to_currency):
-        """Convert currency from one to another"""
-        if from_currency not in cls.EXCHANGE_RATES or to_currency not in cls.EXCHANGE_RATES:
-            raise ValueError(f"Invalid currency: {from_currency} or {to_currency}")
-        
-        # Convert to USD first, then to target currency
-        usd_value = value / cls.EXCHANGE_RATES[from_currency]
-        result = usd_value * cls.EXCHANGE_RATES[to_currency]
-        return round(result, 2)
+    def convert(cls, value, from_currency, to_currency, snapshot=None):
+        """Convert currency from one to another using the given or current rates"""
+        snapshot = snapshot or rate_cache.snapshot()
+        return snapshot.conversion(from_currency, to_currency).convert(value)
+    
+    @classmethod
+    def convert_many(cls, values, from_currency, to_currency, snapshot=None):
+        """Convert many amounts from one currency to another"""
+        snapshot = snapshot or rate_cache.snapshot()
+        return snapshot.conversion(from_currency, to_currency).convert_many(values)
+    
+    @classmethod
+    def convert_all(cls, values, from_currency, snapshot=None):
+        """Convert amounts into every currency; returns (currencies, rows)"""
+        snapshot = snapshot or rate_cache.snapshot()
+        return snapshot.convert_all(values, from_currency)
+
+
+class CompoundConverter:
+    """Converter between compound unit expressions such as km/h and m/s"""
+    
+    @classmethod
+    def convert(cls, value, from_unit, to_unit):
+        """Convert a value between two unit expressions of the same dimensions"""
+        return compound_units.plan(from_unit, to_unit).convert(value)
+    
+    @classmethod
+    def convert_many(cls, values, from_unit, to_unit):
+        """Convert many values between two unit expressions"""
+        return compound_units.plan(from_unit, to_unit).convert_many(values)
 
 
 class NumberBaseConverter:
-    """Number base converter (binary, decimal, hex, octal)"""
+    """Number base converter for any radix from 2 to 36 and base32/base64 alphabets"""
+    RADIXES = {
+        'binary': Radix(2),
+        'decimal': Radix(10),
+        'hexadecimal': Radix(16),
+        'octal': Radix(8),
+        'base32': Radix(32, bignum.BASE32_DIGITS),
+        'base64': Radix(64, bignum.BASE64_DIGITS),
+        'base64url': Radix(64, bignum.BASE64URL_DIGITS)
+    }
+    # Radixes 2-36 may also be given by number, using digits 0-9 and A-Z
+    RADIXES.update({str(radix): Radix(radix) for radix in range(2, 37)})
+    BASES = list(RADIXES)[:7]
+    # Longer inputs take the big-number path, which has no digit limit
+    LARGE_INPUT_DIGITS = 3000
+    
+    @classmethod
+    def radix(cls, base):
+        """Return the Radix for a base name or number, or None if unknown"""
+        if isinstance(base, int) and not isinstance(base, bool):
+            base = str(base)
+        return cls.RADIXES.get(base) if isinstance(base, str) else None
     
     @classmethod
     def convert(cls, value, from_base, to_base):
         """Convert number from one base to another"""
-        valid_bases = ['binary', 'decimal', 'hexadecimal', 'octal']
-        if from_base not in valid_bases or to_base not in valid_bases:
+        from_radix = cls.radix(from_base)
+        to_radix = cls.radix(to_base)
+        if from_radix is None or to_radix is None:
             raise ValueError(f"Invalid base: {from_base} or {to_base}")
         
-        # Convert to decimal first
-        if from_base == 'binary':
-            decimal = int(value, 2)
-        elif from_base == 'hexadecimal':
-            decimal = int(value, 16)
-        elif from_base == 'octal':
-            decimal = int(value, 8)
-        else:
-            decimal = int(value)
-        
-        # Convert from decimal to target base
-        if to_base == 'binary':
-            result = bin(decimal)[2:]
-        elif to_base == 'hexadecimal':
-            result = hex(decimal)[2:].upper()
-        elif to_base == 'octal':
-            result = oct(decimal)[2:]
-        else:
-            result = str(decimal)
-        
-        return result
+        if len(value) > cls.LARGE_INPUT_DIGITS or not from_radix.standard:
+            return bignum.convert(value, from_radix, to_radix)
+        # Same digit rules as the big-number path: int() alone would also
+        # take prefixes like 0x, underscores and surrounding whitespace
+        from_radix.normalize(value[1:] if value[:1] in ('-', '+') else value)
+        return bignum.format_int(int(value, from_radix.radix), to_radix)
+    
+    @classmethod
+    def convert_file(cls, path, from_base, to_base):
+        """Convert a file of raw bytes (from_base='bytes') or digits, returning a generator of output pieces"""
+        return bignum.convert_file(path, *cls._file_radixes(from_base, to_base))
+    
+    @classmethod
+    def streams_file(cls, from_base, to_base):
+        """Whether convert_file() works chunk by chunk; other pairs hold the whole file as one number"""
+        return bignum.streams(*cls._file_radixes(from_base, to_base))
+    
+    @classmethod
+    def _file_radixes(cls, from_base, to_base):
+        from_radix = None if from_base == 'bytes' else cls.radix(from_base)
+        to_radix = cls.radix(to_base)
+        if from_base != 'bytes' and from_radix is None or to_radix is None:
+            raise ValueError(f"Invalid base: {from_base} or {to_base}")
+        return from_radix, to_radix
+
+
+# Built once at import time; adding a unit to one of the tables above is
+# all it takes to make it available everywhere.
+registry = UnitRegistry()
+registry.register_linear('length', LengthConverter.CONVERSIONS, 6)
+registry.register_linear('weight', WeightConverter.CONVERSIONS, 6)
+registry.register_affine('temperature', TemperatureConverter.CONVERSIONS, 6)
+registry.register_linear('volume', VolumeConverter.CONVERSIONS, 6)
+registry.register_linear('currency', CurrencyConverter.EXCHANGE_RATES, 2,
+                         noun='currency', inverse=True)
+registry.register('number_base', NumberBaseConverter.BASES, noun='base')
+
+# Expressions over the length, weight and volume tables plus time units
+compound_units = CompoundUnits.from_tables(LengthConverter.CONVERSIONS, WeightConverter.CONVERSIONS,
+                                           VolumeConverter.CONVERSIONS)
 
+# Currency rates can change at runtime; keep the registry's table in step
+rate_cache = RateCache(StaticRateProvider(CurrencyConverter.EXCHANGE_RATES))
+rate_cache.subscribe(
+    lambda snapshot: registry.register_linear('currency', snapshot.rates, 2,
+                                              noun='currency', inverse=True)
+)
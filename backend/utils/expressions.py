@@ -0,0 +1,200 @@
+"""
+Compound unit expressions such as km/h, ft^2 or gallon/mile
+
+An expression is a product of unit names, each optionally raised to an
+integer power, with '*' and '/' between them and parentheses for grouping:
+'kg*m/s^2', 'm/(s*s)', '1/hour'. Units are measured in the SI base units
+meter, kilogram and second, so any two expressions with the same dimensions
+convert with a single scale factor.
+"""
+import math
+import re
+
+from backend.utils.cache import LRUCache
+from backend.utils.registry import Conversion
+
+# Exponents of (length, mass, time)
+DIMENSIONS = ('length', 'mass', 'time')
+DIMENSIONLESS = (0, 0, 0)
+
+# Base unit: second
+TIME_UNITS = {
+    'second': 1.0,
+    'minute': 60.0,
+    'hour': 3600.0,
+    'day': 86400.0,
+    'week': 604800.0
+}
+
+# Short names, resolved before the full unit names
+SYMBOLS = {
+    'm': 'meter', 'km': 'kilometer', 'cm': 'centimeter', 'mm': 'millimeter',
+    'mi': 'mile', 'yd': 'yard', 'ft': 'foot', 'feet': 'foot', 'in': 'inch', 'inches': 'inch',
+    'kg': 'kilogram', 'g': 'gram', 'mg': 'milligram', 'lb': 'pound', 'lbs': 'pound',
+    'oz': 'ounce', 't': 'ton', 'st': 'stone',
+    'l': 'liter', 'L': 'liter', 'ml': 'milliliter', 'mL': 'milliliter', 'gal': 'gallon',
+    'qt': 'quart', 'pt': 'pint', 'floz': 'fluid_ounce', 'cc': 'cubic_centimeter',
+    's': 'second', 'sec': 'second', 'min': 'minute', 'h': 'hour', 'hr': 'hour', 'd': 'day',
+    'wk': 'week'
+}
+
+# Deepest parenthesis nesting parse() accepts, well inside the recursion limit
+MAX_DEPTH = 64
+
+_TOKEN = re.compile(r'\s*(?:([A-Za-z_]+)|(-?\d+)|(\*\*|[*/^()·]))')
+
+
+class CompoundUnits:
+    """Parses unit expressions and compiles pairs of them into cached conversions.
+
+    units maps each unit name to (size in base units, dimensions). Compiled
+    plans are registry Conversion objects, kept in an LRU keyed on the two
+    expression strings, so a repeated pair skips parsing entirely.
+    """
+
+    def __init__(self, units, ndigits=6, cache_size=1024):
+        self.units = dict(units)
+        self.ndigits = ndigits
+        self.plans = LRUCache(cache_size)
+
+    @classmethod
+    def from_tables(cls, length, weight, volume, time=TIME_UNITS, **kwargs):
+        """Build from factor tables in meters, kilograms, liters and seconds"""
+        units = {}
+        units.update((name, (size, (1, 0, 0))) for name, size in length.items())
+        units.update((name, (size, (0, 1, 0))) for name, size in weight.items())
+        # A liter is a thousandth of a cubic meter
+        units.update((name, (size / 1000, (3, 0, 0))) for name, size in volume.items())
+        units.update((name, (size, (0, 0, 1))) for name, size in time.items())
+        return cls(units, **kwargs)
+
+    def plan(self, from_expression, to_expression):
+        """Return the compiled conversion between two expressions"""
+        key = (from_expression, to_expression)
+        entry = self.plans.get(key)
+        if entry is not None:
+            return entry[0]
+
+        from_scale, from_dims = self.parse(from_expression)
+        to_scale, to_dims = self.parse(to_expression)
+        if from_dims != to_dims:
+            raise ValueError(f"Cannot convert {from_expression} ({describe(from_dims)}) "
+                             f"to {to_expression} ({describe(to_dims)})")
+        scale = _checked(lambda: from_scale / to_scale, f"{from_expression} to {to_expression}")
+        conversion = Conversion(scale, 0.0, self.ndigits)
+        self.plans.set(key, conversion)
+        return conversion
+
+    def convert(self, value, from_expression, to_expression):
+        """Convert a value from one expression to another"""
+        return self.plan(from_expression, to_expression).convert(value)
+
+    def convert_many(self, values, from_expression, to_expression):
+        """Convert many values from one expression to another"""
+        return self.plan(from_expression, to_expression).convert_many(values)
+
+    def parse(self, expression):
+        """Return (scale in base units, dimensions) of an expression"""
+        if not isinstance(expression, str):
+            raise ValueError(f"Invalid unit expression: {expression!r}")
+        tokens = _tokenize(expression)
+        scale, dims, position = self._product(tokens, 0, expression)
+        if position != len(tokens):
+            raise ValueError(f"Unexpected '{tokens[position]}' in unit expression: {expression}")
+        return scale, dims
+
+    def _product(self, tokens, position, expression, depth=0):
+        # product := power (('*' | '/') power)*
+        scale, dims, position = self._power(tokens, position, expression, depth)
+        while position < len(tokens) and tokens[position] in ('*', '/', '·'):
+            operator = tokens[position]
+            factor_scale, factor_dims, position = self._power(tokens, position + 1, expression, depth)
+            if operator == '/':
+                scale = _checked(lambda: scale / factor_scale, expression)
+                dims = tuple(a - b for a, b in zip(dims, factor_dims))
+            else:
+                scale = _checked(lambda: scale * factor_scale, expression)
+                dims = tuple(a + b for a, b in zip(dims, factor_dims))
+        return scale, dims, position
+
+    def _power(self, tokens, position, expression, depth):
+        # power := atom (('^' | '**') integer)?
+        scale, dims, position = self._atom(tokens, position, expression, depth)
+        if position < len(tokens) and tokens[position] in ('^', '**'):
+            exponent = tokens[position + 1] if position + 1 < len(tokens) else None
+            if exponent is None or not exponent.lstrip('-').isdigit():
+                raise ValueError(f"Exponent must be an integer in unit expression: {expression}")
+            exponent = int(exponent)
+            scale = _checked(lambda: scale ** exponent, expression)
+            dims = tuple(d * exponent for d in dims)
+            position += 2
+        return scale, dims, position
+
+    def _atom(self, tokens, position, expression, depth):
+        # atom := unit | '1' | '(' product ')'
+        if position >= len(tokens):
+            raise ValueError(f"Incomplete unit expression: {expression}")
+        token = tokens[position]
+        if token == '(':
+            if depth >= MAX_DEPTH:
+                raise ValueError(f"Unit expression nested too deeply (more than {MAX_DEPTH} levels)")
+            scale, dims, position = self._product(tokens, position + 1, expression, depth + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError(f"Missing ')' in unit expression: {expression}")
+            return scale, dims, position + 1
+        if token == '1':
+            return 1.0, DIMENSIONLESS, position + 1
+        unit = self._lookup(token)
+        if unit is None:
+            raise ValueError(f"Unknown unit '{token}' in unit expression: {expression}")
+        return unit[0], unit[1], position + 1
+
+    def _lookup(self, name):
+        name = SYMBOLS.get(name, name)
+        unit = self.units.get(name)
+        if unit is None and name.endswith('s'):
+            # Plurals: meters, hours, gallons
+            unit = self.units.get(name[:-1])
+        return unit
+
+
+def _checked(compute, expression):
+    """Scale arithmetic that stays a finite, non-zero float or raises ValueError"""
+    try:
+        scale = compute()
+    except (OverflowError, ZeroDivisionError):
+        scale = 0.0
+    if scale == 0 or not math.isfinite(scale):
+        raise ValueError(f"Unit expression out of range: {expression}")
+    return scale
+
+
+def _tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            character = expression[position:].lstrip()[:1]
+            raise ValueError(f"Unexpected '{character}' in unit expression: {expression}")
+        tokens.append(match.group(match.lastindex))
+        position = match.end()
+    if not tokens:
+        raise ValueError('Unit expression is empty')
+    return tokens
+
+
+def describe(dims):
+    """Readable dimensions, e.g. 'length/time' or 'length^3'"""
+    def term(name, exponent):
+        return name if exponent == 1 else f"{name}^{exponent}"
+
+    numerator = [term(name, e) for name, e in zip(DIMENSIONS, dims) if e > 0]
+    denominator = [term(name, -e) for name, e in zip(DIMENSIONS, dims) if e < 0]
+    if not numerator and not denominator:
+        return 'dimensionless'
+    text = '*'.join(numerator) or '1'
+    if denominator:
+        text += '/' + ('*'.join(denominator) if len(denominator) == 1 else f"({'*'.join(denominator)})")
+    return text
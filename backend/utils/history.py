@@ -0,0 +1,155 @@
+"""
+Historical currency rates stored as memory-mapped, append-only files
+"""
+import bisect
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime, timezone
+
+from backend.utils.registry import Conversion
+
+# One record per rate: UTC timestamp in seconds, units of the currency per USD
+RECORD = struct.Struct('<qd')
+BASE_CURRENCY = 'USD'
+
+
+def parse_as_of(value):
+    """Parse an ISO date or datetime into a UTC timestamp in seconds"""
+    if not isinstance(value, str):
+        raise TypeError(f"Invalid as_of date: {value}")
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid as_of date: {value}") from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+class _Timestamps:
+    """Read-only sequence view of the timestamps in a mapped rate file"""
+
+    def __init__(self, buffer, count):
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return RECORD.unpack_from(self._buffer, index * RECORD.size)[0]
+
+
+class _RateSeries:
+    """Memory-mapped rate history of one currency, sorted by timestamp"""
+
+    def __init__(self, path):
+        self.path = path
+        self._mapped = (None, 0)
+        self.remap()
+
+    def remap(self):
+        """Map the file again after it has grown.
+
+        The (map, count) pair is swapped as one reference; the old map is left
+        for garbage collection so concurrent readers never see it closed.
+        """
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size % RECORD.size:
+            raise ValueError(f"Corrupt rate file {self.path}: size {size} is not a whole number of records")
+
+        rate_map = None
+        if size:
+            with open(self.path, 'rb') as f:
+                rate_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mapped = (rate_map, size // RECORD.size)
+
+    def last_timestamp(self):
+        rate_map, count = self._mapped
+        if not count:
+            return None
+        return RECORD.unpack_from(rate_map, (count - 1) * RECORD.size)[0]
+
+    def rate_as_of(self, timestamp):
+        """Return the latest rate at or before timestamp, or None"""
+        rate_map, count = self._mapped
+        if not count:
+            return None
+        index = bisect.bisect_right(_Timestamps(rate_map, count), timestamp)
+        if not index:
+            return None
+        return RECORD.unpack_from(rate_map, (index - 1) * RECORD.size)[1]
+
+    def close(self):
+        rate_map = self._mapped[0]
+        self._mapped = (None, 0)
+        if rate_map is not None:
+            rate_map.close()
+
+
+class HistoricalRateStore:
+    """Time series of exchange rates with as-of lookups by binary search.
+
+    Each currency lives in its own <CODE>.rates file of fixed-size
+    (timestamp, rate) records appended in time order, so lookups read the
+    mapped file directly instead of loading it into Python objects.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._series = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        for name in sorted(os.listdir(directory)):
+            currency, ext = os.path.splitext(name)
+            if ext == '.rates':
+                self._series[currency] = _RateSeries(os.path.join(directory, name))
+
+    def currencies(self):
+        """Currencies that have any history"""
+        return list(self._series)
+
+    def append(self, currency, timestamp, rate):
+        """Append a rate; timestamps must increase for each currency"""
+        if not currency.isalnum():
+            raise ValueError(f"Invalid currency: {currency}")
+        rate = float(rate)
+        if rate <= 0:
+            raise ValueError(f"Invalid rate for {currency}: {rate}")
+
+        with self._lock:
+            series = self._series.get(currency)
+            if series is None:
+                series = _RateSeries(os.path.join(self.directory, f"{currency}.rates"))
+            last = series.last_timestamp()
+            if last is not None and timestamp <= last:
+                raise ValueError(f"Timestamp {timestamp} for {currency} is not after {last}")
+
+            with open(series.path, 'ab') as f:
+                f.write(RECORD.pack(timestamp, rate))
+            series.remap()
+            self._series[currency] = series
+
+    def rate_as_of(self, currency, timestamp):
+        """Return the rate of a currency in effect at timestamp"""
+        series = self._series.get(currency)
+        rate = series.rate_as_of(timestamp) if series is not None else None
+        if rate is None:
+            if currency == BASE_CURRENCY:
+                return 1.0
+            raise ValueError(f"No rate for {currency} as of {timestamp}")
+        return rate
+
+    def conversion(self, from_currency, to_currency, as_of):
+        """Return a Conversion using the rates in effect at as_of"""
+        timestamp = parse_as_of(as_of) if not isinstance(as_of, int) else as_of
+        from_rate = self.rate_as_of(from_currency, timestamp)
+        to_rate = self.rate_as_of(to_currency, timestamp)
+        return Conversion(to_rate / from_rate, 0.0, 2)
+
+    def close(self):
+        """Unmap every rate file"""
+        for series in self._series.values():
+            series.close()
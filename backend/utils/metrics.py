@@ -0,0 +1,218 @@
+"""
+Request and conversion metrics rendered in the Prometheus text format
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from backend.utils.admission import OUTCOMES
+
+# Upper bounds in seconds of the request latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Shard:
+    """Counters written by a single thread"""
+
+    __slots__ = ('requests', 'latencies', 'conversions', 'truncated_bytes')
+
+    def __init__(self):
+        self.requests = {}      # (endpoint, method, status) -> count
+        self.latencies = {}     # endpoint -> [count per bucket..., +Inf count, sum]
+        self.conversions = {}   # category -> count
+        self.truncated_bytes = 0
+
+
+class Metrics:
+    """Per-thread counter shards merged when scraped.
+
+    Each thread only ever writes its own shard, so recording takes no lock;
+    render() sums copies of every shard. A lock is taken once per thread,
+    when its shard is created.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+        # Latency bucket counts at the start of the current and previous windows
+        self._window_start = time.monotonic()
+        self._window_base = None
+        self._recent_base = None
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def observe_request(self, endpoint, method, status, seconds):
+        """Count a finished request and add its latency to the histogram"""
+        shard = self._shard()
+        key = (endpoint, method, status)
+        shard.requests[key] = shard.requests.get(key, 0) + 1
+
+        histogram = shard.latencies.get(endpoint)
+        if histogram is None:
+            histogram = shard.latencies[endpoint] = [0] * (len(self.buckets) + 2)
+        histogram[bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def count_conversion(self, category, count=1):
+        """Count conversions served for a converter category"""
+        conversions = self._shard().conversions
+        conversions[category] = conversions.get(category, 0) + count
+
+    def count_truncated(self, nbytes):
+        """Count bytes of a partial trailing value dropped from a binary body"""
+        self._shard().truncated_bytes += nbytes
+
+    def truncated_bytes(self):
+        """Total bytes counted by count_truncated()"""
+        with self._lock:
+            shards = list(self._shards)
+        return sum(shard.truncated_bytes for shard in shards)
+
+    def snapshot(self):
+        """Merged counters as (requests, latencies, conversions) dicts"""
+        requests, latencies, conversions = {}, {}, {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # dict.copy() is atomic with respect to the owning thread's writes
+            for key, count in shard.requests.copy().items():
+                requests[key] = requests.get(key, 0) + count
+            for endpoint, histogram in shard.latencies.copy().items():
+                merged = latencies.setdefault(endpoint, [0] * len(histogram))
+                for index, value in enumerate(list(histogram)):
+                    merged[index] += value
+            for category, count in shard.conversions.copy().items():
+                conversions[category] = conversions.get(category, 0) + count
+        return requests, latencies, conversions
+
+    def recent_latency_quantile(self, quantile, window=30.0, exclude=()):
+        """Latency at a quantile over the requests of the last one to two windows.
+
+        Returns the upper bound of the histogram bucket holding the quantile
+        (inf for the overflow bucket), or None without recent requests. The
+        cost depends on the number of threads, endpoints and buckets, not on
+        the traffic. Endpoints in exclude are left out.
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for endpoint, histogram in shard.latencies.copy().items():
+                if endpoint not in exclude:
+                    for index, value in enumerate(histogram[:-1]):
+                        counts[index] += value
+
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= window:
+                self._recent_base = self._window_base
+                self._window_base = counts
+                self._window_start = now
+            base = self._recent_base
+
+        if base is not None:
+            counts = [count - before for count, before in zip(counts, base)]
+        total = sum(counts)
+        if not total:
+            return None
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += count
+            if cumulative >= quantile * total:
+                return bound
+        return float('inf')
+
+    def render(self, cache=None, admission=None):
+        """Prometheus text exposition of every metric"""
+        requests, latencies, conversions = self.snapshot()
+        lines = [
+            '# HELP converter_http_requests_total HTTP requests by endpoint, method and status code.',
+            '# TYPE converter_http_requests_total counter',
+        ]
+        for (endpoint, method, status), count in sorted(requests.items()):
+            lines.append(f'converter_http_requests_total{{endpoint="{_escape(endpoint)}",'
+                         f'method="{method}",status="{status}"}} {count}')
+
+        errors = {}
+        for (endpoint, _, status), count in requests.items():
+            if status >= 400:
+                errors[(endpoint, status)] = errors.get((endpoint, status), 0) + count
+        lines += [
+            '# HELP converter_http_request_errors_total HTTP responses with a 4xx or 5xx status code.',
+            '# TYPE converter_http_request_errors_total counter',
+        ]
+        for (endpoint, status), count in sorted(errors.items()):
+            lines.append(f'converter_http_request_errors_total{{endpoint="{_escape(endpoint)}",'
+                         f'status="{status}"}} {count}')
+
+        lines += [
+            '# HELP converter_http_request_duration_seconds Time to produce a response.',
+            '# TYPE converter_http_request_duration_seconds histogram',
+        ]
+        for endpoint, histogram in sorted(latencies.items()):
+            label = _escape(endpoint)
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), histogram):
+                cumulative += count
+                lines.append(f'converter_http_request_duration_seconds_bucket{{endpoint="{label}",'
+                             f'le="{bound}"}} {cumulative}')
+            lines.append(f'converter_http_request_duration_seconds_sum{{endpoint="{label}"}} {histogram[-1]}')
+            lines.append(f'converter_http_request_duration_seconds_count{{endpoint="{label}"}} {cumulative}')
+
+        lines += [
+            '# HELP converter_conversions_total Conversions served by converter category.',
+            '# TYPE converter_conversions_total counter',
+        ]
+        for category, count in sorted(conversions.items()):
+            lines.append(f'converter_conversions_total{{category="{category}"}} {count}')
+        lines += [
+            '# HELP converter_binary_truncated_bytes_total Bytes of partial trailing values dropped from binary bodies.',
+            '# TYPE converter_binary_truncated_bytes_total counter',
+            f'converter_binary_truncated_bytes_total {self.truncated_bytes()}',
+        ]
+
+        if cache is not None:
+            stats = cache.stats()
+            for name in ('hits', 'misses', 'evictions'):
+                lines += [
+                    f'# HELP converter_result_cache_{name}_total Result cache {name}.',
+                    f'# TYPE converter_result_cache_{name}_total counter',
+                    f'converter_result_cache_{name}_total {stats[name]}',
+                ]
+            lines += [
+                '# HELP converter_result_cache_size Entries in the result cache.',
+                '# TYPE converter_result_cache_size gauge',
+                f'converter_result_cache_size {stats["size"]}',
+            ]
+
+        if admission is not None:
+            stats = admission.stats()
+            lines += [
+                '# HELP converter_admission_decisions_total Admission decisions by outcome.',
+                '# TYPE converter_admission_decisions_total counter',
+            ]
+            for outcome in OUTCOMES:
+                lines.append(f'converter_admission_decisions_total{{outcome="{outcome}"}} {stats[outcome]}')
+            if stats['limit'] is not None:
+                for name, help_text in (('active', 'Requests holding a concurrency slot.'),
+                                        ('waiting', 'Requests waiting for a concurrency slot.'),
+                                        ('limit', 'Maximum concurrent requests.')):
+                    lines += [
+                        f'# HELP converter_admission_{name} {help_text}',
+                        f'# TYPE converter_admission_{name} gauge',
+                        f'converter_admission_{name} {stats[name]}',
+                    ]
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
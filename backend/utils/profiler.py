@@ -0,0 +1,144 @@
+"""
+Sampling request profiler with per-route aggregation
+"""
+import cProfile
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+from collections import Counter
+
+PROFILER_MODES = ('cprofile', 'stack')
+
+
+class RequestProfiler:
+    """Profiles a random fraction of requests and aggregates them per route.
+
+    In 'cprofile' mode each sampled request runs under cProfile and the
+    results are dumped as <route>.pstats files. In 'stack' mode a helper
+    thread samples the request thread's stack every interval seconds and
+    the counts are dumped as <route>.collapsed files, one 'frame;frame count'
+    line per stack, ready for flamegraph.pl or speedscope.
+
+    At most one request is profiled at a time, so the overhead stays bounded
+    whatever the traffic. With a sample rate of 0 nothing is recorded. From
+    Python 3.12 cProfile hooks the whole interpreter, so calls made by other
+    threads during a sampled request are counted too; 'stack' mode only ever
+    looks at the request's own thread.
+    """
+
+    def __init__(self, directory, sample_rate=0.0, mode='cprofile', interval=0.001):
+        self.directory = directory
+        self.interval = interval
+        self.configure(sample_rate, mode)
+        self.profiled = 0
+        self._busy = threading.Lock()
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._stacks = {}
+
+    def configure(self, sample_rate=None, mode=None):
+        """Change the sample rate or mode at runtime"""
+        if sample_rate is not None:
+            sample_rate = float(sample_rate)
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError(f"Invalid sample rate: {sample_rate}")
+            self.sample_rate = sample_rate
+        if mode is not None:
+            if mode not in PROFILER_MODES:
+                raise ValueError(f"Invalid profiler mode: {mode}")
+            self.mode = mode
+
+    def start(self):
+        """Start profiling the current request if it is sampled; returns a token or None"""
+        if not self.sample_rate or random.random() >= self.sample_rate:
+            return None
+        if not self._busy.acquire(blocking=False):
+            return None
+
+        if self.mode == 'cprofile':
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (e.g. a debugger) already owns the hook
+                self._busy.release()
+                return None
+            return ('cprofile', profile)
+
+        stop = threading.Event()
+        stacks = Counter()
+        sampler = threading.Thread(target=self._sample, args=(threading.get_ident(), stop, stacks),
+                                   name='request-profiler', daemon=True)
+        sampler.start()
+        return ('stack', (sampler, stop, stacks))
+
+    def stop(self, token, route):
+        """Stop profiling and add the results to the route's aggregate"""
+        mode, state = token
+        try:
+            if mode == 'cprofile':
+                state.disable()
+                with self._lock:
+                    stats = self._stats.get(route)
+                    if stats is None:
+                        self._stats[route] = pstats.Stats(state)
+                    else:
+                        stats.add(state)
+            else:
+                sampler, stop, stacks = state
+                stop.set()
+                sampler.join()
+                with self._lock:
+                    self._stacks.setdefault(route, Counter()).update(stacks)
+            self.profiled += 1
+        finally:
+            self._busy.release()
+
+    def _sample(self, thread_id, stop, stacks):
+        while True:
+            frame = sys._current_frames().get(thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                stacks[';'.join(reversed(names))] += 1
+            if stop.wait(self.interval):
+                return
+
+    def routes(self):
+        """Routes with profile data"""
+        with self._lock:
+            return sorted(set(self._stats) | set(self._stacks))
+
+    def dump(self):
+        """Write the aggregates to the directory and return the file paths"""
+        os.makedirs(self.directory, exist_ok=True)
+        paths = []
+        with self._lock:
+            for route, stats in self._stats.items():
+                path = os.path.join(self.directory, f"{_file_name(route)}.pstats")
+                stats.dump_stats(path)
+                paths.append(path)
+            for route, stacks in self._stacks.items():
+                path = os.path.join(self.directory, f"{_file_name(route)}.collapsed")
+                with open(path, 'w', encoding='utf-8') as f:
+                    for stack, count in stacks.most_common():
+                        f.write(f"{stack} {count}\n")
+                paths.append(path)
+        return sorted(paths)
+
+    def reset(self):
+        """Drop the aggregated results"""
+        with self._lock:
+            self._stats.clear()
+            self._stacks.clear()
+            self.profiled = 0
+
+
+def _file_name(route):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', route).strip('_') or 'root'
@@ -0,0 +1,220 @@
+"""
+Currency rate providers and the in-process rate cache
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+
+from backend.utils.registry import UnitRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class RateProvider:
+    """Source of exchange rates, quoted as units of each currency per USD"""
+
+    def fetch(self):
+        """Return a dict of currency code to rate"""
+        raise NotImplementedError
+
+
+class StaticRateProvider(RateProvider):
+    """Provider that always returns the same rates (local stand-in and tests)"""
+
+    def __init__(self, rates):
+        self.rates = dict(rates)
+
+    def fetch(self):
+        return dict(self.rates)
+
+
+class FileRateProvider(RateProvider):
+    """Provider that reads rates from a JSON file such as {"USD": 1.0, "EUR": 0.85}"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def fetch(self):
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or not data:
+            raise ValueError(f"Rates file {self.path} must contain a non-empty object")
+
+        rates = {}
+        for currency, rate in data.items():
+            rate = float(rate)
+            if rate <= 0:
+                raise ValueError(f"Invalid rate for {currency}: {rate}")
+            rates[currency] = rate
+        return rates
+
+
+class RateSnapshot:
+    """Immutable set of rates with its own compiled conversions"""
+
+    def __init__(self, rates, version, fetched_at):
+        self.rates = rates
+        self.version = version
+        self.fetched_at = fetched_at
+        self._registry = UnitRegistry()
+        self._registry.register_linear('currency', rates, 2, noun='currency', inverse=True)
+
+    @property
+    def age(self):
+        """Seconds since the rates were fetched"""
+        return time.time() - self.fetched_at
+
+    def conversion(self, from_currency, to_currency):
+        """Return the compiled conversion for a currency pair"""
+        return self._registry.conversion('currency', from_currency, to_currency)
+
+    def convert_all(self, values, from_currency):
+        """Convert amounts into every currency, see UnitRegistry.convert_all()"""
+        return self._registry.convert_all('currency', values, from_currency)
+
+    def table(self):
+        """Pairwise conversion table of these rates, see UnitRegistry.table()"""
+        return self._registry.table('currency')
+
+
+class RateCache:
+    """Holds the current RateSnapshot and refreshes it in a background thread.
+
+    Readers call snapshot() and get a consistent set of rates without taking
+    a lock; refreshes build a new snapshot and swap the reference.
+
+    After share(), refreshes are also written to a SharedRateTable, and every
+    process forked from this one picks them up in snapshot() by checking the
+    table's sequence word, so only one process ever fetches rates.
+
+    Threads do not survive fork(), so a process forked while the refresh
+    thread runs (a preloading gunicorn master's workers) starts its own,
+    unless it follows a shared table instead.
+    """
+
+    def __init__(self, provider, ttl=300):
+        self.provider = provider
+        self.ttl = ttl
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._snapshot = RateSnapshot(provider.fetch(), 1, time.time())
+        self._table = None
+        self._sequence = None
+        if hasattr(os, 'register_at_fork'):
+            # Weak, so the fork hook does not keep discarded caches alive
+            os.register_at_fork(after_in_child=functools.partial(_after_fork, weakref.ref(self)))
+
+    @property
+    def shared(self):
+        """Whether rates are published through shared memory"""
+        return self._table is not None
+
+    def snapshot(self):
+        """Return the current snapshot"""
+        table = self._table
+        if table is not None and table.sequence() != self._sequence:
+            self._load_shared()
+        return self._snapshot
+
+    def share(self, table):
+        """Publish the current and future rates through a SharedRateTable"""
+        with self._lock:
+            current = self._snapshot
+            table.write(current.rates, current.version, current.fetched_at)
+            self._table = table
+            self._sequence = table.sequence()
+
+    def _load_shared(self):
+        """Adopt rates another process wrote to the shared table"""
+        with self._lock:
+            sequence, rates, version, fetched_at = self._table.read()
+            if sequence == self._sequence:
+                return
+            current = self._snapshot
+            if rates == current.rates:
+                self._snapshot = RateSnapshot(current.rates, version, fetched_at)
+            else:
+                self._publish(RateSnapshot(rates, version, fetched_at))
+            self._sequence = sequence
+
+    def subscribe(self, listener):
+        """Call listener(snapshot) whenever new rates are published"""
+        self._listeners.append(listener)
+
+    def refresh(self):
+        """Fetch rates from the provider and publish them if they changed"""
+        table = self._table
+        if table is not None and not table.owned:
+            # Forked workers follow the process that writes the table
+            return self.snapshot()
+
+        with self._lock:
+            rates = self.provider.fetch()
+            current = self._snapshot
+            changed = rates != current.rates
+            if changed:
+                snapshot = RateSnapshot(rates, current.version + 1, time.time())
+            else:
+                snapshot = RateSnapshot(current.rates, current.version, time.time())
+            if table is not None:
+                table.write(snapshot.rates, snapshot.version, snapshot.fetched_at)
+                self._sequence = table.sequence()
+            if changed:
+                self._publish(snapshot)
+            else:
+                self._snapshot = snapshot
+            return snapshot
+
+    def _publish(self, snapshot):
+        self._snapshot = snapshot
+        for listener in self._listeners:
+            listener(snapshot)
+
+    def start(self, provider=None, ttl=None):
+        """Load rates now, then keep refreshing them every ttl seconds"""
+        if provider is not None:
+            self.provider = provider
+        if ttl is not None:
+            self.ttl = ttl
+        self.refresh()
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='rate-refresh', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _restart_in_child(self):
+        # The parent's lock may have been held mid-refresh; its thread is gone
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        running = self._thread is not None
+        self._thread = None
+        if running and self._table is None:
+            self._thread = threading.Thread(target=self._run, name='rate-refresh', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.ttl):
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the last good snapshot until the next attempt
+                logger.exception('Currency rate refresh failed')
+
+
+def _after_fork(reference):
+    cache = reference()
+    if cache is not None:
+        cache._restart_in_child()
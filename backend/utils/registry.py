@@ -0,0 +1,200 @@
+"""
+Unit registry with precompiled pairwise conversions
+"""
+import array
+
+# NumPy is optional (convert_many falls back to pure Python) and slow to
+# import, so it is only loaded by the first bulk conversion
+_NOT_LOADED = object()
+np = _NOT_LOADED
+
+
+def numpy():
+    """The numpy module, imported on first use, or None if it is not installed"""
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    return np
+
+
+def _round_array(values, ndigits):
+    """Round a float64 NumPy array exactly like the built-in round()"""
+    scale = 10.0 ** ndigits
+    with np.errstate(over='ignore', invalid='ignore'):
+        scaled = values * scale
+        rounded = np.rint(scaled) / scale
+        # rint() only disagrees with round() when the scaled value is within
+        # rounding error of a .5 tie or too large to hold a fraction
+        magnitude = np.abs(scaled)
+        fraction = magnitude - np.trunc(magnitude)
+        inexact = (np.abs(fraction - 0.5) <= np.spacing(magnitude)) | ~(magnitude < 2.0 ** 52)
+    if inexact.any():
+        index = np.flatnonzero(inexact)
+        rounded[index] = [round(v, ndigits) for v in values[index].tolist()]
+    return rounded
+
+
+def _apply_many(values, func, ndigits):
+    """Apply func over a sequence, array.array or NumPy array and round the results.
+
+    func must only use arithmetic operators so that it works on floats and
+    NumPy arrays alike; the result type follows the input type.
+    """
+    np = numpy()
+    if np is not None:
+        result = _round_array(func(np.asarray(values, dtype=np.float64)), ndigits)
+        if isinstance(values, np.ndarray):
+            return result
+        if isinstance(values, array.array):
+            return array.array('d', result.tobytes())
+        return result.tolist()
+
+    result = [round(func(value), ndigits) for value in values]
+    if isinstance(values, array.array):
+        return array.array('d', result)
+    return result
+
+
+class Conversion:
+    """A compiled conversion between two units: round(value * scale + offset)"""
+    __slots__ = ('scale', 'offset', 'ndigits', 'convert')
+
+    def __init__(self, scale, offset, ndigits):
+        self.scale = scale
+        self.offset = offset
+        self.ndigits = ndigits
+        if offset:
+            self.convert = lambda value: round(value * scale + offset, ndigits)
+        else:
+            self.convert = lambda value: round(value * scale, ndigits)
+
+    def convert_many(self, values):
+        """Convert a sequence, array.array or NumPy array of values"""
+        scale, offset = self.scale, self.offset
+        if offset:
+            return _apply_many(values, lambda v: v * scale + offset, self.ndigits)
+        return _apply_many(values, lambda v: v * scale, self.ndigits)
+
+
+class UnitRegistry:
+    """Every conversion category with its units and compiled pairwise conversions"""
+
+    def __init__(self):
+        self._units = {}
+        self._nouns = {}
+        self._factors = {}
+        self._ndigits = {}
+        self._conversions = {}
+
+    def register(self, category, units, noun='unit'):
+        """Register a category that only lists its units"""
+        self._units[category] = list(units)
+        self._nouns[category] = noun
+
+    def register_linear(self, category, factors, ndigits, noun='unit', inverse=False):
+        """Register a category whose units are multiples of a base unit.
+
+        factors maps each unit to its size in the base unit, or with
+        inverse=True to the number of units per base unit (exchange rates).
+        """
+        if inverse:
+            matrix = {f: {t: factors[t] / factors[f] for t in factors} for f in factors}
+        else:
+            matrix = {f: {t: factors[f] / factors[t] for t in factors} for f in factors}
+        self._install(category, matrix, {}, ndigits, noun)
+
+    def register_affine(self, category, coefficients, ndigits, noun='unit'):
+        """Register a category whose units map to a base unit as value * scale + offset"""
+        matrix = {}
+        offsets = {}
+        for f, (f_scale, f_offset) in coefficients.items():
+            for t, (t_scale, t_offset) in coefficients.items():
+                matrix.setdefault(f, {})[t] = f_scale / t_scale
+                offsets[f, t] = (f_offset - t_offset) / t_scale
+        self._install(category, matrix, offsets, ndigits, noun)
+
+    def _install(self, category, matrix, offsets, ndigits, noun):
+        """Compile every unit pair and swap it in without disturbing readers"""
+        conversions = {
+            key: value for key, value in self._conversions.items() if key[0] != category
+        }
+        for f, row in matrix.items():
+            for t, scale in row.items():
+                conversions[category, f, t] = Conversion(scale, offsets.get((f, t), 0.0), ndigits)
+        self.register(category, matrix, noun)
+        self._factors[category] = matrix
+        self._ndigits[category] = ndigits
+        self._conversions = conversions
+
+    def categories(self):
+        """Names of all registered categories"""
+        return list(self._units)
+
+    def units(self, category):
+        """Units of a category, in registration order"""
+        return self._units[category]
+
+    def factors(self, category):
+        """Direct factor table of a numeric category: factors[from_unit][to_unit]"""
+        return self._factors[category]
+
+    def table(self, category):
+        """Scale, offset and rounding of every unit pair of a numeric category as plain data"""
+        conversions = self._conversions
+        matrix = self._factors[category]
+        table = {
+            'units': self.units(category),
+            'ndigits': self._ndigits[category],
+            'scale': matrix
+        }
+        offsets = {f: {t: conversions[category, f, t].offset for t in row} for f, row in matrix.items()}
+        if any(offset for row in offsets.values() for offset in row.values()):
+            table['offset'] = offsets
+        return table
+
+    def convert_all(self, category, values, from_unit):
+        """Convert values from one unit to every unit of a category in one pass.
+
+        Returns (units, rows) where rows[i][j] is values[i] in units[j],
+        rounded exactly like convert(). rows is a 2-D NumPy array for NumPy
+        input and a list of lists otherwise.
+        """
+        row = self._factors.get(category, {}).get(from_unit)
+        if row is None:
+            if category not in self._factors:
+                raise ValueError(f"Invalid category: {category}")
+            raise ValueError(f"Invalid {self._nouns[category]}: {from_unit}")
+
+        units = list(row)
+        scales = [row[unit] for unit in units]
+        offsets = [self._conversions[category, from_unit, unit].offset for unit in units]
+        ndigits = self._ndigits[category]
+        if not any(offsets):
+            offsets = None
+
+        np = numpy()
+        if np is not None:
+            matrix = np.asarray(values, dtype=np.float64).reshape(-1, 1) * np.array(scales)
+            if offsets is not None:
+                matrix += np.array(offsets)
+            rows = _round_array(matrix.ravel(), ndigits).reshape(matrix.shape)
+            return units, rows if isinstance(values, np.ndarray) else rows.tolist()
+
+        if offsets is None:
+            return units, [[round(value * scale, ndigits) for scale in scales] for value in values]
+        pairs = list(zip(scales, offsets))
+        return units, [[round(value * scale + offset, ndigits) for scale, offset in pairs]
+                       for value in values]
+
+    def conversion(self, category, from_unit, to_unit):
+        """Return the compiled conversion for a unit pair"""
+        try:
+            return self._conversions[category, from_unit, to_unit]
+        except KeyError:
+            if category not in self._factors:
+                raise ValueError(f"Invalid category: {category}") from None
+            noun = self._nouns[category]
+            raise ValueError(f"Invalid {noun}: {from_unit} or {to_unit}") from None
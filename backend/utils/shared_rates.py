@@ -0,0 +1,125 @@
+"""
+Currency rate table in shared memory, written by one process and read by its forked workers
+
+Layout of the block (native byte order, 8-byte aligned):
+
+    sequence  uint64    seqlock word: odd while a write is in progress
+    version   uint64    RateSnapshot version
+    fetched   float64   time the rates were fetched
+    count     uint64    number of currencies in use
+    codes     capacity x 8 ASCII bytes, NUL padded
+    rates     capacity x float64, units per USD, same order as codes
+
+Readers copy the header and slots, then check that the sequence word is
+unchanged and even; otherwise a write overlapped and they read again.
+"""
+import atexit
+import os
+import struct
+import time
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Platforms without POSIX/Windows shared memory use the in-process rates
+    shared_memory = None
+
+HEADER = struct.Struct('=QQdQ')
+SEQUENCE = struct.Struct('=Q')
+CODE_SIZE = 8
+DEFAULT_CAPACITY = 256
+
+
+class SharedRateTable:
+    """Fixed-layout rate table in a multiprocessing.shared_memory block.
+
+    Exactly one process may call write(). Processes forked after create()
+    inherit the mapping and read it with no copies of the block and no IPC.
+    """
+
+    def __init__(self, memory, capacity, owner_pid):
+        self._memory = memory
+        self.capacity = capacity
+        self._owner_pid = owner_pid
+        buf = memory.buf
+        codes_start = HEADER.size
+        rates_start = codes_start + capacity * CODE_SIZE
+        self._buf = buf
+        self._codes = buf[codes_start:rates_start]
+        self._rates = buf[rates_start:rates_start + capacity * 8].cast('d')
+
+    @classmethod
+    def create(cls, capacity=DEFAULT_CAPACITY):
+        """Allocate a new table; returns None if shared memory is unavailable"""
+        if shared_memory is None:
+            return None
+        size = HEADER.size + capacity * (CODE_SIZE + 8)
+        try:
+            memory = shared_memory.SharedMemory(create=True, size=size)
+        except OSError:
+            return None
+        table = cls(memory, capacity, os.getpid())
+        atexit.register(table.close)
+        return table
+
+    @property
+    def owned(self):
+        """Whether this process created the table and may write it"""
+        return os.getpid() == self._owner_pid
+
+    @property
+    def name(self):
+        """Name of the shared memory block"""
+        return self._memory.name
+
+    def sequence(self):
+        """Current seqlock word; it changes with every write"""
+        return SEQUENCE.unpack_from(self._buf)[0]
+
+    def write(self, rates, version, fetched_at):
+        """Publish a dict of currency code to rate"""
+        if len(rates) > self.capacity:
+            raise ValueError(f"Too many currencies for the shared rate table: "
+                             f"{len(rates)} (capacity {self.capacity})")
+        codes = []
+        for code in rates:
+            encoded = code.encode('ascii')
+            if len(encoded) > CODE_SIZE:
+                raise ValueError(f"Currency code too long for the shared rate table: {code}")
+            codes.append(encoded.ljust(CODE_SIZE, b'\0'))
+
+        sequence = self.sequence()
+        SEQUENCE.pack_into(self._buf, 0, sequence + 1)
+        self._codes[:len(codes) * CODE_SIZE] = b''.join(codes)
+        for index, rate in enumerate(rates.values()):
+            self._rates[index] = rate
+        HEADER.pack_into(self._buf, 0, sequence + 1, version, fetched_at, len(codes))
+        SEQUENCE.pack_into(self._buf, 0, sequence + 2)
+
+    def read(self):
+        """Return (sequence, rates, version, fetched_at) from one consistent write"""
+        while True:
+            sequence, version, fetched_at, count = HEADER.unpack_from(self._buf)
+            if sequence & 1 or count > self.capacity:
+                time.sleep(0)
+                continue
+            codes = bytes(self._codes[:count * CODE_SIZE])
+            values = self._rates[:count].tolist()
+            if self.sequence() == sequence:
+                break
+        rates = {
+            codes[i:i + CODE_SIZE].rstrip(b'\0').decode('ascii'): value
+            for i, value in zip(range(0, len(codes), CODE_SIZE), values)
+        }
+        return sequence, rates, version, fetched_at
+
+    def close(self):
+        """Unmap the block; the creating process also removes it"""
+        if self._memory is None:
+            return
+        self._codes.release()
+        self._rates.release()
+        self._buf = None
+        self._memory.close()
+        if self.owned:
+            self._memory.unlink()
+        self._memory = None
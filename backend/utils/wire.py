@@ -0,0 +1,63 @@
+"""
+Binary wire format for bulk numeric conversion
+
+A request body is one ASCII header line, b'category from_unit to_unit\\n',
+followed by packed little-endian float64 values. The response body is the
+converted values packed the same way, in the same order.
+"""
+import array
+import sys
+
+from backend.utils.registry import numpy
+
+MIMETYPE = 'application/octet-stream'
+HEADER_MAX_BYTES = 256
+VALUE_SIZE = 8
+
+
+def encode_header(category, from_unit, to_unit):
+    """Header line for a request"""
+    return f"{category} {from_unit} {to_unit}\n".encode('ascii')
+
+
+def decode_header(line):
+    """Parse a header line into (category, from_unit, to_unit)"""
+    if not line.endswith(b'\n'):
+        raise ValueError(f"Binary header must be a line of at most {HEADER_MAX_BYTES} bytes")
+    try:
+        fields = line.decode('ascii').split()
+    except UnicodeDecodeError:
+        raise ValueError('Binary header must be ASCII') from None
+    if len(fields) != 3:
+        raise ValueError(f"Binary header must be 'category from to', got {len(fields)} fields")
+    return tuple(fields)
+
+
+def pack(values):
+    """Pack a sequence of numbers as little-endian float64"""
+    packed = array.array('d', values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack(data):
+    """Unpack little-endian float64 bytes into an array('d')"""
+    values = array.array('d')
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def convert_packed(convert_many, data):
+    """Convert packed values with a convert_many(values) function and pack the results.
+
+    With NumPy the input buffer is wrapped without copying and converted in
+    vectorized form, so no Python object is created per value.
+    """
+    np = numpy()
+    if np is not None:
+        values = np.frombuffer(data, dtype='<f8')
+        return np.asarray(convert_many(values), dtype='<f8').tobytes()
+    return pack(convert_many(unpack(data)))
@@ -0,0 +1,85 @@
+"""
+Measure cold-start time from interpreter start to the first served request
+
+Each run starts a fresh interpreter that imports the app, builds it with
+create_app() and serves one request through the WSGI test client, timing
+every phase. The median of all runs is reported, so the numbers can be
+recorded per release and compared.
+
+Usage: python -m benchmarks.cold_start [--runs N] [--path /health] [--json PATH]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ('interpreter', 'import', 'create_app', 'first_request', 'total')
+
+# Runs in the child and prints its timestamps as JSON
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from backend.app import create_app
+from backend.config import Config
+imported = time.perf_counter()
+app = create_app(Config)
+created = time.perf_counter()
+response = app.test_client().get(sys.argv[1])
+response.get_data()
+served = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({'started': started, 'imported': imported, 'created': created, 'served': served}))
+"""
+
+
+def measure(path):
+    """Time one cold start; returns seconds per phase"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+    # perf_counter() reads the system-wide monotonic clock, so the parent's
+    # reading before spawning gives the interpreter start-up time
+    launched = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', CHILD, path], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    marks = json.loads(output)
+    return {
+        'interpreter': marks['started'] - launched,
+        'import': marks['imported'] - marks['started'],
+        'create_app': marks['created'] - marks['imported'],
+        'first_request': marks['served'] - marks['created'],
+        'total': marks['served'] - launched,
+    }
+
+
+def run(runs, path):
+    """Median seconds per phase over several cold starts"""
+    samples = [measure(path) for _ in range(runs)]
+    return {phase: statistics.median(sample[phase] for sample in samples) for phase in PHASES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--path', default='/', help='URL of the first request')
+    parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+    args = parser.parse_args()
+
+    result = run(args.runs, args.path)
+    if args.json:
+        text = json.dumps({'runs': args.runs, 'path': args.path, 'seconds': result}, indent=2)
+        if args.json == '-':
+            print(text)
+            return
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+
+    print(f"cold start, median of {args.runs} runs, first request GET {args.path}")
+    for phase in PHASES:
+        print(f"  {phase:<14} {result[phase] * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+"""
+End-to-end HTTP load generator
+
+Starts run.py in a serving mode (or targets a running server with --url)
+and drives a weighted mix of conversion, /api/units and /health requests
+over keep-alive connections, then reports throughput, error rate and
+latency percentiles as text or JSON.
+
+Closed loop (--concurrency N): N clients send requests back to back.
+Open loop (--rate R): requests are scheduled R times per second whatever
+the server does; latency is measured from the scheduled start, so queueing
+behind a slow server is counted instead of hidden.
+
+Usage: python -m benchmarks.loadgen [--modes waitress asgi gunicorn] [--concurrency N | --rate R]
+       [--duration S] [--mix length=3,units=1,health=1] [--env WAITRESS_THREADS=8] [--json PATH]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import Counter
+from urllib.parse import urlsplit
+
+
+def _post(path, payload):
+    return ('POST', path, json.dumps(payload).encode())
+
+
+REQUESTS = {
+    'length': _post('/api/convert/length', {'value': 100, 'from_unit': 'meter', 'to_unit': 'kilometer'}),
+    'weight': _post('/api/convert/weight', {'value': 100, 'from_unit': 'gram', 'to_unit': 'kilogram'}),
+    'temperature': _post('/api/convert/temperature',
+                         {'value': 100, 'from_unit': 'celsius', 'to_unit': 'fahrenheit'}),
+    'volume': _post('/api/convert/volume', {'value': 100, 'from_unit': 'liter', 'to_unit': 'milliliter'}),
+    'currency': _post('/api/convert/currency', {'value': 100, 'from_currency': 'USD', 'to_currency': 'EUR'}),
+    'number-base': _post('/api/convert/number-base',
+                         {'value': '255', 'from_base': 'decimal', 'to_base': 'binary'}),
+    'batch': _post('/api/convert/batch', {'conversions': [
+        {'category': 'length', 'value': i, 'from_unit': 'meter', 'to_unit': 'foot'} for i in range(100)
+    ]}),
+    'units': ('GET', '/api/units', b''),
+    'health': ('GET', '/health', b''),
+}
+
+DEFAULT_MIX = 'length=3,weight=1,temperature=1,volume=1,currency=1,number-base=1,units=1,health=1'
+
+PERCENTILES = [('p50', 0.5), ('p95', 0.95), ('p99', 0.99), ('p99.9', 0.999)]
+
+
+def parse_mix(spec):
+    """Parse 'name=weight,...' into a list of (name, weight)"""
+    mix = []
+    for part in spec.split(','):
+        name, _, weight = part.strip().partition('=')
+        if name not in REQUESTS:
+            raise ValueError(f"Unknown request type: {name} (choose from {', '.join(REQUESTS)})")
+        weight = float(weight or 1)
+        if weight <= 0:
+            raise ValueError(f"Invalid weight for {name}: {weight}")
+        mix.append((name, weight))
+    return mix
+
+
+def start_server(mode, port, env=None):
+    """Start run.py in the given mode and wait until /health answers"""
+    env = dict(os.environ, **(env or {}), SERVER_MODE=mode,
+               FLASK_HOST='127.0.0.1', FLASK_PORT=str(port))
+    process = subprocess.Popen([sys.executable, 'run.py'], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+            return process
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{mode} server did not start on port {port}")
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float('nan')
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class Recorder:
+    """Latencies and outcomes per request type"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = Counter()
+
+    def record(self, name, latency, error=None):
+        self.latencies.setdefault(name, []).append(latency)
+        if error is not None:
+            self.errors[f"{name}: {error}"] += 1
+
+    def summary(self, elapsed):
+        """Throughput, error rate and latency percentiles in milliseconds"""
+        def stats(latencies, errors):
+            latencies = sorted(latencies)
+            result = {
+                'requests': len(latencies),
+                'throughput': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+                'errors': errors,
+                'error_rate': round(errors / len(latencies), 4) if latencies else 0.0,
+            }
+            for label, fraction in PERCENTILES:
+                result[f"{label}_ms"] = round(percentile(latencies, fraction) * 1000, 3)
+            result['max_ms'] = round(latencies[-1] * 1000, 3) if latencies else float('nan')
+            return result
+
+        per_type = {}
+        for name, latencies in self.latencies.items():
+            errors = sum(count for key, count in self.errors.items() if key.startswith(f"{name}: "))
+            per_type[name] = stats(latencies, errors)
+
+        everything = [value for latencies in self.latencies.values() for value in latencies]
+        total = stats(everything, sum(self.errors.values()))
+        total['duration_s'] = round(elapsed, 3)
+        total['error_kinds'] = dict(self.errors.most_common())
+        total['by_type'] = per_type
+        return total
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, body):
+        """Send a request and return the status code once the body is read"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+        if body:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        self.writer.write(head.encode() + b'\r\n' + body)
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.split(b'\r\n')
+        status = int(lines[0].split(b' ', 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(b':')
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get(b'transfer-encoding') == b'chunked':
+            while True:
+                size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+        else:
+            await self.reader.readexactly(int(headers.get(b'content-length', 0)))
+        if headers.get(b'connection') == b'close':
+            self.close()
+        return status
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def _send(connection, name, recorder, started):
+    method, path, body = REQUESTS[name]
+    try:
+        status = await connection.request(method, path, body)
+        error = None if status == 200 else f"HTTP {status}"
+    except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+        connection.close()
+        error = type(e).__name__
+    recorder.record(name, time.perf_counter() - started, error)
+
+
+async def closed_loop(host, port, mix, concurrency, duration):
+    """Run concurrency clients back to back for duration seconds"""
+    names, weights = zip(*mix)
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        connection = Connection(host, port)
+        try:
+            while time.perf_counter() < deadline:
+                await _send(connection, random.choices(names, weights)[0], recorder, time.perf_counter())
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return recorder.summary(time.perf_counter() - started)
+
+
+async def open_loop(host, port, mix, rate, duration, connections):
+    """Schedule rate requests per second and send them on a connection pool"""
+    names, weights = zip(*mix)
+    recorder = Recorder()
+    queue = asyncio.Queue()
+
+    async def worker():
+        connection = Connection(host, port)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                await _send(connection, item[0], recorder, item[1])
+        finally:
+            connection.close()
+
+    workers = [asyncio.create_task(worker()) for _ in range(connections)]
+    started = time.perf_counter()
+    total = int(rate * duration)
+    for index in range(total):
+        scheduled = started + index / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        queue.put_nowait((random.choices(names, weights)[0], scheduled))
+    for _ in workers:
+        queue.put_nowait(None)
+    await asyncio.gather(*workers)
+    return recorder.summary(time.perf_counter() - started)
+
+
+def run(host, port, mix, args):
+    """Warm up, then run the configured load and return its summary"""
+    if args.warmup:
+        asyncio.run(closed_loop(host, port, mix, min(args.concurrency, 8), args.warmup))
+    if args.rate:
+        return asyncio.run(open_loop(host, port, mix, args.rate, args.duration, args.concurrency))
+    return asyncio.run(closed_loop(host, port, mix, args.concurrency, args.duration))
+
+
+def format_report(label, summary):
+    """Text report of one run"""
+    lines = [
+        f"== {label}: {summary['requests']} requests in {summary['duration_s']:.1f}s, "
+        f"{summary['throughput']:.0f} req/s, error rate {summary['error_rate']:.2%}",
+        f"{'type':<12} {'req/s':>9} " + ' '.join(f"{pct + ' ms':>10}" for pct, _ in PERCENTILES)
+        + f" {'errors':>7}",
+    ]
+    rows = sorted(summary['by_type'].items()) + [('all', summary)]
+    for name, stats in rows:
+        lines.append(f"{name:<12} {stats['throughput']:>9.0f} "
+                     + ' '.join(f"{stats[pct + '_ms']:>10.2f}" for pct, _ in PERCENTILES)
+                     + f" {stats['errors']:>7}")
+    for kind, count in summary['error_kinds'].items():
+        lines.append(f"  error {kind}: {count}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=['waitress'],
+                        help='serving modes to start with run.py, one run each')
+    parser.add_argument('--url', help='target an already running server instead of starting one')
+    parser.add_argument('--concurrency', type=int, default=50,
+                        help='clients (closed loop) or connection pool size (open loop)')
+    parser.add_argument('--rate', type=float, help='open-loop requests per second')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--warmup', type=float, default=1.0)
+    parser.add_argument('--mix', default=DEFAULT_MIX)
+    parser.add_argument('--env', nargs='*', default=[], metavar='KEY=VALUE',
+                        help='extra environment for the server, e.g. WAITRESS_THREADS=8')
+    parser.add_argument('--port', type=int, default=5100)
+    parser.add_argument('--json', metavar='PATH', help="write the results as JSON ('-' for stdout)")
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    env = dict(item.split('=', 1) for item in args.env)
+    load = {'concurrency': args.concurrency, 'rate': args.rate, 'duration': args.duration, 'mix': dict(mix)}
+
+    results = []
+    if args.url:
+        target = urlsplit(args.url if '//' in args.url else f"http://{args.url}")
+        summary = run(target.hostname, target.port or 80, mix, args)
+        results.append({'target': args.url, **load, **summary})
+        if args.json != '-':
+            print(format_report(args.url, summary))
+    else:
+        for offset, mode in enumerate(args.modes):
+            port = args.port + offset
+            process = start_server(mode, port, env)
+            try:
+                summary = run('127.0.0.1', port, mix, args)
+            finally:
+                stop_server(process)
+            results.append({'mode': mode, 'env': env, **load, **summary})
+            if args.json != '-':
+                print(format_report(mode, summary))
+
+    if args.json == '-':
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
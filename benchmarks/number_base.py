@@ -0,0 +1,63 @@
+"""
+Benchmark number base conversion against input size
+
+Compares the big-number path in backend.utils.bignum with CPython's
+built-in int()/str()/format() for growing digit counts.
+
+Usage: python -m benchmarks.number_base [--max-digits N] [--repeat N]
+"""
+import argparse
+import random
+import sys
+import time
+
+from backend.utils import bignum
+
+
+def _best_of(repeat, func, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(max_digits, repeat):
+    """Print a table of conversion times per digit count"""
+    # The built-in conversions refuse long decimal strings by default
+    sys.set_int_max_str_digits(0)
+    print(f"{'digits':>10} {'case':<18} {'builtin s':>11} {'bignum s':>11} {'speedup':>8}")
+
+    digits = 1000
+    while digits <= max_digits:
+        decimal_digits = ''.join(random.choice('123456789') for _ in range(digits))
+        number = int(decimal_digits)
+        hex_digits = format(number, 'X')
+        octal_digits = format(number, 'o')
+        cases = [
+            ('decimal -> hex', lambda: format(int(decimal_digits), 'X'),
+             lambda: bignum.convert(decimal_digits, 10, 16)),
+            ('hex -> decimal', lambda: str(int(hex_digits, 16)),
+             lambda: bignum.convert(hex_digits, 16, 10)),
+            ('octal -> hex', lambda: format(int(octal_digits, 8), 'X'),
+             lambda: bignum.convert(octal_digits, 8, 16)),
+        ]
+        for name, builtin, big in cases:
+            builtin_time = _best_of(repeat, builtin)
+            big_time = _best_of(repeat, big)
+            print(f"{digits:>10} {name:<18} {builtin_time:>11.5f} {big_time:>11.5f} "
+                  f"{builtin_time / big_time:>7.1f}x")
+        digits *= 10
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-digits', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run(args.max_digits, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Compare serving modes under many concurrent keep-alive connections
+
+Starts run.py once per server mode on a local port and drives it with
+asyncio clients, each holding one keep-alive connection and sending
+length conversions back to back. See benchmarks.loadgen for mixed
+traffic, open-loop rates and JSON output.
+
+Usage: python -m benchmarks.serving [--modes waitress asgi] [--connections N] [--duration S]
+"""
+import argparse
+import asyncio
+
+from benchmarks.loadgen import closed_loop, start_server, stop_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=['waitress', 'asgi'])
+    parser.add_argument('--connections', type=int, default=500)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--port', type=int, default=5100)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'conns':>6} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for offset, mode in enumerate(args.modes):
+        port = args.port + offset
+        process = start_server(mode, port)
+        try:
+            summary = asyncio.run(closed_loop('127.0.0.1', port, [('length', 1)],
+                                              args.connections, args.duration))
+        finally:
+            stop_server(process)
+        print(f"{mode:<10} {args.connections:>6} {summary['throughput']:>9.0f} "
+              f"{summary['p50_ms']:>8.2f} {summary['p99_ms']:>8.2f} {summary['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+# Loaded automatically by `gunicorn wsgi:app`; settings come from backend.config
+from backend.config import Config
+from backend.server import gunicorn_options
+
+globals().update(gunicorn_options(Config))
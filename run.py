@@ -1,11 +1,10 @@
-from waitress import serve
 from backend.app import create_app
 from backend.config import Config
+from backend.server import serve
 
 app = create_app(Config)
 
 if __name__ == '__main__':
-    print("Starting server on http://0.0.0.0:5000")
+    print(f"Starting {Config.SERVER_MODE} server on http://{Config.HOST}:{Config.PORT}")
     print("Press Ctrl+C to stop")
-    serve(app, host='0.0.0.0', port=5000, threads=4)
-
+    serve(app, Config)
@@ -19,6 +19,14 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // Check application health
     checkHealth();
+    
+    // Convert in the browser where possible; keep working offline
+    loadConversionTables();
+    if ('serviceWorker' in navigator) {
+        navigator.serviceWorker.register('/sw.js').catch(error => {
+            console.error('Service worker registration failed:', error);
+        });
+    }
 });
 
 function checkHealth() {
@@ -34,183 +42,134 @@ function checkHealth() {
         });
 }
 
-// Conversion functions
-async function convertLength() {
-    const value = document.getElementById('length-value').value;
-    const fromUnit = document.getElementById('length-from').value;
-    const toUnit = document.getElementById('length-to').value;
-    const messageDiv = document.getElementById('length-message');
-    
-    if (!value || value === '') {
-        showMessage(messageDiv, 'Please enter a value', 'error');
-        return;
-    }
-    
+// Client-side conversion tables, loaded from /api/conversion-tables
+let conversionTables = null;
+let tablesLoadedAt = 0;
+
+async function loadConversionTables() {
     try {
-        const response = await fetch('/api/convert/length', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                value: parseFloat(value),
-                from_unit: fromUnit,
-                to_unit: toUnit
-            })
-        });
-        
-        const data = await response.json();
-        
-        if (data.success) {
-            document.getElementById('length-result').value = data.result;
-            showMessage(messageDiv, `${data.from} = ${data.to}`, 'success');
-        } else {
-            showMessage(messageDiv, data.error || 'Conversion failed', 'error');
+        // no-cache revalidates with the ETag, so unchanged tables cost a 304
+        const response = await fetch('/api/conversion-tables', { cache: 'no-cache' });
+        if (response.ok) {
+            conversionTables = await response.json();
+            tablesLoadedAt = Date.now();
         }
     } catch (error) {
-        showMessage(messageDiv, 'Error: ' + error.message, 'error');
+        console.error('Could not load conversion tables:', error);
     }
 }
 
-async function convertWeight() {
-    const value = document.getElementById('weight-value').value;
-    const fromUnit = document.getElementById('weight-from').value;
-    const toUnit = document.getElementById('weight-to').value;
-    const messageDiv = document.getElementById('weight-message');
-    
-    if (!value || value === '') {
-        showMessage(messageDiv, 'Please enter a value', 'error');
-        return;
+// Python's round(): round half to even on the exact binary value
+function pyRound(x, ndigits) {
+    if (!isFinite(x) || Math.abs(x) >= 1e21) {
+        return x;
     }
-    
-    try {
-        const response = await fetch('/api/convert/weight', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                value: parseFloat(value),
-                from_unit: fromUnit,
-                to_unit: toUnit
-            })
-        });
-        
-        const data = await response.json();
-        
-        if (data.success) {
-            document.getElementById('weight-result').value = data.result;
-            showMessage(messageDiv, `${data.from} = ${data.to}`, 'success');
-        } else {
-            showMessage(messageDiv, data.error || 'Conversion failed', 'error');
+    const exact = Math.abs(x).toFixed(100);
+    const dot = exact.indexOf('.');
+    const rest = exact.slice(dot + 1 + ndigits);
+    let rounded = Number(Math.abs(x).toFixed(ndigits));
+    if (/^50*$/.test(rest)) {
+        const kept = exact.slice(0, dot + 1 + ndigits).replace('.', '');
+        if (Number(kept[kept.length - 1]) % 2 === 0) {
+            rounded = Number(exact.slice(0, ndigits ? dot + 1 + ndigits : dot));
         }
-    } catch (error) {
-        showMessage(messageDiv, 'Error: ' + error.message, 'error');
     }
+    return x < 0 ? -rounded : rounded;
 }
 
-async function convertTemperature() {
-    const value = document.getElementById('temp-value').value;
-    const fromUnit = document.getElementById('temp-from').value;
-    const toUnit = document.getElementById('temp-to').value;
-    const messageDiv = document.getElementById('temp-message');
-    
-    if (!value || value === '') {
-        showMessage(messageDiv, 'Please enter a value', 'error');
-        return;
+// Python's repr() of a float, as the server formats results
+function pyStr(x) {
+    if (x === 0) {
+        return Object.is(x, -0) ? '-0.0' : '0.0';
     }
-    
-    try {
-        const response = await fetch('/api/convert/temperature', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                value: parseFloat(value),
-                from_unit: fromUnit,
-                to_unit: toUnit
-            })
-        });
-        
-        const data = await response.json();
-        
-        if (data.success) {
-            document.getElementById('temp-result').value = data.result;
-            showMessage(messageDiv, `${data.from} = ${data.to}`, 'success');
-        } else {
-            showMessage(messageDiv, data.error || 'Conversion failed', 'error');
-        }
-    } catch (error) {
-        showMessage(messageDiv, 'Error: ' + error.message, 'error');
+    const magnitude = Math.abs(x);
+    if (Number.isInteger(x) && magnitude < 1e16) {
+        return x.toFixed(1);
     }
+    const exponential = magnitude < 1e-4 || magnitude >= 1e16;
+    return (exponential ? x.toExponential() : String(x)).replace(/e([+-])(\d)$/, 'e$10$2');
 }
 
-async function convertVolume() {
-    const value = document.getElementById('volume-value').value;
-    const fromUnit = document.getElementById('volume-from').value;
-    const toUnit = document.getElementById('volume-to').value;
-    const messageDiv = document.getElementById('volume-message');
-    
-    if (!value || value === '') {
-        showMessage(messageDiv, 'Please enter a value', 'error');
-        return;
+function tableFor(category) {
+    if (!conversionTables) {
+        return null;
     }
-    
-    try {
-        const response = await fetch('/api/convert/volume', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                value: parseFloat(value),
-                from_unit: fromUnit,
-                to_unit: toUnit
-            })
-        });
-        
-        const data = await response.json();
-        
-        if (data.success) {
-            document.getElementById('volume-result').value = data.result;
-            showMessage(messageDiv, `${data.from} = ${data.to}`, 'success');
-        } else {
-            showMessage(messageDiv, data.error || 'Conversion failed', 'error');
-        }
-    } catch (error) {
-        showMessage(messageDiv, 'Error: ' + error.message, 'error');
+    const table = conversionTables.categories[category];
+    // Rates are only trusted for their TTL; after that ask the server
+    if (table && table.ttl !== undefined && Date.now() - tablesLoadedAt > table.ttl * 1000) {
+        loadConversionTables();
+        return null;
     }
+    return table || null;
 }
 
-async function convertCurrency() {
-    const value = document.getElementById('currency-value').value;
-    const fromCurrency = document.getElementById('currency-from').value;
-    const toCurrency = document.getElementById('currency-to').value;
-    const messageDiv = document.getElementById('currency-message');
+// Returns the same fields as the server's response, or null to use the server
+function convertLocally(category, value, fromUnit, toUnit) {
+    const table = tableFor(category);
+    if (!table) {
+        return null;
+    }
+    const noun = category === 'currency' ? 'currency' : 'unit';
+    if (!(fromUnit in table.scale) || !(toUnit in table.scale)) {
+        return { success: false, error: `Invalid ${noun}: ${fromUnit} or ${toUnit}` };
+    }
+
+    let result;
+    if (table.round_identity === false && fromUnit === toUnit) {
+        result = value;
+    } else {
+        const offset = table.offset ? table.offset[fromUnit][toUnit] : 0;
+        const scaled = value * table.scale[fromUnit][toUnit];
+        result = pyRound(offset ? scaled + offset : scaled, table.ndigits);
+    }
+
+    if (category === 'temperature') {
+        const initial = unit => unit.charAt(0).toUpperCase();
+        return {
+            success: true,
+            result: result,
+            from: `${pyStr(value)}° ${initial(fromUnit)}`,
+            to: `${pyStr(result)}° ${initial(toUnit)}`
+        };
+    }
+    return {
+        success: true,
+        result: result,
+        from: `${pyStr(value)} ${fromUnit}`,
+        to: `${pyStr(result)} ${toUnit}`
+    };
+}
+
+async function convertUnits(category, prefix, fromKey, toKey, emptyMessage) {
+    const value = document.getElementById(`${prefix}-value`).value;
+    const fromUnit = document.getElementById(`${prefix}-from`).value;
+    const toUnit = document.getElementById(`${prefix}-to`).value;
+    const messageDiv = document.getElementById(`${prefix}-message`);
     
     if (!value || value === '') {
-        showMessage(messageDiv, 'Please enter an amount', 'error');
+        showMessage(messageDiv, emptyMessage, 'error');
         return;
     }
     
     try {
-        const response = await fetch('/api/convert/currency', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({
-                value: parseFloat(value),
-                from_currency: fromCurrency,
-                to_currency: toCurrency
-            })
-        });
-        
-        const data = await response.json();
+        let data = convertLocally(category, parseFloat(value), fromUnit, toUnit);
+        if (data === null) {
+            const response = await fetch(`/api/convert/${category}`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    value: parseFloat(value),
+                    [fromKey]: fromUnit,
+                    [toKey]: toUnit
+                })
+            });
+            data = await response.json();
+        }
         
         if (data.success) {
-            document.getElementById('currency-result').value = data.result;
+            document.getElementById(`${prefix}-result`).value = data.result;
             showMessage(messageDiv, `${data.from} = ${data.to}`, 'success');
         } else {
             showMessage(messageDiv, data.error || 'Conversion failed', 'error');
@@ -220,6 +179,27 @@ async function convertCurrency() {
     }
 }
 
+// Conversion functions
+function convertLength() {
+    return convertUnits('length', 'length', 'from_unit', 'to_unit', 'Please enter a value');
+}
+
+function convertWeight() {
+    return convertUnits('weight', 'weight', 'from_unit', 'to_unit', 'Please enter a value');
+}
+
+function convertTemperature() {
+    return convertUnits('temperature', 'temp', 'from_unit', 'to_unit', 'Please enter a value');
+}
+
+function convertVolume() {
+    return convertUnits('volume', 'volume', 'from_unit', 'to_unit', 'Please enter a value');
+}
+
+function convertCurrency() {
+    return convertUnits('currency', 'currency', 'from_currency', 'to_currency', 'Please enter an amount');
+}
+
 async function convertNumberBase() {
     const value = document.getElementById('number-value').value.trim();
     const fromBase = document.getElementById('number-from').value;
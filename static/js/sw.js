@@ -0,0 +1,56 @@
+// Service worker: keeps the page, its assets and the conversion tables
+// available offline so unit conversions work without the server.
+const CACHE_NAME = 'converter-v1';
+const NETWORK_FIRST = ['/', '/api/conversion-tables'];
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(NETWORK_FIRST))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(
+                names.filter(name => name !== CACHE_NAME).map(name => caches.delete(name))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const url = new URL(event.request.url);
+    if (event.request.method !== 'GET' || url.origin !== self.location.origin) {
+        return;
+    }
+
+    // Fingerprinted assets never change, so the cached copy is always right
+    if (url.pathname.startsWith('/assets/')) {
+        event.respondWith(
+            caches.match(event.request).then(cached => cached || fetch(event.request).then(response => {
+                if (response.ok) {
+                    const copy = response.clone();
+                    caches.open(CACHE_NAME).then(cache => cache.put(event.request, copy));
+                }
+                return response;
+            }))
+        );
+        return;
+    }
+
+    // The page and tables are revalidated online and served from cache offline
+    if (NETWORK_FIRST.includes(url.pathname)) {
+        event.respondWith(
+            fetch(event.request).then(response => {
+                if (response.ok) {
+                    const copy = response.clone();
+                    caches.open(CACHE_NAME).then(cache => cache.put(url.pathname, copy));
+                }
+                return response;
+            }).catch(() => caches.match(url.pathname))
+        );
+    }
+});
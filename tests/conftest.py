@@ -1,5 +1,11 @@
 """Shared pytest configuration and markers for multiple test types."""
 
+import gc
+import json
+import os
+import statistics
+import time
+
 import pytest
 
 
@@ -14,3 +20,122 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "smoke: mark test as a smoke test (critical path, run first)"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a benchmark (timed, compared to a baseline)"
+    )
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'benchmarks', 'baseline.json')
+
+
+def pytest_addoption(parser):
+    """Options for the benchmark suite."""
+    group = parser.getgroup('benchmark')
+    group.addoption(
+        '--benchmark-threshold', type=float,
+        default=float(os.environ.get('BENCHMARK_THRESHOLD', 0.25)),
+        help='fail when a score drops by more than this fraction of the baseline'
+    )
+    group.addoption(
+        '--benchmark-update', action='store_true',
+        help='write measured scores to the baseline file instead of comparing'
+    )
+
+
+def calibration_loop():
+    """Fixed interpreter workload (dict lookups, float math, formatting) to gauge machine speed."""
+    factors = {'meter': 1.0, 'foot': 0.3048, 'inch': 0.0254}
+    total = 0.0
+    for i in range(200):
+        total += round(i * factors['foot'] / factors['inch'], 6)
+    return f"{total} inch"
+
+
+class Benchmark:
+    """Times a callable and compares its score with the stored baseline.
+
+    A score is ops/sec divided by the ops/sec of calibration_loop(). Rounds
+    of the two alternate, each round's ratio is taken against the
+    calibration round just before it, and the score is the median ratio, so
+    the baseline carries over to faster or slower machines and a burst of
+    noise or drift mid-run moves a single round rather than the result.
+    """
+
+    def __init__(self, baseline, threshold, update, min_time=0.1, repeat=21):
+        self.baseline = baseline
+        self.threshold = threshold
+        self.update = update
+        self.min_time = min_time
+        self.repeat = repeat
+        self.results = {}
+
+    def loops(self, func):
+        """Calls of func that take at least min_time, doubling from one."""
+        loops = 1
+        while self.rate(func, loops) * self.min_time > loops:
+            loops *= 2
+        return loops
+
+    @staticmethod
+    def rate(func, loops):
+        """Ops/sec of one round of loops calls."""
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return loops / (time.perf_counter() - started)
+
+    def measure(self, func):
+        """Median score and median ops/sec over repeat alternating rounds."""
+        loops = self.loops(func)
+        calibration_loops = self.loops(calibration_loop)
+        ratios, rates = [], []
+        # As timeit does: a collection landing in one round but not the other skews its ratio
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(self.repeat):
+                calibration = self.rate(calibration_loop, calibration_loops)
+                rate = self.rate(func, loops)
+                ratios.append(rate / calibration)
+                rates.append(rate)
+        finally:
+            gc.enable()
+        return statistics.median(ratios), statistics.median(rates)
+
+    def __call__(self, name, func):
+        score, ops = self.measure(func)
+        self.results[name] = round(score, 4)
+        expected = self.baseline.get(name)
+        if self.update or expected is None:
+            return ops
+
+        floor = expected * (1 - self.threshold)
+        if score < floor:
+            pytest.fail(
+                f"{name}: score {score:.4g} ({ops:,.0f} ops/sec) is more than "
+                f"{self.threshold:.0%} below the baseline of {expected:.4g}"
+            )
+        return ops
+
+
+@pytest.fixture(scope='session')
+def benchmark(request):
+    """Session-wide Benchmark; with --benchmark-update the baseline is rewritten."""
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    bench = Benchmark(
+        baseline,
+        request.config.getoption('--benchmark-threshold'),
+        request.config.getoption('--benchmark-update')
+    )
+    yield bench
+
+    if bench.update and bench.results:
+        baseline.update(bench.results)
+        os.makedirs(os.path.dirname(BASELINE_FILE), exist_ok=True)
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write('\n')
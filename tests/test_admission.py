@@ -0,0 +1,113 @@
+"""Unit tests for admission control."""
+
+import threading
+
+import pytest
+from backend.utils import admission as admission_module
+from backend.utils.admission import AdmissionController, ConcurrencyLimiter, RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(admission_module.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test the per-client token bucket."""
+
+    def test_burst_then_refill(self, clock):
+        limiter = RateLimiter(rate=2.0, burst=3)
+        assert [limiter.acquire('a') for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire('a') == pytest.approx(0.5)
+        # Other clients have their own bucket
+        assert limiter.acquire('b') == 0.0
+
+        clock[0] += 0.5
+        assert limiter.acquire('a') == 0.0
+        assert limiter.acquire('a') > 0
+
+    def test_bucket_never_exceeds_burst(self, clock):
+        limiter = RateLimiter(rate=10.0, burst=2)
+        limiter.acquire('a')
+        clock[0] += 60
+        assert [limiter.acquire('a') for _ in range(3)][2] > 0
+
+    def test_forgets_oldest_clients(self, clock):
+        limiter = RateLimiter(rate=1.0, burst=1, max_clients=2)
+        for client in ('a', 'b', 'c'):
+            limiter.acquire(client)
+        assert limiter.acquire('a') == 0.0
+        assert limiter.acquire('c') > 0
+
+
+@pytest.mark.unit
+class TestConcurrencyLimiter:
+    """Test the concurrency limit and its bounded queue."""
+
+    def test_queue_full(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=0)
+        assert limiter.acquire() == 'admitted'
+        assert limiter.acquire() == 'queue_full'
+        limiter.release()
+        assert limiter.acquire() == 'admitted'
+
+    def test_queue_timeout(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=1, timeout=0.01)
+        limiter.acquire()
+        assert limiter.acquire() == 'queue_timeout'
+        assert limiter.waiting == 0
+
+    def test_non_blocking_acquire_never_queues(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=4, timeout=5)
+        assert limiter.acquire(block=False) == 'admitted'
+        assert limiter.acquire(block=False) == 'queue_full'
+        assert limiter.waiting == 0
+
+    def test_server_backlog_counts_against_queue(self):
+        limiter = ConcurrencyLimiter(limit=2, queue_size=3)
+        backlog = [4]
+        limiter.backlog = lambda: backlog[0]
+        assert limiter.acquire() == 'queue_full'
+        backlog[0] = 3
+        assert limiter.acquire() == 'admitted'
+        assert limiter.acquire() == 'admitted'
+        assert limiter.acquire() == 'queue_full'
+
+    def test_release_admits_waiter(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=1, timeout=5)
+        limiter.acquire()
+        outcomes = []
+        waiter = threading.Thread(target=lambda: outcomes.append(limiter.acquire()))
+        waiter.start()
+        while limiter.waiting == 0:
+            threading.Event().wait(0.001)
+        limiter.release()
+        waiter.join()
+        assert outcomes == ['admitted']
+        assert limiter.active == 1
+
+
+@pytest.mark.unit
+class TestAdmissionController:
+    """Test admission decisions and their counts."""
+
+    def test_counts_and_retry_after(self, clock):
+        controller = AdmissionController(RateLimiter(rate=0.5, burst=1),
+                                         ConcurrencyLimiter(limit=1), retry_after=2)
+        assert controller.admit('a') == ('admitted', 0)
+        assert controller.admit('a') == ('rate_limited', 2)
+        assert controller.admit('b') == ('queue_full', 2)
+        controller.release()
+
+        stats = controller.stats()
+        assert (stats['admitted'], stats['rate_limited'], stats['queue_full']) == (1, 1, 1)
+        assert (stats['active'], stats['limit']) == (0, 1)
+
+    def test_limiters_are_optional(self):
+        controller = AdmissionController()
+        assert controller.admit(None) == ('admitted', 0)
+        controller.release()
+        assert controller.stats()['limit'] is None
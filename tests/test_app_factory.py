@@ -1,6 +1,7 @@
 import pytest
 from backend.app import create_app
 from backend.config import Config
+from backend.utils.converters import rate_cache, registry
 
 
 @pytest.mark.unit
@@ -27,3 +28,91 @@ def test_app_blueprint_registration():
     app = create_app(Config)
     assert 'main' in [bp.name for bp in app.blueprints.values()]
 
+
+
+@pytest.mark.unit
+def test_app_loads_currency_rates_file(tmp_path):
+    """Test that a configured rates file replaces the mock rates"""
+    path = tmp_path / 'rates.json'
+    path.write_text('{"USD": 1.0, "EUR": 0.5}')
+
+    class RatesConfig(Config):
+        CURRENCY_RATES_FILE = str(path)
+
+    original = rate_cache.provider
+    try:
+        create_app(RatesConfig)
+        assert rate_cache.snapshot().rates == {'USD': 1.0, 'EUR': 0.5}
+        assert registry.units('currency') == ['USD', 'EUR']
+    finally:
+        rate_cache.stop()
+        rate_cache.provider = original
+        rate_cache.refresh()
+
+
+@pytest.mark.unit
+def test_app_sessions_still_work():
+    """Test that cookie sessions round-trip with the lazy session interface"""
+    from flask import session
+
+    app = create_app(Config)
+
+    @app.route('/counter')
+    def counter():
+        session['count'] = session.get('count', 0) + 1
+        return str(session['count'])
+
+    client = app.test_client()
+    assert client.get('/counter').data == b'1'
+    assert client.get('/counter').data == b'2'
+    assert 'Set-Cookie' not in client.get('/health').headers
+
+
+@pytest.mark.unit
+def test_app_startup_skips_numpy():
+    """Test that NumPy is only imported by the first bulk conversion"""
+    import subprocess
+    import sys
+
+    code = ("import sys\n"
+            "from backend.app import create_app\n"
+            "from backend.config import Config\n"
+            "create_app(Config).test_client().get('/')\n"
+            "print('numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+@pytest.mark.unit
+def test_app_shared_rates_fall_back(monkeypatch, caplog):
+    """Test that the app keeps in-process rates when shared memory is unavailable"""
+    from backend.utils import shared_rates
+
+    class SharedConfig(Config):
+        SHARED_RATES = True
+
+    monkeypatch.setattr(shared_rates, 'shared_memory', None)
+    app = create_app(SharedConfig)
+    assert not rate_cache.shared
+    assert 'Shared memory is unavailable' in caplog.text
+    assert app.test_client().post('/api/convert/currency', json={
+        'value': 1, 'from_currency': 'USD', 'to_currency': 'EUR'
+    }).get_json()['result'] == 0.85
+
+
+@pytest.mark.unit
+def test_app_shared_rates_need_preload(monkeypatch, caplog):
+    """Test that without PRELOAD_APP no shared table is created"""
+    from backend.utils.shared_rates import SharedRateTable
+
+    class SharedConfig(Config):
+        SHARED_RATES = True
+        PRELOAD_APP = False
+
+    def create(*args, **kwargs):
+        raise AssertionError('a worker must not create its own shared table')
+
+    monkeypatch.setattr(SharedRateTable, 'create', create)
+    create_app(SharedConfig)
+    assert not rate_cache.shared
+    assert 'SHARED_RATES needs PRELOAD_APP' in caplog.text
@@ -0,0 +1,158 @@
+"""Tests for the ASGI adapter."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Executor, Future
+
+import pytest
+from backend.app import create_app
+from backend.app.asgi import AsgiApp
+from backend.config import Config
+
+pytestmark = pytest.mark.integration
+
+
+def call(app, method, path, body=b'', headers=(), query_string=b''):
+    """Run one HTTP request through an ASGI app and collect the response"""
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query_string,
+        'http_version': '1.1', 'scheme': 'http', 'server': ('testserver', 80),
+        'client': ('127.0.0.1', 50000), 'root_path': '',
+        'headers': [(k.encode(), v.encode()) for k, v in headers],
+    }
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    assert start['type'] == 'http.response.start'
+    assert sent[-1]['more_body'] is False
+    return start['status'], dict(start['headers']), b''.join(m['body'] for m in sent[1:])
+
+
+@pytest.fixture
+def asgi_app():
+    """ASGI adapter around a fresh Flask app"""
+    return AsgiApp(create_app(Config))
+
+
+@pytest.mark.smoke
+def test_asgi_health(asgi_app):
+    status, headers, body = call(asgi_app, 'GET', '/health')
+    assert status == 200
+    assert headers[b'content-type'] == b'application/json'
+    assert json.loads(body)['status'] == 'healthy'
+
+
+def test_asgi_conversion(asgi_app):
+    payload = json.dumps({'value': 100, 'from_unit': 'meter', 'to_unit': 'kilometer'}).encode()
+    status, _, body = call(asgi_app, 'POST', '/api/convert/length', payload,
+                           [('content-type', 'application/json')])
+    assert status == 200
+    assert json.loads(body)['result'] == 0.1
+
+
+def test_asgi_large_body_runs_in_executor(asgi_app):
+    asgi_app.inline_body_bytes = 0
+    status, _, body = call(asgi_app, 'POST', '/api/convert/stream',
+                           b'1,meter,centimeter\n', [('content-type', 'text/csv')],
+                           query_string=b'category=length')
+    assert status == 200
+    assert body.decode().splitlines()[1] == '1,100.0,'
+
+
+def test_asgi_inline_request_is_shed_instead_of_queued():
+    class QueueConfig(Config):
+        MAX_CONCURRENT_REQUESTS = 1
+        ADMISSION_QUEUE_TIMEOUT = 30.0
+
+    app = create_app(QueueConfig)
+    concurrency = app.extensions['admission'].concurrency
+    concurrency.acquire()
+    # The only slot is taken: waiting for it would block the event loop
+    status, headers, _ = call(AsgiApp(app), 'GET', '/api/info')
+    assert status == 503
+    assert headers[b'retry-after'] == b'1'
+    assert concurrency.waiting == 0
+
+    concurrency.release()
+    status, _, _ = call(AsgiApp(app), 'GET', '/api/info')
+    assert status == 200
+
+
+class ThreadPerJobExecutor(Executor):
+    """Runs every job on a new thread, so no two steps share one"""
+
+    def __init__(self):
+        self.jobs = 0
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+
+        def run():
+            self.jobs += 1
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        return future
+
+
+def test_asgi_offloaded_stream_keeps_request_context():
+    class SmallChunkConfig(Config):
+        STREAM_CHUNK_SIZE = 1
+
+    executor = ThreadPerJobExecutor()
+    app = AsgiApp(create_app(SmallChunkConfig), inline_body_bytes=0, executor=executor)
+    rows = ''.join(f"{i},meter,centimeter\n" for i in range(50)).encode()
+    status, _, body = call(app, 'POST', '/api/convert/stream', rows,
+                           [('content-type', 'text/csv')], query_string=b'category=length')
+    assert status == 200
+    lines = body.decode().splitlines()
+    assert len(lines) == 51
+    assert lines[-1] == '50,4900.0,'
+    assert executor.jobs > 50
+
+
+def test_asgi_cpu_heavy_route_is_offloaded(asgi_app):
+    executor = ThreadPerJobExecutor()
+    asgi_app.executor = executor
+    payload = json.dumps({'value': '1' * 100, 'from_base': 'decimal', 'to_base': 'hexadecimal'}).encode()
+    status, _, _ = call(asgi_app, 'POST', '/api/convert/number-base', payload,
+                        [('content-type', 'application/json')])
+    assert status == 200
+    assert executor.jobs
+
+    executor.jobs = 0
+    call(asgi_app, 'GET', '/health')
+    assert executor.jobs == 0
+
+
+def test_asgi_not_found(asgi_app):
+    status, _, _ = call(asgi_app, 'GET', '/missing')
+    assert status == 404
+
+
+def test_asgi_lifespan(asgi_app):
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message['type'])
+
+    asyncio.run(asgi_app({'type': 'lifespan'}, receive, send))
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
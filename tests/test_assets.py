@@ -0,0 +1,53 @@
+"""Unit tests for the static asset bundle."""
+
+import gzip
+
+import pytest
+from backend.utils.assets import AssetBundle
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'style.css').write_text('body { color: black; }\n' * 100)
+    (tmp_path / 'tiny.txt').write_text('hi')
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestAssetBundle:
+    """Test AssetBundle."""
+
+    def test_hashed_names_follow_content(self, static_dir):
+        bundle = AssetBundle(str(static_dir)).build()
+        name = bundle.url_name('css/style.css')
+        assert name.startswith('css/style.') and name.endswith('.css')
+        assert AssetBundle(str(static_dir)).build().url_name('css/style.css') == name
+
+        (static_dir / 'css' / 'style.css').write_text('body { color: red; }\n' * 100)
+        bundle.build()
+        assert bundle.url_name('css/style.css') != name
+        # Pages rendered before the rebuild still resolve their assets
+        assert bundle.get(name) is not None
+
+    def test_precompresses_large_text_files(self, static_dir):
+        bundle = AssetBundle(str(static_dir)).build()
+        asset = bundle.get(bundle.url_name('css/style.css'))
+        assert gzip.decompress(asset.encodings['gzip']) == asset.encodings['identity']
+        assert 'gzip' not in bundle.get(bundle.url_name('tiny.txt')).encodings
+
+    def test_negotiate(self, static_dir):
+        bundle = AssetBundle(str(static_dir)).build()
+        asset = bundle.get(bundle.url_name('css/style.css'))
+        encoding, data, etag = asset.negotiate('gzip;q=1.0, deflate')
+        assert encoding == 'gzip'
+        assert etag == f"{asset.etag}-gzip"
+        assert asset.negotiate('')[0] == 'identity'
+
+    def test_write(self, static_dir, tmp_path_factory):
+        output = tmp_path_factory.mktemp('out')
+        bundle = AssetBundle(str(static_dir)).build()
+        paths = bundle.write(str(output))
+        name = bundle.url_name('css/style.css')
+        assert str(output / name) in paths
+        assert str(output / (name + '.gz')) in paths
@@ -0,0 +1,145 @@
+"""Benchmarks for the converters and routes.
+
+Excluded from the default run; use `pytest -m benchmark --no-cov`. Each
+benchmark's ops/sec is scored against a calibration loop timed alongside it
+and fails when the score falls more than --benchmark-threshold below
+tests/benchmarks/baseline.json; refresh the baseline on a quiet machine
+with --benchmark-update.
+"""
+
+import json
+
+import pytest
+from backend.app import create_app
+from backend.config import Config
+from backend.utils.converters import (
+    CurrencyConverter,
+    LengthConverter,
+    NumberBaseConverter,
+    TemperatureConverter,
+    VolumeConverter,
+    WeightConverter,
+)
+
+pytestmark = pytest.mark.benchmark
+
+MANY_VALUES = [float(i) for i in range(1000)]
+
+
+class UncachedConfig(Config):
+    RESULT_CACHE_SIZE = 0
+
+
+@pytest.fixture(scope='module')
+def client():
+    """Test client without the result cache, so every request does the work"""
+    app = create_app(UncachedConfig)
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture(scope='module')
+def cached_client():
+    """Test client with the result cache enabled"""
+    app = create_app(Config)
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+class TestConverterBenchmarks:
+    """Time each converter class directly."""
+
+    @pytest.mark.parametrize('converter, from_unit, to_unit', [
+        (LengthConverter, 'meter', 'foot'),
+        (WeightConverter, 'kilogram', 'pound'),
+        (TemperatureConverter, 'celsius', 'fahrenheit'),
+        (VolumeConverter, 'liter', 'gallon'),
+        (CurrencyConverter, 'USD', 'EUR'),
+    ])
+    def test_convert(self, benchmark, converter, from_unit, to_unit):
+        benchmark(f"{converter.__name__}.convert",
+                  lambda: converter.convert(12.5, from_unit, to_unit))
+
+    @pytest.mark.parametrize('converter, from_unit, to_unit', [
+        (LengthConverter, 'meter', 'foot'),
+        (WeightConverter, 'kilogram', 'pound'),
+        (TemperatureConverter, 'celsius', 'fahrenheit'),
+        (VolumeConverter, 'liter', 'gallon'),
+        (CurrencyConverter, 'USD', 'EUR'),
+    ])
+    def test_convert_many(self, benchmark, converter, from_unit, to_unit):
+        benchmark(f"{converter.__name__}.convert_many[1000]",
+                  lambda: converter.convert_many(MANY_VALUES, from_unit, to_unit))
+
+    @pytest.mark.parametrize('value, from_base, to_base', [
+        ('255', 'decimal', 'hexadecimal'),
+        ('11111111', 'binary', 'decimal'),
+        ('9' * 5000, 'decimal', 'hexadecimal'),
+    ])
+    def test_number_base(self, benchmark, value, from_base, to_base):
+        benchmark(f"NumberBaseConverter.convert[{from_base}-{to_base}-{len(value)}]",
+                  lambda: NumberBaseConverter.convert(value, from_base, to_base))
+
+
+class TestRouteBenchmarks:
+    """Time each route through the Flask test client."""
+
+    @pytest.mark.parametrize('path, payload', [
+        ('/api/convert/length', {'value': 100, 'from_unit': 'meter', 'to_unit': 'kilometer'}),
+        ('/api/convert/weight', {'value': 100, 'from_unit': 'gram', 'to_unit': 'kilogram'}),
+        ('/api/convert/temperature', {'value': 100, 'from_unit': 'celsius', 'to_unit': 'fahrenheit'}),
+        ('/api/convert/volume', {'value': 100, 'from_unit': 'liter', 'to_unit': 'milliliter'}),
+        ('/api/convert/currency', {'value': 100, 'from_currency': 'USD', 'to_currency': 'EUR'}),
+        ('/api/convert/number-base', {'value': '255', 'from_base': 'decimal', 'to_base': 'binary'}),
+        ('/api/convert/batch', {'conversions': [
+            {'category': 'length', 'value': i, 'from_unit': 'meter', 'to_unit': 'foot'}
+            for i in range(100)
+        ]}),
+    ])
+    def test_post(self, benchmark, client, path, payload):
+        body = json.dumps(payload)
+
+        def post():
+            response = client.post(path, data=body, content_type='application/json')
+            assert response.status_code == 200
+
+        benchmark(f"POST {path}", post)
+
+    def test_cached_post(self, benchmark, cached_client):
+        body = json.dumps({'value': 100, 'from_unit': 'meter', 'to_unit': 'kilometer'})
+
+        def post():
+            response = cached_client.post('/api/convert/length', data=body,
+                                          content_type='application/json')
+            assert response.status_code == 200
+
+        benchmark('POST /api/convert/length (cached)', post)
+
+    def test_stream(self, benchmark, client):
+        body = ''.join(f"{i},meter,foot\n" for i in range(1000))
+
+        def post():
+            response = client.post('/api/convert/stream?category=length', data=body,
+                                   content_type='text/csv')
+            assert response.status_code == 200
+            response.get_data()
+
+        benchmark('POST /api/convert/stream[1000]', post)
+
+    def test_number_base_file(self, benchmark, client):
+        body = b'ff' * 1000
+
+        def post():
+            response = client.post('/api/convert/number-base/file?from_base=hexadecimal&to_base=binary',
+                                   data=body, content_type='text/plain')
+            assert response.status_code == 200
+            response.get_data()
+
+        benchmark('POST /api/convert/number-base/file', post)
+
+    @pytest.mark.parametrize('path', ['/', '/health', '/api/info', '/api/units', '/api/cache'])
+    def test_get(self, benchmark, client, path):
+        def get():
+            assert client.get(path).status_code == 200
+
+        benchmark(f"GET {path}", get)
@@ -0,0 +1,50 @@
+"""Unit tests for the big-number base conversion path."""
+
+import random
+
+import pytest
+from backend.utils import bignum
+from backend.utils.converters import NumberBaseConverter
+
+
+@pytest.fixture
+def big_number():
+    """A number with about 30,000 decimal digits."""
+    return random.Random(7).getrandbits(100000)
+
+
+@pytest.mark.unit
+class TestBigNum:
+    """Test bignum conversions."""
+
+    def test_decimal_round_trip(self, big_number):
+        digits = bignum.int_to_decimal(big_number)
+        assert len(digits) > 10000
+        assert bignum.decimal_to_int(digits) == big_number
+
+    def test_decimal_matches_hex(self, big_number):
+        digits = bignum.int_to_decimal(big_number)
+        assert bignum.convert(digits, 10, 16) == format(big_number, 'X')
+        assert bignum.convert(format(big_number, 'x'), 16, 10) == digits
+
+    @pytest.mark.parametrize("from_radix,to_radix", [
+        (2, 16), (16, 2), (8, 16), (16, 8), (2, 8), (8, 2),
+    ])
+    def test_regroup(self, big_number, from_radix, to_radix):
+        formats = {2: 'b', 8: 'o', 16: 'X'}
+        value = format(big_number, formats[from_radix])
+        assert bignum.convert(value, from_radix, to_radix) == format(big_number, formats[to_radix])
+
+    def test_leading_zeros_and_sign(self):
+        assert bignum.regroup('0000', 2, 16) == '0'
+        assert bignum.convert('-00ff', 16, 2) == '-11111111'
+        assert bignum.convert('-0', 10, 16) == '0'
+
+    def test_invalid_digits(self):
+        with pytest.raises(ValueError):
+            bignum.convert('12a', 10, 2)
+
+    def test_converter_uses_large_path(self, big_number):
+        digits = bignum.int_to_decimal(big_number)
+        assert NumberBaseConverter.convert(digits, 'decimal', 'hexadecimal') == format(big_number, 'X')
+        assert NumberBaseConverter.convert(format(big_number, 'X'), 'hexadecimal', 'decimal') == digits
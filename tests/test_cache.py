@@ -0,0 +1,43 @@
+"""Unit tests for the LRU result cache."""
+
+import pytest
+from backend.utils.cache import LRUCache
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """Test LRUCache."""
+
+    def test_hit_and_miss(self):
+        cache = LRUCache(maxsize=2)
+        assert cache.get('a') is None
+        cache.set('a', b'1')
+        assert cache.get('a')[0] == b'1'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hit_rate'] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a')[0] == 1
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr('backend.utils.cache.time.monotonic', lambda: now[0])
+        cache = LRUCache(maxsize=2, ttl=10)
+        cache.set('a', 1)
+        now[0] += 11
+        assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables(self):
+        cache = LRUCache(maxsize=0)
+        cache.set('a', 1)
+        assert cache.get('a') is None
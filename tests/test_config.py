@@ -30,3 +30,76 @@ class TestConfig:
         assert hasattr(Config, "PORT")
         assert isinstance(Config.PORT, int)
         assert 1 <= Config.PORT <= 65535
+
+    def test_max_batch_size_is_positive_int(self):
+        """MAX_BATCH_SIZE is a positive integer."""
+        assert isinstance(Config.MAX_BATCH_SIZE, int)
+        assert Config.MAX_BATCH_SIZE > 0
+
+    def test_stream_chunk_size_is_positive_int(self):
+        """STREAM_CHUNK_SIZE is a positive integer."""
+        assert isinstance(Config.STREAM_CHUNK_SIZE, int)
+        assert Config.STREAM_CHUNK_SIZE > 0
+
+    def test_result_cache_settings(self):
+        """Result cache size and TTL are non-negative numbers."""
+        assert isinstance(Config.RESULT_CACHE_SIZE, int)
+        assert Config.RESULT_CACHE_SIZE >= 0
+        assert Config.RESULT_CACHE_TTL >= 0
+
+    def test_server_settings(self):
+        """Server mode and pool sizes are configured."""
+        assert Config.SERVER_MODE in ('waitress', 'asgi', 'gunicorn')
+        assert Config.WAITRESS_THREADS > 0
+        assert Config.ASGI_BACKLOG > 0
+
+    def test_worker_settings(self):
+        """Worker, thread and recycling settings are non-negative integers."""
+        assert Config.WORKERS > 0
+        assert Config.WORKER_THREADS > 0
+        assert isinstance(Config.PRELOAD_APP, bool)
+        assert isinstance(Config.REUSE_PORT, bool)
+        assert 0 <= Config.MAX_REQUESTS_JITTER <= Config.MAX_REQUESTS
+        assert Config.GRACEFUL_TIMEOUT >= 0
+
+    def test_metrics_enabled_is_bool(self):
+        """METRICS_ENABLED is a boolean."""
+        assert isinstance(Config.METRICS_ENABLED, bool)
+
+    def test_profile_settings(self):
+        """Profiling is off unless a directory is configured."""
+        assert 0.0 <= Config.PROFILE_SAMPLE_RATE <= 1.0
+        assert Config.PROFILE_MODE in ('cprofile', 'stack')
+
+    def test_assets_precompress_is_bool(self):
+        """ASSETS_PRECOMPRESS is a boolean."""
+        assert isinstance(Config.ASSETS_PRECOMPRESS, bool)
+
+    def test_binary_settings(self):
+        """Binary conversion buffer sizes are positive."""
+        assert Config.BINARY_INLINE_BYTES > 0
+        assert Config.BINARY_CHUNK_VALUES > 0
+
+    def test_number_base_file_limit(self):
+        """Whole-number file conversions have a positive size limit."""
+        assert isinstance(Config.NUMBER_BASE_FILE_MAX_BYTES, int)
+        assert Config.NUMBER_BASE_FILE_MAX_BYTES > 0
+
+    def test_admission_settings(self):
+        """Rate and concurrency limits are non-negative."""
+        assert Config.RATE_LIMIT >= 0
+        assert Config.RATE_LIMIT_BURST >= 1
+        assert Config.MAX_CONCURRENT_REQUESTS >= 0
+        assert Config.ADMISSION_QUEUE_SIZE >= 0
+        assert Config.ADMISSION_QUEUE_TIMEOUT >= 0
+
+    def test_shared_rates_is_bool(self):
+        """SHARED_RATES is a boolean."""
+        assert isinstance(Config.SHARED_RATES, bool)
+
+    def test_ready_thresholds(self):
+        """Readiness thresholds and the latency window are numbers."""
+        assert Config.READY_MAX_P99_SECONDS >= 0
+        assert Config.READY_MAX_QUEUE_DEPTH >= 0
+        assert 0 <= Config.READY_MAX_UTILIZATION <= 1.0
+        assert Config.READY_LATENCY_WINDOW > 0
@@ -1,4 +1,7 @@
+import array
+
 import pytest
+from backend.utils import registry
 from backend.utils.converters import (
     LengthConverter, WeightConverter, TemperatureConverter,
     VolumeConverter, CurrencyConverter, NumberBaseConverter
@@ -126,9 +129,64 @@ class TestNumberBaseConverter:
         result = NumberBaseConverter.convert('100', 'octal', 'decimal')
         assert result == '64'
     
+    @pytest.mark.parametrize("value", ["0xff", "f_f", " ff", "ff ", "+0x"])
+    @pytest.mark.parametrize("length", [0, NumberBaseConverter.LARGE_INPUT_DIGITS + 1])
+    def test_same_digit_rules_on_both_sides_of_cutoff(self, value, length):
+        with pytest.raises(ValueError):
+            NumberBaseConverter.convert(value + "f" * length, 'hexadecimal', 'decimal')
+
+    @pytest.mark.parametrize("length", [NumberBaseConverter.LARGE_INPUT_DIGITS, NumberBaseConverter.LARGE_INPUT_DIGITS + 1])
+    def test_signed_and_lowercase_digits_on_both_sides_of_cutoff(self, length):
+        value = "f" * length
+        expected = str(int(value, 16))
+        assert NumberBaseConverter.convert(value, 'hexadecimal', 'decimal') == expected
+        assert NumberBaseConverter.convert("-" + value, 'hexadecimal', 'decimal') == "-" + expected
+    
     def test_invalid_base(self):
         with pytest.raises(ValueError):
             NumberBaseConverter.convert('10', 'invalid', 'binary')
+        with pytest.raises(ValueError):
+            NumberBaseConverter.convert('10', 'decimal', 37)
+
+    @pytest.mark.parametrize("value,from_base,to_base,expected", [
+        ("zz", "36", "decimal", "1295"),
+        ("1295", "decimal", 36, "ZZ"),
+        ("-101", "binary", "decimal", "-5"),
+        ("12", 3, 5, "10"),
+        ("255", "decimal", "base64", "D/"),
+        ("/w", "base64", "hexadecimal", "FF0"),
+        ("-_", "base64url", "decimal", "4031"),
+        ("BA", "base32", "decimal", "32"),
+        ("10", "32", "base32", "BA"),
+    ])
+    def test_arbitrary_radix(self, value, from_base, to_base, expected):
+        """Radixes 2-36 and base32/base64 alphabets."""
+        assert NumberBaseConverter.convert(value, from_base, to_base) == expected
+
+    def test_convert_file_raw_bytes(self, tmp_path):
+        """Raw bytes convert chunk by chunk to power-of-two bases."""
+        data = bytes(range(256)) * 5000
+        path = tmp_path / 'data.bin'
+        path.write_bytes(data)
+        number = int.from_bytes(data, 'big')
+        result = ''.join(NumberBaseConverter.convert_file(str(path), 'bytes', 'hexadecimal'))
+        assert result == format(number, 'X')
+        result = ''.join(NumberBaseConverter.convert_file(str(path), 'bytes', 'octal'))
+        assert result == format(number, 'o')
+
+    def test_convert_file_hex_dump(self, tmp_path):
+        """Digit files may contain whitespace between digits."""
+        path = tmp_path / 'dump.hex'
+        path.write_text('00ff 10\n0a\n')
+        assert ''.join(NumberBaseConverter.convert_file(str(path), 'hexadecimal', 'binary')) == \
+            format(0xff100a, 'b')
+        assert ''.join(NumberBaseConverter.convert_file(str(path), '16', 'decimal')) == str(0xff100a)
+
+    def test_convert_file_invalid_digits(self, tmp_path):
+        path = tmp_path / 'dump.hex'
+        path.write_text('12 xyz')
+        with pytest.raises(ValueError):
+            NumberBaseConverter.convert_file(str(path), 'hexadecimal', 'binary')
 
     @pytest.mark.parametrize("value,from_base,to_base,expected", [
         ("0", "decimal", "binary", "0"),
@@ -142,3 +200,81 @@ class TestNumberBaseConverter:
         result = NumberBaseConverter.convert(value, from_base, to_base)
         assert result == expected
 
+
+
+@pytest.mark.unit
+class TestConvertMany:
+    """Test vectorized convert_many against the scalar path"""
+
+    VALUES = [0, 1, -2.5, 1234.5678, 0.0000005, 1e12 + 0.1234565, -0.0]
+
+    @pytest.mark.parametrize("converter,from_unit,to_unit", [
+        (LengthConverter, 'inch', 'centimeter'),
+        (WeightConverter, 'pound', 'ounce'),
+        (VolumeConverter, 'gallon', 'cup'),
+        (TemperatureConverter, 'fahrenheit', 'kelvin'),
+        (CurrencyConverter, 'EUR', 'JPY'),
+    ])
+    def test_matches_scalar_path(self, converter, from_unit, to_unit):
+        expected = [converter.convert(v, from_unit, to_unit) for v in self.VALUES]
+        assert converter.convert_many(self.VALUES, from_unit, to_unit) == expected
+
+    def test_pure_python_fallback(self, monkeypatch):
+        monkeypatch.setattr(registry, 'np', None)
+        values = array.array('d', self.VALUES)
+        result = LengthConverter.convert_many(values, 'mile', 'kilometer')
+        assert isinstance(result, array.array)
+        assert result.tolist() == [LengthConverter.convert(v, 'mile', 'kilometer') for v in values]
+
+    def test_array_input_returns_array(self):
+        values = array.array('d', [32.0, 212.0])
+        result = TemperatureConverter.convert_many(values, 'fahrenheit', 'celsius')
+        assert isinstance(result, array.array)
+        assert result.tolist() == [0.0, 100.0]
+
+    def test_numpy_input_returns_numpy(self):
+        np = pytest.importorskip('numpy')
+        values = np.linspace(-1000, 1000, 10001)
+        result = CurrencyConverter.convert_many(values, 'USD', 'INR')
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [CurrencyConverter.convert(v, 'USD', 'INR') for v in values.tolist()]
+
+    def test_temperature_same_unit(self):
+        assert TemperatureConverter.convert_many([1, 2.5], 'kelvin', 'kelvin') == [1.0, 2.5]
+
+    def test_invalid_unit(self):
+        with pytest.raises(ValueError):
+            VolumeConverter.convert_many([1.0], 'invalid', 'liter')
+
+
+@pytest.mark.unit
+class TestConvertAll:
+    """Test fan-out convert_all against the scalar path"""
+
+    VALUES = [0, 1, -2.5, 1234.5678, 0.0000005, 1e12 + 0.1234565]
+
+    @pytest.mark.parametrize("converter,from_unit", [
+        (LengthConverter, 'inch'),
+        (WeightConverter, 'pound'),
+        (VolumeConverter, 'gallon'),
+        (TemperatureConverter, 'fahrenheit'),
+        (CurrencyConverter, 'EUR'),
+    ])
+    def test_matches_scalar_path(self, converter, from_unit):
+        units, rows = converter.convert_all(self.VALUES, from_unit)
+        assert rows == [[converter.convert(v, from_unit, t) for t in units] for v in self.VALUES]
+
+    def test_pure_python_fallback(self, monkeypatch):
+        expected = TemperatureConverter.convert_all(self.VALUES, 'kelvin')
+        monkeypatch.setattr(registry, 'np', None)
+        assert TemperatureConverter.convert_all(self.VALUES, 'kelvin') == expected
+
+    def test_numpy_input_returns_matrix(self):
+        np = pytest.importorskip('numpy')
+        units, rows = WeightConverter.convert_all(np.array([1.0, 2.0, 3.0]), 'kilogram')
+        assert isinstance(rows, np.ndarray)
+        assert rows.shape == (3, len(units))
+
+    def test_invalid_unit(self):
+        with pytest.raises(ValueError, match='Invalid unit: parsec'):
+            LengthConverter.convert_all([1.0], 'parsec')
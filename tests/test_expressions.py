@@ -0,0 +1,70 @@
+"""Unit tests for compound unit expressions."""
+
+import pytest
+from backend.utils.converters import CompoundConverter, LengthConverter
+from backend.utils.expressions import CompoundUnits, describe
+
+
+@pytest.mark.unit
+class TestCompoundUnits:
+    """Test parsing, dimensional analysis and the plan cache."""
+
+    @pytest.mark.parametrize('from_unit,to_unit,expected', [
+        ('km/h', 'm/s', 27.777778),
+        ('ft^2', 'm^2', 9.290304),
+        ('gallon/mile', 'liter/kilometer', 235.215057),
+        ('kilometers/hour', 'meter/second', 27.777778),
+        ('kg*m/s^2', 'g*cm/s**2', 10000000.0),
+        ('m/(s*s)', 'm/s^2', 100.0),
+        ('1/hour', 's^-1', 0.027778),
+        ('cubic_meter', 'm^3', 100.0),
+    ])
+    def test_convert(self, from_unit, to_unit, expected):
+        assert CompoundConverter.convert(100, from_unit, to_unit) == expected
+
+    def test_plain_units_match_linear_converters(self):
+        assert CompoundConverter.convert(5, 'mile', 'kilometer') == LengthConverter.convert(5, 'mile', 'kilometer')
+
+    def test_convert_many(self):
+        assert CompoundConverter.convert_many([0, 36, 72], 'km/h', 'm/s') == [0.0, 10.0, 20.0]
+
+    def test_dimension_mismatch(self):
+        with pytest.raises(ValueError, match=r'Cannot convert km/h \(length/time\) to kg \(mass\)'):
+            CompoundConverter.convert(1, 'km/h', 'kg')
+
+    @pytest.mark.parametrize('expression', [
+        '', 'm/', '(m', 'm^x', 'm s', 'm$', 'celsius', 'parsec/s', None,
+    ])
+    def test_invalid_expression(self, expression):
+        with pytest.raises(ValueError):
+            CompoundConverter.convert(1, expression, 'm')
+
+    @pytest.mark.parametrize('from_expression, to_expression', [
+        ('km^1000', 'm^1000'),
+        ('mm^200/mm^200', '1'),
+        ('mm^-200*mm^-200', 'm^-400'),
+        ('km^100', 'mm^100'),
+    ])
+    def test_out_of_range(self, from_expression, to_expression):
+        with pytest.raises(ValueError, match='out of range'):
+            CompoundConverter.convert(1, from_expression, to_expression)
+
+    def test_nesting_depth_is_limited(self):
+        assert CompoundConverter.convert(1, '(' * 64 + 'km' + ')' * 64, 'm') == 1000.0
+        for depth in (65, 1500):
+            with pytest.raises(ValueError, match='nested too deeply'):
+                CompoundConverter.convert(1, '(' * depth + 'km' + ')' * depth, 'm')
+
+    def test_plans_are_cached(self):
+        units = CompoundUnits.from_tables({'meter': 1.0}, {'kilogram': 1.0}, {'liter': 1.0})
+        plan = units.plan('m/s', 'm/hour')
+        assert units.plan('m/s', 'm/hour') is plan
+        assert (units.plans.hits, units.plans.misses) == (1, 1)
+        assert plan.scale == 3600.0
+
+    def test_describe(self):
+        assert describe((1, 0, -1)) == 'length/time'
+        assert describe((1, 1, -2)) == 'length*mass/time^2'
+        assert describe((0, 0, -1)) == '1/time'
+        assert describe((-3, 1, 0)) == 'mass/length^3'
+        assert describe((0, 0, 0)) == 'dimensionless'
@@ -0,0 +1,58 @@
+"""Unit tests for the historical currency rate store."""
+
+import pytest
+from backend.utils.history import HistoricalRateStore, RECORD, parse_as_of
+
+DAY = 86400
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store with a few daily EUR and GBP rates."""
+    store = HistoricalRateStore(str(tmp_path))
+    start = parse_as_of('2024-01-01')
+    for day, rate in enumerate([0.90, 0.91, 0.92]):
+        store.append('EUR', start + day * DAY, rate)
+    store.append('GBP', start, 0.80)
+    yield store
+    store.close()
+
+
+@pytest.mark.unit
+class TestHistoricalRateStore:
+    """Test HistoricalRateStore."""
+
+    def test_as_of_lookup(self, store):
+        assert store.rate_as_of('EUR', parse_as_of('2024-01-01')) == 0.90
+        assert store.rate_as_of('EUR', parse_as_of('2024-01-02T12:00:00')) == 0.91
+        assert store.rate_as_of('EUR', parse_as_of('2030-01-01')) == 0.92
+
+    def test_before_first_rate(self, store):
+        with pytest.raises(ValueError):
+            store.rate_as_of('EUR', parse_as_of('2023-12-31'))
+
+    def test_base_currency_defaults_to_one(self, store):
+        assert store.rate_as_of('USD', parse_as_of('2024-01-02')) == 1.0
+
+    def test_conversion(self, store):
+        conversion = store.conversion('GBP', 'EUR', '2024-01-03')
+        assert conversion.convert(80) == 92.0
+
+    def test_append_must_increase(self, store):
+        with pytest.raises(ValueError):
+            store.append('EUR', parse_as_of('2024-01-02'), 0.95)
+
+    def test_reopen_maps_existing_files(self, store):
+        reopened = HistoricalRateStore(store.directory)
+        try:
+            assert reopened.currencies() == ['EUR', 'GBP']
+            assert reopened.rate_as_of('EUR', parse_as_of('2024-01-02')) == 0.91
+        finally:
+            reopened.close()
+
+    def test_compact_records(self, store, tmp_path):
+        assert (tmp_path / 'EUR.rates').stat().st_size == 3 * RECORD.size
+
+    def test_invalid_as_of(self):
+        with pytest.raises(ValueError):
+            parse_as_of('yesterday')
@@ -0,0 +1,74 @@
+"""Unit tests for the request metrics."""
+
+import threading
+
+import pytest
+from backend.utils.cache import LRUCache
+from backend.utils.metrics import Metrics
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Test Metrics."""
+
+    def test_counts_merge_across_threads(self):
+        metrics = Metrics()
+
+        def record():
+            for _ in range(1000):
+                metrics.observe_request('/health', 'GET', 200, 0.001)
+                metrics.count_conversion('length')
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        requests, latencies, conversions = metrics.snapshot()
+        assert requests[('/health', 'GET', 200)] == 4000
+        assert sum(latencies['/health'][:-1]) == 4000
+        assert conversions == {'length': 4000}
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = Metrics(buckets=(0.01, 0.1))
+        metrics.observe_request('/a', 'GET', 200, 0.01)
+        metrics.observe_request('/a', 'GET', 200, 0.05)
+        metrics.observe_request('/a', 'GET', 500, 3.0)
+
+        text = metrics.render()
+        assert 'converter_http_request_duration_seconds_bucket{endpoint="/a",le="0.01"} 1' in text
+        assert 'converter_http_request_duration_seconds_bucket{endpoint="/a",le="0.1"} 2' in text
+        assert 'converter_http_request_duration_seconds_bucket{endpoint="/a",le="+Inf"} 3' in text
+        assert 'converter_http_request_duration_seconds_count{endpoint="/a"} 3' in text
+        assert 'converter_http_request_errors_total{endpoint="/a",status="500"} 1' in text
+
+    def test_render_includes_cache_stats(self):
+        cache = LRUCache(maxsize=2)
+        cache.get('missing')
+        text = Metrics().render(cache)
+        assert 'converter_result_cache_misses_total 1' in text
+        assert 'converter_result_cache_size 0' in text
+
+    def test_recent_latency_quantile(self, monkeypatch):
+        from backend.utils import metrics as metrics_module
+        now = [100.0]
+        monkeypatch.setattr(metrics_module.time, 'monotonic', lambda: now[0])
+        metrics = Metrics()
+        assert metrics.recent_latency_quantile(0.99, window=10) is None
+
+        for _ in range(98):
+            metrics.observe_request('/api/convert/length', 'POST', 200, 0.002)
+        metrics.observe_request('/api/convert/length', 'POST', 200, 0.3)
+        metrics.observe_request('/api/convert/length', 'POST', 200, 20.0)
+        metrics.observe_request('/health', 'GET', 200, 30.0)
+        assert metrics.recent_latency_quantile(0.5, window=10) == 0.0025
+        assert metrics.recent_latency_quantile(0.99, window=10, exclude=('/health',)) == 0.5
+        assert metrics.recent_latency_quantile(1.0, window=10) == float('inf')
+
+        # Two windows later only newer requests count
+        now[0] += 10
+        metrics.recent_latency_quantile(0.99, window=10)
+        now[0] += 10
+        metrics.observe_request('/api/convert/length', 'POST', 200, 0.004)
+        assert metrics.recent_latency_quantile(0.99, window=10) == 0.005
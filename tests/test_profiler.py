@@ -0,0 +1,68 @@
+"""Unit tests for the request profiler."""
+
+import os
+import pstats
+import time
+
+import pytest
+from backend.utils.profiler import RequestProfiler
+
+
+def _work():
+    return sum(i * i for i in range(20000))
+
+
+@pytest.mark.unit
+class TestRequestProfiler:
+    """Test RequestProfiler."""
+
+    def test_disabled_records_nothing(self, tmp_path):
+        profiler = RequestProfiler(str(tmp_path))
+        assert profiler.start() is None
+        assert profiler.dump() == []
+
+    def test_cprofile_aggregates_per_route(self, tmp_path):
+        profiler = RequestProfiler(str(tmp_path), sample_rate=1.0)
+        for _ in range(2):
+            token = profiler.start()
+            _work()
+            profiler.stop(token, '/api/convert/<category>')
+
+        assert profiler.profiled == 2
+        paths = profiler.dump()
+        assert [os.path.basename(path) for path in paths] == ['api_convert_category.pstats']
+        stats = pstats.Stats(paths[0])
+        assert any(name == '_work' for _, _, name in stats.stats)
+
+    def test_stack_mode_writes_collapsed_stacks(self, tmp_path):
+        profiler = RequestProfiler(str(tmp_path), sample_rate=1.0, mode='stack', interval=0.0005)
+        token = profiler.start()
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            _work()
+        profiler.stop(token, '/health')
+
+        path, = profiler.dump()
+        assert path.endswith('health.collapsed')
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert lines
+        assert any('_work' in line for line in lines)
+        assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+    def test_one_request_at_a_time(self, tmp_path):
+        profiler = RequestProfiler(str(tmp_path), sample_rate=1.0)
+        token = profiler.start()
+        assert profiler.start() is None
+        profiler.stop(token, '/health')
+        profiler.stop(profiler.start(), '/health')
+        assert profiler.profiled == 2
+
+    def test_configure_validates(self, tmp_path):
+        profiler = RequestProfiler(str(tmp_path))
+        with pytest.raises(ValueError):
+            profiler.configure(sample_rate=2)
+        with pytest.raises(ValueError):
+            profiler.configure(mode='perf')
+        profiler.configure(sample_rate=0.5, mode='stack')
+        assert (profiler.sample_rate, profiler.mode) == (0.5, 'stack')
@@ -0,0 +1,116 @@
+"""Unit tests for currency rate providers and the rate cache."""
+
+import json
+import os
+
+import pytest
+from backend.utils.rates import FileRateProvider, RateCache, StaticRateProvider
+
+
+@pytest.fixture
+def rates_file(tmp_path):
+    """Write a rates file and return its path."""
+    path = tmp_path / 'rates.json'
+    path.write_text(json.dumps({'USD': 1.0, 'EUR': 0.5}))
+    return path
+
+
+@pytest.mark.unit
+class TestRateProviders:
+    """Test rate providers."""
+
+    def test_static_provider_returns_copy(self):
+        provider = StaticRateProvider({'USD': 1.0})
+        provider.fetch()['USD'] = 2.0
+        assert provider.fetch() == {'USD': 1.0}
+
+    def test_file_provider(self, rates_file):
+        assert FileRateProvider(rates_file).fetch() == {'USD': 1.0, 'EUR': 0.5}
+
+    def test_file_provider_rejects_bad_rates(self, tmp_path):
+        path = tmp_path / 'rates.json'
+        path.write_text(json.dumps({'USD': 0}))
+        with pytest.raises(ValueError):
+            FileRateProvider(path).fetch()
+
+
+@pytest.mark.unit
+class TestRateCache:
+    """Test RateCache."""
+
+    def test_initial_snapshot(self):
+        cache = RateCache(StaticRateProvider({'USD': 1.0, 'EUR': 0.5}))
+        snapshot = cache.snapshot()
+        assert snapshot.version == 1
+        assert snapshot.age >= 0
+        assert snapshot.conversion('USD', 'EUR').convert(10) == 5.0
+
+    def test_refresh_swaps_snapshot_and_notifies(self):
+        provider = StaticRateProvider({'USD': 1.0, 'EUR': 0.5})
+        cache = RateCache(provider)
+        published = []
+        cache.subscribe(published.append)
+        old = cache.snapshot()
+
+        provider.rates['EUR'] = 0.25
+        new = cache.refresh()
+        assert new.version == 2
+        assert published == [new]
+        assert cache.snapshot() is new
+        # Readers holding the old snapshot keep a consistent view
+        assert old.conversion('USD', 'EUR').convert(10) == 5.0
+        assert new.conversion('USD', 'EUR').convert(10) == 2.5
+
+    def test_unchanged_rates_keep_version(self):
+        cache = RateCache(StaticRateProvider({'USD': 1.0}))
+        assert cache.refresh().version == 1
+
+    def test_background_refresh(self, rates_file):
+        cache = RateCache(StaticRateProvider({'USD': 1.0}))
+        cache.start(FileRateProvider(rates_file), ttl=0.01)
+        try:
+            assert cache.snapshot().rates == {'USD': 1.0, 'EUR': 0.5}
+            rates_file.write_text(json.dumps({'USD': 1.0, 'EUR': 0.4}))
+            for _ in range(200):
+                if cache.snapshot().rates['EUR'] == 0.4:
+                    break
+                cache._stop.wait(0.01)
+            assert cache.snapshot().rates['EUR'] == 0.4
+        finally:
+            cache.stop()
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork()')
+    def test_forked_child_keeps_refreshing(self, rates_file):
+        cache = RateCache(FileRateProvider(rates_file))
+        cache.start(ttl=0.01)
+        ready_read, ready_write = os.pipe()
+        result_read, result_write = os.pipe()
+        try:
+            pid = os.fork()
+            if pid == 0:
+                os.read(ready_read, 1)
+                for _ in range(500):
+                    if cache.snapshot().rates['EUR'] == 0.4:
+                        break
+                    cache._stop.wait(0.01)
+                alive = cache._thread is not None and cache._thread.is_alive()
+                os.write(result_write, f"{cache.snapshot().rates['EUR']} {alive}".encode())
+                os._exit(0)
+
+            cache.stop()
+            rates_file.write_text(json.dumps({'USD': 1.0, 'EUR': 0.4}))
+            os.write(ready_write, b'x')
+            assert os.read(result_read, 64) == b'0.4 True'
+            os.waitpid(pid, 0)
+            assert cache.snapshot().rates['EUR'] == 0.5
+        finally:
+            cache.stop()
+            for fd in (ready_read, ready_write, result_read, result_write):
+                os.close(fd)
+
+    def test_failed_refresh_keeps_last_snapshot(self, rates_file):
+        cache = RateCache(FileRateProvider(rates_file))
+        rates_file.write_text('not json')
+        with pytest.raises(ValueError):
+            cache.refresh()
+        assert cache.snapshot().rates == {'USD': 1.0, 'EUR': 0.5}
@@ -0,0 +1,82 @@
+"""Unit tests for the unit registry."""
+
+import pytest
+from backend.utils.converters import CurrencyConverter, LengthConverter, registry
+from backend.utils.registry import UnitRegistry
+
+
+@pytest.mark.unit
+class TestUnitRegistry:
+    """Test UnitRegistry."""
+
+    def test_linear_factor_table(self):
+        """Linear categories precompute every unit pair."""
+        reg = UnitRegistry()
+        reg.register_linear('length', {'meter': 1.0, 'kilometer': 1000.0}, 6)
+        assert reg.factors('length') == {
+            'meter': {'meter': 1.0, 'kilometer': 0.001},
+            'kilometer': {'meter': 1000.0, 'kilometer': 1.0},
+        }
+        assert reg.conversion('length', 'kilometer', 'meter').convert(2.5) == 2500.0
+
+    def test_inverse_factors(self):
+        """Inverse tables hold units per base unit, like exchange rates."""
+        reg = UnitRegistry()
+        reg.register_linear('currency', {'USD': 1.0, 'EUR': 0.5}, 2, inverse=True)
+        assert reg.conversion('currency', 'USD', 'EUR').convert(10) == 5.0
+        assert reg.conversion('currency', 'EUR', 'USD').convert(10) == 20.0
+
+    @pytest.mark.parametrize('converter, value, from_unit, to_unit, expected', [
+        (CurrencyConverter, 498.875, 'EUR', 'EUR', 498.88),
+        (LengthConverter, -7099.384598715, 'meter', 'centimeter', -709938.459872),
+        (LengthConverter, 4052.511, 'mile', 'millimeter', 6521868052.74),
+        (LengthConverter, -3133.151, 'mile', 'millimeter', -5042305230.34),
+    ])
+    def test_precomputed_factor_rounding(self, converter, value, from_unit, to_unit, expected):
+        """Pair factors round as value * (f / t), not value * f / t (see README, Rounding)."""
+        assert converter.convert(value, from_unit, to_unit) == expected
+
+    def test_affine_conversion(self):
+        """Affine categories compile to a scale and an offset."""
+        reg = UnitRegistry()
+        reg.register_affine('temperature', {'celsius': (1.0, 0.0), 'kelvin': (1.0, -273.15)}, 6)
+        conversion = reg.conversion('temperature', 'celsius', 'kelvin')
+        assert (conversion.scale, conversion.offset) == (1.0, 273.15)
+        assert conversion.convert_many([0, 100]) == [273.15, 373.15]
+
+    def test_table(self):
+        """Tables expose every pair's scale, plus offsets for affine categories."""
+        reg = UnitRegistry()
+        reg.register_linear('length', {'m': 1.0, 'km': 1000.0}, 6)
+        reg.register_affine('temperature', {'celsius': (1.0, 0.0), 'kelvin': (1.0, -273.15)}, 3)
+        assert reg.table('length') == {
+            'units': ['m', 'km'],
+            'ndigits': 6,
+            'scale': {'m': {'m': 1.0, 'km': 0.001}, 'km': {'m': 1000.0, 'km': 1.0}}
+        }
+        table = reg.table('temperature')
+        assert table['ndigits'] == 3
+        assert table['offset']['celsius']['kelvin'] == 273.15
+
+    def test_reregister_replaces_category(self):
+        """Registering a category again replaces its conversions only."""
+        reg = UnitRegistry()
+        reg.register_linear('a', {'x': 1.0, 'y': 2.0}, 6)
+        reg.register_linear('b', {'z': 1.0}, 6)
+        reg.register_linear('a', {'x': 1.0, 'y': 4.0}, 6)
+        assert reg.conversion('a', 'y', 'x').convert(1) == 4.0
+        assert reg.conversion('b', 'z', 'z').convert(1) == 1.0
+
+    def test_invalid_unit_and_category(self):
+        """Unknown units and categories raise ValueError."""
+        with pytest.raises(ValueError, match='Invalid currency'):
+            registry.conversion('currency', 'XXX', 'USD')
+        with pytest.raises(ValueError, match='Invalid category'):
+            registry.conversion('speed', 'a', 'b')
+
+    def test_registry_covers_every_category(self):
+        """The shared registry lists every converter category."""
+        assert registry.categories() == [
+            'length', 'weight', 'temperature', 'volume', 'currency', 'number_base'
+        ]
+        assert registry.units('length') == list(LengthConverter.CONVERSIONS)
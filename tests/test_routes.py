@@ -1,6 +1,13 @@
+import io
+import json
+
 import pytest
+from flask import jsonify, url_for
 from backend.app import create_app
 from backend.config import Config
+from backend.utils import wire
+from backend.utils.converters import rate_cache
+from backend.utils.rates import StaticRateProvider
 
 pytestmark = pytest.mark.integration
 
@@ -22,6 +29,18 @@ def test_index_route(client):
     assert b'Multi-Converter' in response.data
 
 
+def test_index_etag(client):
+    """Test that the pre-rendered home page is revalidated with its ETag"""
+    response = client.get('/')
+    etag = response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert client.get('/').data == response.data
+
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+
 @pytest.mark.smoke
 def test_health_endpoint(client):
     """Test the health check endpoint"""
@@ -138,6 +157,8 @@ def test_convert_currency_success(client):
     assert data['success'] is True
     assert 'result' in data
     assert isinstance(data['result'], float)
+    assert data['rates_version'] >= 1
+    assert data['rates_age'] >= 0
 
 
 def test_convert_number_base_success(client):
@@ -186,3 +207,768 @@ def test_convert_invalid_value(client):
     assert response.status_code == 400
     data = response.get_json()
     assert data['success'] is False
+
+
+def test_convert_batch_mixed_categories(client):
+    """Test batch conversion across categories, preserving order"""
+    response = client.post('/api/convert/batch', json={'conversions': [
+        {'category': 'length', 'value': 100, 'from_unit': 'meter', 'to_unit': 'kilometer'},
+        {'category': 'temperature', 'value': 0, 'from_unit': 'celsius', 'to_unit': 'fahrenheit'},
+        {'category': 'currency', 'value': 100, 'from_currency': 'USD', 'to_currency': 'EUR'},
+        {'category': 'number-base', 'value': '10', 'from_base': 'decimal', 'to_base': 'binary'},
+    ]})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert data['count'] == 4
+    assert [r['result'] for r in data['results']] == [0.1, 32.0, 85.0, '1010']
+
+
+def test_convert_batch_per_item_errors(client):
+    """Test that one bad item does not fail the whole batch"""
+    response = client.post('/api/convert/batch', json={'conversions': [
+        {'category': 'length', 'value': 1, 'from_unit': 'invalid', 'to_unit': 'meter'},
+        {'category': 'weight', 'value': 1000, 'from_unit': 'gram', 'to_unit': 'kilogram'},
+        {'category': 'unknown', 'value': 1},
+        'not-an-object',
+        {'category': 'volume', 'value': 'abc', 'from_unit': 'liter', 'to_unit': 'cup'},
+    ]})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['success'] for r in results] == [False, True, False, False, False]
+    assert results[1]['result'] == 1.0
+    assert all('error' in r for r in results if not r['success'])
+
+
+def test_convert_batch_invalid_body(client):
+    """Test batch conversion without a conversions list"""
+    response = client.post('/api/convert/batch', json={'value': 1})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_convert_batch_too_large(client):
+    """Test batch conversion above the configured size limit"""
+    client.application.config['MAX_BATCH_SIZE'] = 2
+    response = client.post('/api/convert/batch', json={'conversions': [
+        {'category': 'length', 'value': 1, 'from_unit': 'meter', 'to_unit': 'meter'}
+    ] * 3})
+    assert response.status_code == 400
+    assert 'too large' in response.get_json()['error']
+
+
+def test_convert_stream_csv(client):
+    """Test streaming CSV conversion with inline row errors"""
+    client.application.config['STREAM_CHUNK_SIZE'] = 2
+    body = 'value,from_unit,to_unit\n100,meter,kilometer\nabc,meter,foot\n\n1,mile,kilometer\n1,meter\n'
+    response = client.post('/api/convert/stream?category=length',
+                           data=body, content_type='text/csv')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/csv'
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0] == 'line,result,error'
+    assert lines[1] == '2,0.1,'
+    assert lines[2].startswith('3,,could not convert')
+    assert lines[3] == '5,1.60934,'
+    assert lines[4] == '6,,"Expected 3 fields, got 2"'
+
+
+def test_convert_stream_ndjson(client):
+    """Test streaming NDJSON conversion with per-line categories"""
+    body = '\n'.join([
+        '{"value": 0, "from_unit": "celsius", "to_unit": "kelvin"}',
+        '{"category": "currency", "value": 100, "from_currency": "USD", "to_currency": "EUR"}',
+        '{not json',
+    ])
+    response = client.post('/api/convert/stream?category=temperature',
+                           data=body, content_type='application/x-ndjson')
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert records[0] == {'line': 1, 'success': True, 'result': 273.15}
+    assert records[1]['result'] == 85.0
+    assert records[2]['line'] == 3
+    assert records[2]['success'] is False
+
+
+def test_convert_stream_requires_category_for_csv(client):
+    """Test that CSV streams need a valid category"""
+    response = client.post('/api/convert/stream', data='1,meter,foot\n', content_type='text/csv')
+    assert response.status_code == 400
+    response = client.post('/api/convert/stream?category=speed',
+                           data='{}', content_type='application/x-ndjson')
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def history_client(tmp_path):
+    """Create a test client with a historical rate store"""
+    class HistoryConfig(Config):
+        CURRENCY_HISTORY_DIR = str(tmp_path)
+
+    app = create_app(HistoryConfig)
+    app.config['TESTING'] = True
+    app.extensions['rate_history'].append('EUR', 1704067200, 0.5)  # 2024-01-01
+    with app.test_client() as client:
+        yield client
+
+
+def test_convert_currency_as_of(history_client):
+    """Test currency conversion with historical rates"""
+    response = history_client.post('/api/convert/currency', json={
+        'value': 100,
+        'from_currency': 'USD',
+        'to_currency': 'EUR',
+        'as_of': '2024-06-01'
+    })
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['result'] == 50.0
+    assert data['as_of'] == '2024-06-01'
+
+
+def test_convert_currency_as_of_in_batch(history_client):
+    """Test as-of currency conversion through the batch endpoint"""
+    response = history_client.post('/api/convert/batch', json={'conversions': [
+        {'category': 'currency', 'value': 1, 'from_currency': 'EUR',
+         'to_currency': 'USD', 'as_of': '2024-01-01'},
+        {'category': 'currency', 'value': 1, 'from_currency': 'EUR',
+         'to_currency': 'USD', 'as_of': '2023-01-01'},
+    ]})
+    results = response.get_json()['results']
+    assert results[0] == {'success': True, 'result': 2.0}
+    assert results[1]['success'] is False
+
+
+def test_convert_currency_as_of_not_configured(client):
+    """Test as-of conversion without a historical rate store"""
+    response = client.post('/api/convert/currency', json={
+        'value': 1, 'from_currency': 'USD', 'to_currency': 'EUR', 'as_of': '2024-01-01'
+    })
+    assert response.status_code == 400
+
+
+def test_convert_number_base_file_upload(client):
+    """Test streaming conversion of an uploaded binary file"""
+    response = client.post('/api/convert/number-base/file', data={
+        'file': (io.BytesIO(b'\x00\x01\xff'), 'data.bin'),
+        'from_base': 'bytes',
+        'to_base': 'hexadecimal'
+    })
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == '1FF'
+
+
+def test_convert_number_base_file_raw_body(client):
+    """Test streaming conversion of a hex dump sent as the request body"""
+    response = client.post('/api/convert/number-base/file?from_base=hexadecimal&to_base=binary',
+                           data=b'0f\n0f\n', content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == '111100001111'
+
+
+def test_convert_number_base_file_invalid(client):
+    """Test file conversion with invalid digits"""
+    response = client.post('/api/convert/number-base/file?from_base=binary&to_base=decimal',
+                           data=b'102', content_type='application/octet-stream')
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_convert_number_base_file_limit(client):
+    """Test that whole-number conversions over the size limit get 413 before spooling"""
+    client.application.config['NUMBER_BASE_FILE_MAX_BYTES'] = 4
+    response = client.post('/api/convert/number-base/file?from_base=hexadecimal&to_base=decimal',
+                           data=b'ff00ff', content_type='application/octet-stream')
+    assert response.status_code == 413
+    assert response.get_json()['success'] is False
+
+    response = client.post('/api/convert/number-base/file', data={
+        'file': (io.BytesIO(b'\x01' * 5), 'data.bin'),
+        'from_base': 'bytes',
+        'to_base': 'decimal'
+    })
+    assert response.status_code == 413
+
+    # Power-of-two pairs stream, so the limit does not apply
+    response = client.post('/api/convert/number-base/file?from_base=hexadecimal&to_base=binary',
+                           data=b'ff00ff', content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == '111111110000000011111111'
+
+
+def test_convert_number_base_file_removes_spool_on_error(client, tmp_path, monkeypatch):
+    """Test that the spooled upload is removed when copying it fails"""
+    import tempfile
+    from backend.app import routes
+
+    def fail(source, f, limit):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    monkeypatch.setattr(routes, '_spool', fail)
+    with pytest.raises(OSError):
+        client.post('/api/convert/number-base/file?from_base=hexadecimal&to_base=binary',
+                    data=b'ff', content_type='application/octet-stream')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_result_cache_hit(client):
+    """Test that repeated conversions are served from the result cache"""
+    payload = {'value': 3, 'from_unit': 'foot', 'to_unit': 'inch'}
+    first = client.post('/api/convert/length', json=payload)
+    second = client.post('/api/convert/length', json=payload)
+    assert second.status_code == 200
+    assert second.data == first.data
+    assert 'Age' in second.headers
+    stats = client.get('/api/cache').get_json()['stats']
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_result_cache_hit_still_requires_json(client):
+    """Test that a cached body sent as text/plain still gets 415"""
+    body = json.dumps({'value': 3, 'from_unit': 'foot', 'to_unit': 'inch'})
+    assert client.post('/api/convert/length', data=body, content_type='application/json').status_code == 200
+    assert client.post('/api/convert/length', data=body, content_type='application/json').status_code == 200
+    assert client.get('/api/cache').get_json()['stats']['hits'] == 1
+
+    response = client.post('/api/convert/length', data=body, content_type='text/plain')
+    assert response.status_code == 415
+
+
+def test_result_cache_skips_errors(client):
+    """Test that failed conversions are not cached"""
+    payload = {'value': 3, 'from_unit': 'invalid', 'to_unit': 'inch'}
+    client.post('/api/convert/length', json=payload)
+    client.post('/api/convert/length', json=payload)
+    assert client.get('/api/cache').get_json()['stats']['size'] == 0
+
+
+def test_result_cache_currency_follows_rate_version(client):
+    """Test that new currency rates bypass cached currency results"""
+    payload = {'value': 100, 'from_currency': 'USD', 'to_currency': 'EUR'}
+    assert client.post('/api/convert/currency', json=payload).get_json()['result'] == 85.0
+
+    original = rate_cache.provider
+    try:
+        rate_cache.provider = StaticRateProvider(dict(original.rates, EUR=0.5))
+        rate_cache.refresh()
+        assert client.post('/api/convert/currency', json=payload).get_json()['result'] == 50.0
+    finally:
+        rate_cache.provider = original
+        rate_cache.refresh()
+
+
+def test_result_cache_currency_reports_current_rates_age(client, monkeypatch):
+    """Test that a cached currency body carries the age of the rates now, not when cached"""
+    payload = {'value': 100, 'from_currency': 'USD', 'to_currency': 'EUR'}
+    first = client.post('/api/convert/currency', json=payload).get_json()
+    snapshot = rate_cache.snapshot()
+    monkeypatch.setattr(snapshot, 'fetched_at', snapshot.fetched_at - 100)
+
+    second = client.post('/api/convert/currency', json=payload).get_json()
+    assert client.get('/api/cache').get_json()['stats']['hits'] == 1
+    assert second['rates_age'] >= first['rates_age'] + 100
+    assert {**second, 'rates_age': None} == {**first, 'rates_age': None}
+
+
+def test_metrics_endpoint(client):
+    """Test request and conversion counters at /metrics"""
+    payload = {'value': 1, 'from_unit': 'meter', 'to_unit': 'foot'}
+    client.post('/api/convert/length', json=payload)
+    client.post('/api/convert/length', json=payload)
+    client.post('/api/convert/length', json={'value': 1, 'from_unit': 'bad', 'to_unit': 'foot'})
+    client.post('/api/convert/batch', json={'conversions': [
+        {'category': 'weight', 'value': 1, 'from_unit': 'gram', 'to_unit': 'kilogram'},
+        {'category': 'weight', 'value': 1, 'from_unit': 'bad', 'to_unit': 'kilogram'}
+    ]})
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    text = response.get_data(as_text=True)
+    assert ('converter_http_requests_total{endpoint="/api/convert/length",'
+            'method="POST",status="200"} 2') in text
+    assert 'converter_http_request_errors_total{endpoint="/api/convert/length",status="400"} 1' in text
+    assert 'converter_conversions_total{category="length"} 2' in text
+    assert 'converter_conversions_total{category="weight"} 1' in text
+    assert 'converter_result_cache_hits_total 1' in text
+
+
+def test_metrics_disabled():
+    """Test /metrics when metrics are turned off"""
+    class NoMetricsConfig(Config):
+        METRICS_ENABLED = False
+
+    app = create_app(NoMetricsConfig)
+    assert app.test_client().get('/metrics').status_code == 404
+
+
+@pytest.fixture
+def profiled_client(tmp_path):
+    """Create a test client with profiling and admin endpoints configured"""
+    class ProfiledConfig(Config):
+        PROFILE_DIR = str(tmp_path)
+        ADMIN_TOKEN = 'secret'
+
+    app = create_app(ProfiledConfig)
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_profiler_admin(profiled_client):
+    """Test enabling the profiler at runtime and dumping per-route profiles"""
+    headers = {'X-Admin-Token': 'secret'}
+    response = profiled_client.post('/admin/profiler', json={'sample_rate': 1.0}, headers=headers)
+    assert response.get_json()['sample_rate'] == 1.0
+
+    profiled_client.post('/api/convert/length', json={'value': 1, 'from_unit': 'meter', 'to_unit': 'foot'})
+    status = profiled_client.get('/admin/profiler', headers=headers).get_json()
+    assert '/api/convert/length' in status['routes']
+
+    response = profiled_client.post('/admin/profiler/dump?reset=true', headers=headers)
+    files = response.get_json()['files']
+    assert any(path.endswith('api_convert_length.pstats') for path in files)
+
+
+def test_profiler_admin_requires_token(profiled_client, client):
+    """Test that admin endpoints reject missing tokens and are off without one"""
+    assert profiled_client.get('/admin/profiler').status_code == 403
+    assert profiled_client.post('/admin/profiler', json={'sample_rate': 5},
+                                headers={'X-Admin-Token': 'secret'}).status_code == 400
+    assert client.get('/admin/profiler').status_code == 403
+
+
+@pytest.mark.parametrize('category, payload', [
+    ('length', {'value': 1.5, 'from_unit': 'meter', 'to_unit': 'foot'}),
+    ('temperature', {'value': -40, 'from_unit': 'celsius', 'to_unit': 'fahrenheit'}),
+    ('number-base', {'value': ' ff ', 'from_base': 'hexadecimal', 'to_base': 'binary'}),
+    ('length', {'value': 1, 'from_unit': 'meter', 'to_unit': 'parsec'}),
+])
+def test_convert_dispatcher_matches_jsonify(client, category, payload):
+    """Test that the direct serializer writes exactly what jsonify would"""
+    response = client.post(f'/api/convert/{category}', json=payload)
+    with client.application.app_context():
+        expected = jsonify(response.get_json()).get_data()
+    assert response.get_data() == expected
+    assert response.mimetype == 'application/json'
+
+
+def test_convert_dispatcher_endpoints(client):
+    """Test the original endpoint names and the generic dispatcher errors"""
+    with client.application.test_request_context():
+        assert url_for('main.convert_number_base') == '/api/convert/number-base'
+        assert url_for('main.convert', category='volume') == '/api/convert/volume'
+
+    response = client.post('/api/convert/speed', json={'value': 1})
+    assert response.status_code == 404
+    assert response.get_json()['error'] == 'Invalid category: speed'
+
+    response = client.post('/api/convert/length', json=[1, 2])
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+    response = client.post('/api/convert/number-base', json={'value': 5, 'from_base': 'decimal',
+                                                             'to_base': 'binary'})
+    assert response.status_code == 400
+
+
+def test_index_uses_fingerprinted_assets(client):
+    """Test that the page links hashed asset URLs served with long-lived caching"""
+    page = client.get('/').get_data(as_text=True)
+    assets = client.application.extensions['assets']
+    css_url = f"/assets/{assets.url_name('css/style.css')}"
+    assert css_url in page
+    assert f"/assets/{assets.url_name('js/main.js')}" in page
+
+    response = client.get(css_url, headers={'Accept-Encoding': 'gzip, deflate'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert response.headers['Vary'] == 'Accept-Encoding'
+
+    etag = response.headers['ETag']
+    response = client.get(css_url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert response.status_code == 304
+
+    assert client.get('/assets/css/style.0000.css').status_code == 404
+
+
+def test_assets_disabled_falls_back_to_static():
+    """Test plain static URLs when the asset bundle is turned off"""
+    class NoAssetsConfig(Config):
+        ASSETS_PRECOMPRESS = False
+
+    page = create_app(NoAssetsConfig).test_client().get('/').get_data(as_text=True)
+    assert '/static/css/style.css' in page
+
+
+def test_conversion_tables(client):
+    """Test the client-side factor tables and their ETag revalidation"""
+    response = client.get('/api/conversion-tables')
+    assert response.status_code == 200
+    tables = response.get_json()
+    categories = tables['categories']
+    assert set(categories) == {'length', 'weight', 'temperature', 'volume', 'currency'}
+    assert categories['length']['scale']['kilometer']['meter'] == 1000.0
+    assert categories['temperature']['offset']['celsius']['kelvin'] == 273.15
+    assert categories['currency']['ttl'] > 0
+    assert tables['server_only'] == ['number-base', 'compound']
+    assert response.headers['ETag'] == f'"{tables["version"]}"'
+
+    etag = response.headers['ETag']
+    assert client.get('/api/conversion-tables', headers={'If-None-Match': etag}).status_code == 304
+
+    original = rate_cache.provider
+    try:
+        rate_cache.provider = StaticRateProvider(dict(original.rates, EUR=0.5))
+        rate_cache.refresh()
+        response = client.get('/api/conversion-tables', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['categories']['currency']['scale']['USD']['EUR'] == 0.5
+    finally:
+        rate_cache.provider = original
+        rate_cache.refresh()
+
+
+def test_service_worker(client):
+    """Test that the service worker is served from the site root"""
+    response = client.get('/sw.js')
+    assert response.status_code == 200
+    assert 'javascript' in response.mimetype
+    assert response.headers['Cache-Control'] == 'no-cache'
+    response.close()
+
+
+def test_convert_binary(client):
+    """Test packed float64 conversion"""
+    values = [0.0, 1.0, 2.5, -40.0]
+    response = client.post('/api/convert/binary',
+                           data=wire.encode_header('temperature', 'celsius', 'fahrenheit') + wire.pack(values),
+                           content_type=wire.MIMETYPE)
+    assert response.status_code == 200
+    assert response.mimetype == wire.MIMETYPE
+    assert list(wire.unpack(response.data)) == [32.0, 33.8, 36.5, -40.0]
+
+
+def test_convert_binary_streamed():
+    """Test that large and chunked bodies are converted in pieces"""
+    class SmallBufferConfig(Config):
+        TESTING = True
+        BINARY_INLINE_BYTES = 64
+        BINARY_CHUNK_VALUES = 3
+
+    client = create_app(SmallBufferConfig).test_client()
+    values = [float(i) for i in range(20)]
+    body = wire.encode_header('length', 'kilometer', 'meter') + wire.pack(values)
+    expected = [value * 1000 for value in values]
+
+    response = client.post('/api/convert/binary', data=body, content_type=wire.MIMETYPE)
+    assert response.status_code == 200
+    assert list(wire.unpack(response.data)) == expected
+
+    response = client.post('/api/convert/binary', input_stream=io.BytesIO(body),
+                           content_type=wire.MIMETYPE,
+                           headers={'Transfer-Encoding': 'chunked'},
+                           environ_overrides={'wsgi.input_terminated': True})
+    assert response.status_code == 200
+    assert list(wire.unpack(response.data)) == expected
+
+
+@pytest.mark.parametrize('header', [
+    b'length kilometer meter\r\n',
+    b'length  kilometer\tmeter \n',
+])
+def test_convert_binary_header_spacing(client, header):
+    """Test that the length check uses the header line as sent"""
+    response = client.post('/api/convert/binary', data=header + wire.pack([1.0, 2.0]),
+                           content_type=wire.MIMETYPE)
+    assert response.status_code == 200
+    assert list(wire.unpack(response.data)) == [1000.0, 2000.0]
+
+
+def test_convert_binary_partial_value_is_counted():
+    """Test that a chunked body ending mid-value drops the partial value and counts it"""
+    class SmallBufferConfig(Config):
+        TESTING = True
+        BINARY_INLINE_BYTES = 64
+        BINARY_CHUNK_VALUES = 3
+
+    client = create_app(SmallBufferConfig).test_client()
+    body = wire.encode_header('length', 'kilometer', 'meter') + wire.pack([1.0, 2.0]) + b'\x00' * 5
+    response = client.post('/api/convert/binary', input_stream=io.BytesIO(body),
+                           content_type=wire.MIMETYPE,
+                           headers={'Transfer-Encoding': 'chunked'},
+                           environ_overrides={'wsgi.input_terminated': True})
+    assert response.status_code == 200
+    assert list(wire.unpack(response.data)) == [1000.0, 2000.0]
+    assert 'converter_binary_truncated_bytes_total 5' in client.get('/metrics').get_data(as_text=True)
+
+
+def test_convert_binary_currency(client):
+    """Test packed currency conversion"""
+    response = client.post('/api/convert/binary',
+                           data=wire.encode_header('currency', 'USD', 'USD') + wire.pack([10.0]))
+    assert response.status_code == 200
+    assert list(wire.unpack(response.data)) == [10.0]
+
+
+@pytest.mark.parametrize('body', [
+    wire.encode_header('length', 'meter', 'parsec') + wire.pack([1.0]),
+    wire.encode_header('number-base', 'decimal', 'binary') + wire.pack([1.0]),
+    b'length meter\n' + wire.pack([1.0]),
+    b'length meter foot',
+    wire.encode_header('length', 'meter', 'foot') + b'\x00' * 12,
+])
+def test_convert_binary_invalid(client, body):
+    """Test that bad headers, units and lengths are rejected up front"""
+    response = client.post('/api/convert/binary', data=body, content_type=wire.MIMETYPE)
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_convert_compound(client):
+    """Test compound unit expressions and dimension errors"""
+    response = client.post('/api/convert/compound',
+                           json={'value': 90, 'from_unit': 'km/h', 'to_unit': 'm/s'})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['result'] == 25.0
+    assert data['from'] == '90.0 km/h'
+
+    response = client.post('/api/convert/compound',
+                           json={'value': 1, 'from_unit': 'ft^2', 'to_unit': 'kg'})
+    assert response.status_code == 400
+    assert 'Cannot convert' in response.get_json()['error']
+
+
+@pytest.mark.parametrize('from_unit, to_unit', [
+    ('km^1000', 'm^1000'),
+    ('mm^200/mm^200', '1'),
+])
+def test_convert_compound_out_of_range(client, from_unit, to_unit):
+    """Test that expressions whose scale overflows or underflows are a 400, not a 500"""
+    response = client.post('/api/convert/compound',
+                           json={'value': 1, 'from_unit': from_unit, 'to_unit': to_unit})
+    assert response.status_code == 400
+    assert 'out of range' in response.get_json()['error']
+
+
+def test_convert_compound_nested_too_deeply(client):
+    """Test that deeply nested parentheses are a 400, not a RecursionError"""
+    response = client.post('/api/convert/compound',
+                           json={'value': 1, 'from_unit': '(' * 400 + 'km' + ')' * 400, 'to_unit': 'm'})
+    assert response.status_code == 400
+    assert 'nested too deeply' in response.get_json()['error']
+
+
+def test_convert_batch_compound_out_of_range(client):
+    """Test that an out-of-range compound item fails alone inside a batch"""
+    response = client.post('/api/convert/batch', json={'conversions': [
+        {'category': 'compound', 'value': 1, 'from_unit': 'km^1000', 'to_unit': 'm^1000'},
+        {'category': 'compound', 'value': 1, 'from_unit': 'mm^200/mm^200', 'to_unit': '1'},
+        {'category': 'compound', 'value': 90, 'from_unit': 'km/h', 'to_unit': 'm/s'},
+    ]})
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['success'] for r in results] == [False, False, True]
+    assert 'out of range' in results[0]['error']
+    assert results[2]['result'] == 25.0
+
+
+def test_convert_all_single_value(client):
+    """Test converting one value into every unit of a category"""
+    response = client.post('/api/convert/length/all', json={'value': 1, 'from_unit': 'kilometer'})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['units'] == ['meter', 'kilometer', 'centimeter', 'millimeter', 'mile', 'yard', 'foot', 'inch']
+    assert data['results'][0] == 1000.0
+    assert data['results'][4] == 0.621373
+
+
+def test_convert_all_matrix(client):
+    """Test that many values give one row per value, matching single conversions"""
+    response = client.post('/api/convert/temperature/all',
+                           json={'values': [0, 100, -40.5], 'from_unit': 'celsius'})
+    assert response.status_code == 200
+    data = response.get_json()
+    for value, row in zip([0, 100, -40.5], data['results']):
+        for unit, result in zip(data['units'], row):
+            single = client.post('/api/convert/temperature',
+                                 json={'value': value, 'from_unit': 'celsius', 'to_unit': unit})
+            assert single.get_json()['result'] == result
+
+    response = client.post('/api/convert/currency/all', json={'values': [1, 2], 'from_currency': 'USD'})
+    data = response.get_json()
+    assert data['results'][1][data['units'].index('EUR')] == 1.7
+    assert 'rates_version' in data
+
+
+@pytest.mark.parametrize('category,body,status', [
+    ('length', {'value': 1, 'from_unit': 'parsec'}, 400),
+    ('length', {'values': ['a'], 'from_unit': 'meter'}, 400),
+    ('length', {'values': 3, 'from_unit': 'meter'}, 400),
+    ('number-base', {'value': 1, 'from_base': 'decimal'}, 404),
+    ('speed', {'value': 1, 'from_unit': 'meter'}, 404),
+])
+def test_convert_all_invalid(client, category, body, status):
+    """Test fan-out errors"""
+    response = client.post(f'/api/convert/{category}/all', json=body)
+    assert response.status_code == status
+    assert response.get_json()['success'] is False
+
+
+def test_admission_rate_limit():
+    """Test 429 with Retry-After once a client's bucket is empty, and exempt paths"""
+    class RateLimitedConfig(Config):
+        TESTING = True
+        RATE_LIMIT = 0.5
+        RATE_LIMIT_BURST = 2
+
+    client = create_app(RateLimitedConfig).test_client()
+    assert client.get('/api/units').status_code == 200
+    assert client.get('/api/units').status_code == 200
+    response = client.get('/api/units')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '2'
+    assert response.get_json()['success'] is False
+    assert client.get('/health').status_code == 200
+
+    metrics = client.get('/metrics').get_data(as_text=True)
+    assert 'converter_admission_decisions_total{outcome="rate_limited"}' in metrics
+
+
+def test_admission_sheds_when_queue_is_full():
+    """Test 503 with Retry-After when every concurrency slot is taken"""
+    class OverloadedConfig(Config):
+        TESTING = True
+        MAX_CONCURRENT_REQUESTS = 1
+        ADMISSION_QUEUE_SIZE = 0
+
+    app = create_app(OverloadedConfig)
+    client = app.test_client()
+    admission = app.extensions['admission']
+    assert client.get('/api/units').status_code == 200
+    assert admission.stats()['active'] == 0
+
+    admission.concurrency.acquire()
+    try:
+        response = client.get('/api/units')
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        assert client.get('/health').status_code == 200
+        assert client.get('/metrics').status_code == 200
+    finally:
+        admission.release()
+
+    stats = client.get('/api/admission').get_json()['stats']
+    assert stats['queue_full'] == 1
+    assert stats['admitted'] == 2
+
+
+def test_ready_endpoint():
+    """Test that /ready reports saturation gauges and is ready when idle"""
+    class LimitedConfig(Config):
+        TESTING = True
+        MAX_CONCURRENT_REQUESTS = 4
+
+    response = create_app(LimitedConfig).test_client().get('/ready')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'ready'
+    assert data['reasons'] == []
+    assert data['in_flight'] == 0
+    assert data['queue_depth'] == 0
+    assert data['utilization'] == 0
+    assert data['skipped'] == {}
+    assert set(data['thresholds']) == {'queue_depth', 'utilization', 'p99_seconds'}
+    assert response.headers['Cache-Control'] == 'no-store'
+
+
+def test_ready_utilization_is_per_worker_thread():
+    """Test that utilization counts requests in progress against the server's threads"""
+    class ReadyConfig(Config):
+        TESTING = True
+        SERVER_MODE = 'waitress'
+        WAITRESS_THREADS = 4
+
+    app = create_app(ReadyConfig)
+    client = app.test_client()
+    gauge = app.extensions['in_flight']
+    assert gauge.threads == 4
+
+    gauge.enter()
+    gauge.enter()
+    try:
+        data = client.get('/ready').get_json()
+        assert data['in_flight'] == 2
+        assert data['worker_threads'] == 4
+        assert data['utilization'] == 0.5
+        assert data['status'] == 'ready'
+
+        gauge.enter()
+        gauge.enter()
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert response.get_json()['reasons'] == [
+            f"utilization 1.0 > {ReadyConfig.READY_MAX_UTILIZATION}"
+        ]
+    finally:
+        gauge.value = 0
+
+    # Requests count while they run and stop counting once they finish
+    assert client.get('/api/info').status_code == 200
+    assert gauge.value == 0
+
+
+def test_ready_reports_skipped_checks():
+    """Test that /ready names each check it could not run instead of passing it silently"""
+    class UnlimitedConfig(Config):
+        TESTING = True
+        MAX_CONCURRENT_REQUESTS = 0
+        METRICS_ENABLED = False
+        READY_MAX_UTILIZATION = 0
+
+    data = create_app(UnlimitedConfig).test_client().get('/ready').get_json()
+    assert data['status'] == 'ready'
+    assert data['queue_depth'] is None
+    assert data['p99_seconds'] is None
+    assert set(data['skipped']) == {'queue_depth', 'utilization', 'p99_seconds'}
+    assert 'MAX_CONCURRENT_REQUESTS' in data['skipped']['queue_depth']
+    assert 'METRICS_ENABLED' in data['skipped']['p99_seconds']
+    assert data['skipped']['utilization'] == 'threshold is 0'
+
+
+def test_ready_flips_when_saturated():
+    """Test that queue depth and latency thresholds make /ready return 503"""
+    class SaturatedConfig(Config):
+        TESTING = True
+        MAX_CONCURRENT_REQUESTS = 1
+        ADMISSION_QUEUE_SIZE = 0
+        READY_MAX_QUEUE_DEPTH = 2
+        READY_MAX_P99_SECONDS = 0.1
+
+    app = create_app(SaturatedConfig)
+    client = app.test_client()
+    admission = app.extensions['admission']
+
+    admission.concurrency.acquire()
+    admission.concurrency.backlog = lambda: 3
+    try:
+        # Exempt from shedding even with every slot taken
+        response = client.get('/ready')
+        assert response.status_code == 503
+        data = response.get_json()
+        assert data['status'] == 'not ready'
+        assert data['queue_depth'] == 3
+        assert data['reasons'] == ['queue_depth 3 > 2']
+    finally:
+        admission.concurrency.backlog = None
+        admission.release()
+    assert client.get('/ready').status_code == 200
+
+    for _ in range(10):
+        app.extensions['metrics'].observe_request('/api/convert/length', 'POST', 200, 2.0)
+    data = client.get('/ready').get_json()
+    assert data['reasons'] == ['p99_seconds 2.5 > 0.1']
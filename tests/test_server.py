@@ -0,0 +1,140 @@
+"""Unit tests for server mode selection."""
+
+import pytest
+from backend import server
+from backend.config import Config
+
+
+@pytest.mark.unit
+class TestServe:
+    """Test serve()."""
+
+    def test_dispatches_on_server_mode(self, monkeypatch):
+        calls = []
+        monkeypatch.setitem(server.SERVERS, 'waitress', lambda app, config: calls.append(app))
+
+        class WaitressConfig(Config):
+            SERVER_MODE = 'waitress'
+
+        server.serve('app', WaitressConfig)
+        assert calls == ['app']
+
+    def test_invalid_server_mode(self):
+        class BadConfig(Config):
+            SERVER_MODE = 'invalid'
+
+        with pytest.raises(ValueError):
+            server.serve('app', BadConfig)
+
+
+@pytest.mark.unit
+class TestGunicornOptions:
+    """Test gunicorn_options()."""
+
+    def test_options_come_from_config(self):
+        class WorkerConfig(Config):
+            HOST = '127.0.0.1'
+            PORT = 8000
+            WORKERS = 3
+            WORKER_THREADS = 4
+            REUSE_PORT = True
+
+        options = server.gunicorn_options(WorkerConfig)
+        assert options['bind'] == '127.0.0.1:8000'
+        assert options['workers'] == 3
+        assert options['threads'] == 4
+        assert options['worker_class'] == 'gthread'
+        assert options['reuse_port'] is True
+
+    def test_single_thread_uses_sync_workers(self):
+        class SyncConfig(Config):
+            WORKER_THREADS = 1
+
+        assert server.gunicorn_options(SyncConfig)['worker_class'] == 'sync'
+
+    def test_options_are_valid_gunicorn_settings(self):
+        config = pytest.importorskip('gunicorn.config')
+        cfg = config.Config()
+        for key, value in server.gunicorn_options(Config).items():
+            cfg.set(key, value)
+        assert cfg.workers == Config.WORKERS
+        assert cfg.keepalive == Config.GUNICORN_KEEP_ALIVE
+
+
+@pytest.mark.unit
+class TestWaitressThreads:
+    """Test waitress_threads()."""
+
+    def test_threads_cover_admission_queue(self):
+        class LimitedConfig(Config):
+            WAITRESS_THREADS = 4
+            MAX_CONCURRENT_REQUESTS = 8
+            ADMISSION_QUEUE_SIZE = 16
+
+        assert server.waitress_threads(LimitedConfig) == 8 + 16 + server.WAITRESS_SPARE_THREADS
+
+    def test_no_limit_keeps_configured_threads(self):
+        class UnlimitedConfig(Config):
+            WAITRESS_THREADS = 6
+            MAX_CONCURRENT_REQUESTS = 0
+
+        assert server.waitress_threads(UnlimitedConfig) == 6
+
+    def test_waitress_queue_feeds_admission(self, monkeypatch):
+        waitress = pytest.importorskip('waitress')
+        from collections import deque
+        from types import SimpleNamespace
+        from backend.app import create_app
+
+        queue = deque([1, 2])
+        fake = SimpleNamespace(task_dispatcher=SimpleNamespace(queue=queue),
+                               print_listen=lambda message: None, run=lambda: None)
+        monkeypatch.setattr(waitress, 'create_server', lambda app, **kw: fake)
+
+        class LimitedConfig(Config):
+            MAX_CONCURRENT_REQUESTS = 4
+
+        app = create_app(LimitedConfig)
+        server.serve_waitress(app, LimitedConfig)
+        assert app.extensions['admission'].concurrency.backlog() == 2
+
+    def test_raising_threads_is_logged(self, monkeypatch, caplog):
+        waitress = pytest.importorskip('waitress')
+        from types import SimpleNamespace
+        from backend.app import create_app
+
+        class LimitedConfig(Config):
+            WAITRESS_THREADS = 4
+            MAX_CONCURRENT_REQUESTS = 4
+            ADMISSION_QUEUE_SIZE = 16
+
+        created = {}
+        fake = SimpleNamespace(print_listen=lambda message: None, run=lambda: None)
+        monkeypatch.setattr(waitress, 'create_server', lambda app, **kw: created.update(kw) or fake)
+
+        server.serve_waitress(create_app(LimitedConfig), LimitedConfig)
+        assert created['threads'] == 24
+        assert 'Raising WAITRESS_THREADS from 4 to 24' in caplog.text
+
+    def test_admission_is_off_by_default(self):
+        assert Config.MAX_CONCURRENT_REQUESTS == 0
+        assert server.waitress_threads(Config) == Config.WAITRESS_THREADS
+
+
+@pytest.mark.unit
+class TestWorkerThreads:
+    """Test worker_threads()."""
+
+    def test_follows_server_mode(self):
+        class LimitedConfig(Config):
+            WAITRESS_THREADS = 4
+            WORKER_THREADS = 3
+            MAX_CONCURRENT_REQUESTS = 8
+            ADMISSION_QUEUE_SIZE = 16
+
+        for mode, expected in (('waitress', server.waitress_threads(LimitedConfig)), ('gunicorn', 3)):
+            LimitedConfig.SERVER_MODE = mode
+            assert server.worker_threads(LimitedConfig) == expected
+
+        LimitedConfig.SERVER_MODE = 'asgi'
+        assert server.worker_threads(LimitedConfig) > 1
@@ -0,0 +1,148 @@
+"""Unit tests for the shared-memory rate table."""
+
+import os
+
+import pytest
+from backend.utils import shared_rates
+from backend.utils.rates import RateCache, StaticRateProvider
+from backend.utils.shared_rates import SharedRateTable
+
+RATES = {'USD': 1.0, 'EUR': 0.85, 'JPY': 110.0}
+
+
+@pytest.fixture
+def table():
+    table = SharedRateTable.create(capacity=4)
+    if table is None:
+        pytest.skip('shared memory is unavailable')
+    yield table
+    table.close()
+
+
+@pytest.mark.unit
+class TestSharedRateTable:
+    """Test the table layout and seqlock."""
+
+    def test_roundtrip(self, table):
+        table.write(RATES, 3, 1234.5)
+        sequence, rates, version, fetched_at = table.read()
+        assert rates == RATES
+        assert list(rates) == list(RATES)
+        assert (version, fetched_at) == (3, 1234.5)
+        assert sequence == table.sequence() and sequence % 2 == 0
+
+    def test_each_write_moves_the_sequence(self, table):
+        table.write(RATES, 1, 0.0)
+        before = table.sequence()
+        table.write({'USD': 1.0}, 2, 0.0)
+        assert table.sequence() == before + 2
+        assert table.read()[1] == {'USD': 1.0}
+
+    def test_rejects_what_does_not_fit(self, table):
+        with pytest.raises(ValueError, match='capacity'):
+            table.write({f"C{i}": 1.0 for i in range(5)}, 1, 0.0)
+        with pytest.raises(ValueError, match='too long'):
+            table.write({'LONGCODE1': 1.0}, 1, 0.0)
+
+    def test_read_waits_for_write_in_progress(self, table, monkeypatch):
+        table.write(RATES, 1, 0.0)
+        sequence = table.sequence()
+        shared_rates.SEQUENCE.pack_into(table._buf, 0, sequence + 1)
+        calls = []
+
+        def finish_write(seconds):
+            calls.append(seconds)
+            shared_rates.SEQUENCE.pack_into(table._buf, 0, sequence + 2)
+
+        monkeypatch.setattr(shared_rates.time, 'sleep', finish_write)
+        assert table.read()[0] == sequence + 2
+        assert calls == [0]
+
+    def test_unavailable_shared_memory(self, monkeypatch):
+        monkeypatch.setattr(shared_rates, 'shared_memory', None)
+        assert SharedRateTable.create() is None
+
+    def test_close_removes_the_block(self):
+        table = SharedRateTable.create()
+        if table is None:
+            pytest.skip('shared memory is unavailable')
+        name = table.name
+        table.close()
+        table.close()
+        with pytest.raises(FileNotFoundError):
+            shared_rates.shared_memory.SharedMemory(name=name)
+
+
+@pytest.mark.unit
+class TestSharedRateCache:
+    """Test RateCache publishing through the shared table."""
+
+    def test_refresh_writes_the_table(self, table):
+        cache = RateCache(StaticRateProvider(RATES))
+        cache.share(table)
+        assert cache.shared
+        cache.provider = StaticRateProvider(dict(RATES, EUR=0.5))
+        cache.refresh()
+        assert table.read()[1]['EUR'] == 0.5
+        assert table.read()[2] == cache.snapshot().version == 2
+
+    def test_readers_follow_the_writer(self, table):
+        writer = RateCache(StaticRateProvider(RATES))
+        writer.share(table)
+        reader = RateCache(StaticRateProvider({'USD': 1.0}))
+        reader._table = table
+        published = []
+        reader.subscribe(published.append)
+
+        assert reader.snapshot().rates == RATES
+        writer.provider = StaticRateProvider(dict(RATES, EUR=0.5))
+        writer.refresh()
+        snapshot = reader.snapshot()
+        assert snapshot.rates['EUR'] == 0.5
+        assert snapshot.version == 2
+        assert [s.version for s in published] == [1, 2]
+
+    def test_only_the_owner_fetches(self, table):
+        cache = RateCache(StaticRateProvider(RATES))
+        cache.share(table)
+        table._owner_pid = -1
+        cache.provider = StaticRateProvider({'USD': 1.0})
+        assert cache.refresh().rates == RATES
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork()')
+    def test_forked_worker_sees_new_rates(self, table):
+        cache = RateCache(StaticRateProvider(RATES))
+        cache.share(table)
+        ready_read, ready_write = os.pipe()
+        result_read, result_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.read(ready_read, 1)
+            os.write(result_write, repr(cache.snapshot().rates['EUR']).encode())
+            os._exit(0)
+
+        cache.provider = StaticRateProvider(dict(RATES, EUR=0.25))
+        cache.refresh()
+        os.write(ready_write, b'x')
+        assert os.read(result_read, 64) == b'0.25'
+        os.waitpid(pid, 0)
+        for fd in (ready_read, ready_write, result_read, result_write):
+            os.close(fd)
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs fork()')
+    def test_forked_worker_does_not_refresh(self, table):
+        cache = RateCache(StaticRateProvider(RATES), ttl=60)
+        cache.share(table)
+        cache.start()
+        result_read, result_write = os.pipe()
+        try:
+            pid = os.fork()
+            if pid == 0:
+                os.write(result_write, repr(cache._thread).encode())
+                os._exit(0)
+            assert os.read(result_read, 64) == b'None'
+            os.waitpid(pid, 0)
+        finally:
+            cache.stop()
+            os.close(result_read)
+            os.close(result_write)
@@ -0,0 +1,54 @@
+"""Unit tests for the binary wire format."""
+
+import array
+
+import pytest
+from backend.utils import registry, wire
+from backend.utils.converters import LengthConverter, TemperatureConverter
+
+
+@pytest.mark.unit
+class TestWire:
+    """Test header parsing and value packing."""
+
+    def test_header_roundtrip(self):
+        header = wire.encode_header('length', 'meter', 'foot')
+        assert header == b'length meter foot\n'
+        assert wire.decode_header(header) == ('length', 'meter', 'foot')
+
+    @pytest.mark.parametrize('line', [
+        b'length meter foot',
+        b'length meter\n',
+        b'length meter foot yard\n',
+        'length m\xe8tre foot\n'.encode('latin-1'),
+    ])
+    def test_invalid_header(self, line):
+        with pytest.raises(ValueError):
+            wire.decode_header(line)
+
+    def test_pack_is_little_endian_float64(self):
+        data = wire.pack([1.0, -2.5])
+        assert data == b'\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\x04\xc0'
+        assert list(wire.unpack(data)) == [1.0, -2.5]
+
+    def test_convert_packed_matches_convert_many(self):
+        values = [0.0, 1.0, 12.345, -7.5, 1e9]
+        data = wire.pack(values)
+
+        converted = wire.convert_packed(
+            lambda v: LengthConverter.convert_many(v, 'kilometer', 'mile'), data)
+        assert list(wire.unpack(converted)) == list(LengthConverter.convert_many(values, 'kilometer', 'mile'))
+
+        converted = wire.convert_packed(
+            lambda v: TemperatureConverter.convert_many(v, 'celsius', 'kelvin'), memoryview(data))
+        assert list(wire.unpack(converted)) == list(TemperatureConverter.convert_many(values, 'celsius', 'kelvin'))
+
+    def test_convert_packed_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(registry, 'np', None)
+        data = wire.pack([1.0, 2.0])
+        converted = wire.convert_packed(
+            lambda v: LengthConverter.convert_many(array.array('d', v), 'meter', 'centimeter'), data)
+        assert list(wire.unpack(converted)) == [100.0, 200.0]
+
+    def test_empty_body(self):
+        assert wire.convert_packed(lambda v: LengthConverter.convert_many(v, 'meter', 'foot'), b'') == b''
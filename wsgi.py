@@ -0,0 +1,4 @@
+from backend.app import create_app
+from backend.config import Config
+
+app = create_app(Config)